@@ -2,9 +2,10 @@
 # LIBRAIRIES
 # =========================
 import streamlit as st         # Framework pour créer l'application web interactive
-import pandas as pd            # Pour manipuler les données tabulaires (CSV, DataFrame…)
 import os                      # Pour gérer les chemins des fichiers (logo, images…)
-import base64                  # Pour convertir une image en texte encodé (Base64), utile pour l'intégrer directement dans le HTML
+from eduvision.summary import load_summary   # Agrégats précalculés par la construction des données
+from eduvision import profiling   # Spans de profilage (panneau ?debug=1)
+from eduvision.layout import page_header   # En-tête, logo et menu communs
 
 # =========================
 # CONFIGURATION DE LA PAGE
@@ -15,141 +16,12 @@ st.set_page_config(
     layout="wide",                  # Mise en page large (plein écran)
     initial_sidebar_state="collapsed" # Masquer la barre latérale par défaut
 )
-
-# Masquer le menu natif et le footer de Streamlit pour avoir une interface plus propre
-st.markdown("""
-    <style>
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    </style>
-""", unsafe_allow_html=True)
-
-
-# =========================
-# CSS GLOBAL
-# =========================
-st.markdown("""
-    <style>
-    /* HEADER (barre du haut contenant le logo et le titre) */
-    .header {
-        display: flex;                /* Alignement horizontal */
-        align-items: center;          /* Centrer verticalement */
-        background-color: #ECF0F1;    /* Couleur de fond gris clair */
-        padding: 15px 25px;           /* Espacement interne */
-        border-radius: 8px;           /* Coins arrondis */
-        margin-bottom: 10px;          /* Espacement bas */
-    }
-    .logo {
-        width: 65px; height: 65px;    /* Taille fixe du logo */
-        border-radius: 50%;           /* Cercle */
-        margin-right: 15px;           /* Espace entre logo et titre */
-        object-fit: cover;            /* Bien centrer l'image */
-    }
-    .title-block {
-        display: flex;
-        flex-direction: column;       /* Titre et sous-titre l'un au-dessus de l'autre */
-        justify-content: center;
-    }
-    .main-title {
-        font-size: 28px;
-        font-weight: bold;
-        color: #1ABC9C;               /* Vert clair */
-        margin: 0;
-    }
-    .subtitle {
-        font-size: 14px;
-        color: #2C3E50;               /* Gris foncé */
-        margin: 0;
-    }
-
-    /* MENU (barre de navigation) */
-    .menu {
-        display: flex;
-        justify-content: center;      /* Centrer les liens au milieu */
-        gap: 15px;                    /* Espacement entre les boutons */
-        margin-top: 10px;
-    }
-    .menu a {
-        background-color: white;
-        color: #1ABC9C !important;
-        padding: 6px 14px;
-        border-radius: 6px;
-        font-weight: bold;
-        text-decoration: none;        /* Pas de soulignement */
-        transition: 0.3s;             /* Animation douce */
-        border: 1px solid #1ABC9C;
-    }
-    .menu a:hover {
-        background-color: #16A085;    /* Change de couleur au survol */
-        color: white !important;
-        transform: scale(1.05);       /* Zoom léger */
-    }
-
-    /* CHIFFRES CLÉS (section statistiques en bas de page) */
-    .metrics {
-        display: flex;
-        justify-content: space-around; /* Espacement égal entre chaque bloc */
-        margin-top: 40px;
-        padding: 20px;
-        background-color: #ECF0F1;     /* Même couleur que le header */
-        border-radius: 10px;
-    }
-    .metric {
-        text-align: center;
-        font-size: 18px;
-        font-weight: bold;
-    }
-    .metric-value {
-        font-size: 26px;
-        color: #1F618D;                /* Bleu pour attirer l'œil */
-        margin-top: 5px;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
+profiling.start_page("Accueil")   # Trace du rerun : chaque étape coûteuse est un span
 
 # =========================
-# LOGO (conversion en base64 pour être intégré en HTML)
+# EN-TÊTE + MENU
 # =========================
-logo_path = os.path.join(os.path.dirname(__file__), "Images", "AfricaEduVision.png")
-
-def img_to_base64(path):
-    """Convertit une image en base64 pour l'afficher dans le HTML."""
-    with open(path, "rb") as f:
-        data = f.read()
-    return base64.b64encode(data).decode()
-
-logo_base64 = img_to_base64(logo_path)
-
-
-# =========================
-# HEADER (logo + titre)
-# =========================
-st.markdown(f"""
-<div class="header">
-    <img src="data:image/png;base64,{logo_base64}" class="logo">
-    <div class="title-block">
-        <p class="main-title">AfricaEduVision</p>
-        <p class="subtitle">Alphabétisation et développement en Afrique</p>
-    </div>
-</div>
-""", unsafe_allow_html=True)
-
-
-# =========================
-# MENU
-# =========================
-st.markdown("""
-<div class="menu">
-    <a href="/">Accueil</a>
-    <a href="/EDA">Analyse exploratoire</a>
-    <a href="/Predictions">Prévisions</a>
-    <a href="/Comparaison">Comparaisons</a>
-    <a href="/Methodologie">Méthodologie</a>
-    <a href="/Conclusion"> Conclusion</a>
-</div>
-""", unsafe_allow_html=True)
+page_header("Alphabétisation et développement en Afrique", hide_streamlit=True)
 
 
 # =========================
@@ -193,13 +65,13 @@ with col2:
 # =========================
 # CHIFFRES CLÉS
 # =========================
-# Charger le dataset et calculer les moyennes générales
-data_path = os.path.join("data", "Africa_Education_Development_Top30_ClusterImputed.csv")
-df = pd.read_csv(data_path)
+# Moyennes générales lues dans le résumé précalculé (petit fichier JSON) :
+# la page d'accueil ne charge jamais le dataset complet
+moyennes = load_summary()["global"]
 
-mean_female = df["Literacy_Female_Adult"].mean()   # Moyenne alphabétisation femmes adultes
-mean_male = df["Literacy_Male_Adult"].mean()       # Moyenne alphabétisation hommes adultes
-mean_fertility = df["Fertility_Rate"].mean()       # Moyenne du taux de fécondité
+mean_female = moyennes["Literacy_Female_Adult"]["moyenne"]   # Moyenne alphabétisation femmes adultes
+mean_male = moyennes["Literacy_Male_Adult"]["moyenne"]       # Moyenne alphabétisation hommes adultes
+mean_fertility = moyennes["Fertility_Rate"]["moyenne"]       # Moyenne du taux de fécondité
 
 # Bloc affichant les 3 chiffres clés
 st.markdown(f"""
@@ -218,3 +90,5 @@ st.markdown(f"""
     </div>
 </div>
 """, unsafe_allow_html=True)
+
+profiling.end_page()   # Export des spans et panneau de débogage
@@ -0,0 +1 @@
+"""API HTTP d'AfricaEduVision (FastAPI), branchée sur la même couche ``eduvision`` que les pages."""
@@ -0,0 +1,264 @@
+# ===============================================
+# API DE PRÉVISION (FASTAPI)
+# ===============================================
+"""
+Service HTTP exposant les données et les prévisions d'AfricaEduVision.
+
+- ``GET /countries`` : liste des pays et des années couvertes ;
+- ``GET /indicators/{country}?debut=&fin=`` : indicateurs d'un pays par année ;
+- ``GET /forecast/{country}?model=prophet|rf|lstm|lstm_panel`` : prévision jusqu'en 2030 ;
+- ``GET /compare?year=&indicator=`` : classement des pays pour une année ;
+- ``GET /animation?x=&y=&pas=`` : lignes de l'animation de la page Comparaison.
+
+Les gestionnaires sont asynchrones ; les appels bloquants (lecture du
+dataset, empreinte sha256 du fichier, lecture du stock) passent par le pool
+de threads de Starlette pour ne jamais bloquer la boucle d'événements, même
+à froid. Les prévisions viennent du stock
+précalculé (``eduvision.forecast_store``) s'il est à jour ; sinon elles sont
+calculées hors de la boucle d'événements (:mod:`api.compute`) : les modèles
+pays par pays dans un pool de processus, les modèles globaux (Random
+Forest, LSTM commun) une seule fois pour tous les pays dans un processus
+d'entraînement dédié, qui complète le stock. Chaque réponse est mise en cache (LRU) par version des
+données, et des requêtes identiques simultanées partagent le même calcul.
+Les réponses portent un ``ETag`` : un client qui renvoie ``If-None-Match``
+reçoit ``304`` sans corps.
+
+Lancement (depuis le dossier ``frontend``) ::
+
+    python -m api.app --port 8000 --workers 2
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from enum import Enum
+from multiprocessing import get_context
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from api import compute
+from eduvision.animation import animation_rows
+from eduvision.data import INDICATORS, dataset_version, load_dataset
+from eduvision.forecast_store import load_forecast, store_version
+from eduvision.models import MODEL_LABELS
+from eduvision.panel import load_panel
+
+# Modèles acceptés par /forecast : ceux du registre eduvision.models
+ModelName = Enum("ModelName", {key: key for key in MODEL_LABELS}, type=str)
+
+CACHE_CONTROL = "public, max-age=300"
+
+
+# ===============================================
+# CACHE DES RÉPONSES
+# ===============================================
+class ResponseCache:
+    """
+    Cache LRU de réponses JSON, avec mutualisation des calculs en cours.
+
+    Les valeurs sont stockées déjà encodées (octets) : un succès ne coûte
+    ni calcul ni sérialisation.
+    """
+
+    def __init__(self, max_entries=2048):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self.hits = self.misses = 0
+
+    async def get_or_compute(self, key, compute):
+        """Corps JSON de ``key`` ; ``compute()`` (coroutine) n'est lancé qu'une fois par clé."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        if key in self._inflight:
+            self.hits += 1
+            return await asyncio.shield(self._inflight[key])
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = json.dumps(await compute(), ensure_ascii=False, allow_nan=False).encode()
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()   # Marque l'exception comme lue si personne n'attend
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        future.set_result(body)
+        self._entries[key] = body
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return body
+
+    def clear(self):
+        self._entries.clear()
+
+
+async def cached_response(request, key, compute):
+    """Réponse JSON mise en cache pour ``key`` (plus la version des données), avec ETag."""
+    key = (await run_in_threadpool(dataset_version), *key)
+    body = await request.app.state.cache.get_or_compute(key, compute)
+    etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+# ===============================================
+# APPLICATION
+# ===============================================
+@asynccontextmanager
+async def lifespan(app):
+    workers = int(os.environ.get("EDUVISION_API_WORKERS", 0)) or None
+    # « spawn » : processus neufs, sans hériter de l'état (threads, TensorFlow) du serveur
+    app.state.pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                                         initializer=compute.init_worker)
+    # Un seul processus pour les modèles globaux : un entraînement par (version, modèle)
+    app.state.trainer = ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"),
+                                            initializer=compute.init_worker)
+    app.state.training = {}   # (version du stock, modèle) -> entraînement en cours
+    app.state.cache = ResponseCache()
+    yield
+    app.state.pool.shutdown(cancel_futures=True)
+    app.state.trainer.shutdown(cancel_futures=True)
+
+
+app = FastAPI(title="AfricaEduVision API", lifespan=lifespan)
+
+
+def _records(frame):
+    """Lignes de ``frame`` en dictionnaires, valeurs manquantes en ``null`` (JSON valide)."""
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
+async def train_global(app, model):
+    """Entraîne le modèle global ``model`` pour tous les pays (une fois par version) et attend le stock."""
+    key = (await run_in_threadpool(store_version), model)
+    training = app.state.training.get(key)
+    if training is None:
+        loop = asyncio.get_running_loop()
+        training = asyncio.ensure_future(loop.run_in_executor(app.state.trainer, compute.build_global, model))
+        app.state.training[key] = training
+        training.add_done_callback(lambda _: app.state.training.pop(key, None))
+    await asyncio.shield(training)
+
+
+def _check_country(panel, country):
+    if country not in panel.countries:
+        raise HTTPException(status_code=404, detail=f"Pays inconnu : {country}")
+
+
+@app.get("/countries")
+async def countries(request: Request):
+    async def compute_countries():
+        panel = await run_in_threadpool(load_panel, ["Country Name", "Country Code", "Year"])
+        return {"countries": [
+            {"name": pays, "code": str(panel.country(pays)["Country Code"].iloc[0])}
+            for pays in panel.countries
+        ], "years": [int(annee) for annee in panel.years], "version": await run_in_threadpool(dataset_version)}
+    return await cached_response(request, ("countries",), compute_countries)
+
+
+@app.get("/indicators/{country}")
+async def indicators(request: Request, country: str, debut: int | None = None, fin: int | None = None):
+    panel = await run_in_threadpool(load_panel)
+    _check_country(panel, country)
+
+    async def compute_indicators():
+        lignes = panel.country(country, debut, fin)
+        colonnes = ["Year"] + [col for col in INDICATORS if col in lignes.columns]
+        return {"country": country, "indicators": colonnes[1:],
+                "rows": _records(lignes[colonnes])}
+    return await cached_response(request, ("indicators", country, debut, fin), compute_indicators)
+
+
+@app.get("/forecast/{country}")
+async def forecast(request: Request, country: str, model: ModelName = ModelName.prophet):
+    _check_country(await run_in_threadpool(load_panel, compute.COLUMNS), country)
+    model = model.value
+
+    async def compute_forecast():
+        prevision = await run_in_threadpool(load_forecast, model, country)
+        if prevision is not None:
+            return {"country": country, "model": model, "source": "stock",
+                    "forecast": _records(prevision)}
+        if model in compute.GLOBAL_MODELS:
+            await train_global(request.app, model)
+            prevision = await run_in_threadpool(load_forecast, model, country)
+            if prevision is None:
+                raise HTTPException(status_code=422, detail="Pas assez de données pour ce pays.")
+            return {"country": country, "model": model, "source": "direct",
+                    "forecast": _records(prevision)}
+        loop = asyncio.get_running_loop()
+        try:
+            records = await loop.run_in_executor(request.app.state.pool, compute.forecast_records,
+                                                 model, country)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        return {"country": country, "model": model, "source": "direct", "forecast": records}
+    return await cached_response(request, ("forecast", country, model), compute_forecast)
+
+
+@app.get("/compare")
+async def compare(request: Request, year: int, indicator: str):
+    if indicator not in INDICATORS:
+        raise HTTPException(status_code=422, detail=f"Indicateur inconnu : {indicator}")
+    panel = await run_in_threadpool(load_panel, ["Country Name", "Year", indicator])
+    if year not in panel.years:
+        raise HTTPException(status_code=404, detail=f"Année absente des données : {year}")
+
+    async def compute_compare():
+        lignes = panel.year(year).sort_values(indicator, ascending=False)
+        valeurs = _records(lignes[["Country Name", indicator]].astype({"Country Name": str, indicator: float}))
+        return {"year": year, "indicator": indicator, "values": [
+            {"country": ligne["Country Name"], "value": ligne[indicator]} for ligne in valeurs
+        ]}
+    return await cached_response(request, ("compare", year, indicator), compute_compare)
+
+
+@app.get("/animation")
+async def animation(request: Request, x: str, y: str, pas: int = 1):
+    for indicator in (x, y):
+        if indicator not in INDICATORS:
+            raise HTTPException(status_code=422, detail=f"Indicateur inconnu : {indicator}")
+    if pas < 1:
+        raise HTTPException(status_code=422, detail="Le pas doit être au moins 1.")
+
+    async def compute_animation():
+        lignes = animation_rows(await run_in_threadpool(load_dataset), x, y, pas)
+        lignes = lignes.astype({"Country Name": str})
+        return {"x": x, "y": y, "pas": pas, "columns": lignes.columns.tolist(), "rows": _records(lignes)}
+    return await cached_response(request, ("animation", x, y, pas), compute_animation)
+
+
+@app.get("/health")
+async def health(request: Request):
+    cache = request.app.state.cache
+    version = await run_in_threadpool(dataset_version)
+    return {"data_version": version, "cache": {"hits": cache.hits, "misses": cache.misses}}
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Lance l'API de prévision AfricaEduVision.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, help="Processus de calcul (par défaut : nombre de cœurs)")
+    args = parser.parse_args(argv)
+    if args.workers:
+        os.environ["EDUVISION_API_WORKERS"] = str(args.workers)
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
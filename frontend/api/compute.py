@@ -0,0 +1,57 @@
+"""
+Calculs de prévision exécutés hors de la boucle d'événements de l'API.
+
+- Modèles pays par pays (Prophet, LSTM par pays) : :func:`forecast_records`,
+  dans le pool de processus ; chaque tâche entraîne un seul pays.
+- Modèles globaux (Random Forest, LSTM commun) : :func:`build_global`, dans
+  un processus d'entraînement unique. Un seul entraînement sert tous les
+  pays : ses prévisions sont ajoutées au stock versionné
+  (:mod:`eduvision.forecast_store`), que l'API lit ensuite comme un stock
+  précalculé. Aucun processus du pool ne charge ni ne réentraîne ces modèles.
+"""
+import logging
+
+from eduvision import models
+from eduvision.data import load_dataset
+from eduvision.forecast_store import build_forecasts, store_version, write_store
+
+# Colonnes utilisées par les modèles (comme la page Prévisions)
+COLUMNS = ["Country Name", "Year", "Literacy_Female_Adult",
+           "GDP_per_capita", "Education_Expenditure", "Urban_Population",
+           "Fertility_Rate", "Child_Marriage_Under18"]
+
+# Modèles entraînés une fois pour tous les pays : servis depuis le stock
+GLOBAL_MODELS = ("rf", "lstm_panel")
+
+logger = logging.getLogger(__name__)
+
+
+def init_worker():
+    """Initialisation d'un processus de calcul : journaux de cmdstanpy/Prophet coupés."""
+    for name in ("cmdstanpy", "prophet"):
+        logger = logging.getLogger(name)
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        logger.setLevel(logging.ERROR)
+
+
+def build_global(model):
+    """
+    Entraîne le modèle global ``model`` sur tous les pays et ajoute ses prévisions au stock.
+
+    Retourne la version du stock écrite.
+    """
+    version = store_version()
+    forecasts, durations = build_forecasts(load_dataset(COLUMNS), [model], log=logger.info)
+    write_store(forecasts, version, durations)
+    return version
+
+
+def forecast_records(model, pays):
+    """
+    Prévision de ``pays`` par un modèle pays par pays, au format liste de dictionnaires.
+
+    Lève ``ValueError`` si le pays n'a pas assez d'historique.
+    """
+    prevision = models.forecast(model, load_dataset(COLUMNS), pays)
+    return prevision.astype(object).where(prevision.notna(), None).to_dict(orient="records")
@@ -0,0 +1 @@
+"""Scripts de mesure de performance d'AfricaEduVision (à lancer depuis ``frontend``)."""
@@ -0,0 +1,71 @@
+# ===============================================
+# BENCHMARK : ANIMATION GAPMINDER (PAGE COMPARAISON)
+# ===============================================
+"""
+Mesure le coût serveur et la taille de l'animation avant/après le cache.
+
+- « avant » : ``px.scatter(..., animation_frame="Year")`` reconstruit à
+  chaque rerun, puis converti comme le fait ``st.plotly_chart``
+  (``to_dict`` puis ``to_json``) ;
+- « après » : :func:`eduvision.animation.animation_figure` ; premier appel
+  (construction) puis rerun (figure en cache, conversion seule), pour
+  chaque pas de décimation.
+
+Le temps d'un rerun est le temps jusqu'à ce que le JSON soit prêt à partir
+vers le navigateur ; la taille brute et compressée (gzip) du JSON donne le
+volume à transférer et à analyser côté navigateur avant le premier affichage.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_animation --x Literacy_Female_Adult --y Fertility_Rate
+"""
+import argparse
+import gzip
+import time
+
+import plotly.express as px
+import plotly.io as pio
+import plotly.tools
+
+from eduvision.animation import animation_figure
+from eduvision.data import load_dataset
+
+
+def _to_spec(fig):
+    """Conversion faite par ``st.plotly_chart`` : figure -> JSON envoyé au navigateur."""
+    figure = plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True)
+    return pio.to_json(figure, validate=False).encode()
+
+
+def _mesure(fn):
+    start = time.perf_counter()
+    spec = _to_spec(fn())
+    return (time.perf_counter() - start) * 1000, len(spec), len(gzip.compress(spec))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--x", default="Literacy_Female_Adult")
+    parser.add_argument("--y", default="Fertility_Rate")
+    parser.add_argument("--pas", type=int, nargs="+", default=[1, 2, 3])
+    args = parser.parse_args(argv)
+
+    df = load_dataset()
+
+    def avant():
+        return px.scatter(df, x=args.x, y=args.y, animation_frame="Year", animation_group="Country Name",
+                          size="GDP_per_capita", color="Country Name", hover_name="Country Name",
+                          log_x=False, size_max=60)
+
+    lignes = [("avant (chaque rerun)", *_mesure(avant))]
+    for pas in args.pas:
+        lignes.append((f"après, pas={pas} (1er appel)", *_mesure(lambda: animation_figure(args.x, args.y, pas=pas))))
+        lignes.append((f"après, pas={pas} (rerun)", *_mesure(lambda: animation_figure(args.x, args.y, pas=pas))))
+
+    print(f"{'variante':<28}{'temps (ms)':>12}{'JSON (Ko)':>12}{'gzip (Ko)':>12}")
+    for nom, ms, brut, compresse in lignes:
+        print(f"{nom:<28}{ms:>12.1f}{brut / 1024:>12.1f}{compresse / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# ===============================================
+# BENCHMARK : BACKTEST DES MODÈLES DE PRÉVISION
+# ===============================================
+"""
+Backtest à origine glissante de Prophet, du Random Forest et des LSTM (par pays et commun).
+
+Pour chaque origine ``o`` (par exemple 2015, 2017, 2019), chaque modèle est
+entraîné sur les années ``<= o`` de tous les pays, puis comparé aux valeurs
+observées des ``--horizon`` années suivantes. Pour chaque (modèle, origine) :
+
+- précision : RMSE, MAPE (%) et R² sur tous les couples (pays, année) testés ;
+- temps : ajustement et prédiction (en secondes, tous pays confondus) ;
+- mémoire : pic de mémoire résidente du processus, et part due au modèle
+  (pic moins la mémoire après chargement des librairies et des données).
+
+Chaque (modèle, origine) tourne dans son propre processus « spawn »
+(``max_tasks_per_child=1``) : les tâches s'exécutent en parallèle et le pic
+de mémoire d'une tâche n'est pas pollué par les autres. Le Random Forest est
+réentraîné sans passer par le registre des modèles, pour mesurer un vrai
+ajustement. Pour les LSTM (un réseau par pays, ou commun), la prédiction est
+l'inférence compilée à chaud ; le reste (entraînement, résidus, traçage de
+la boucle) compte comme ajustement.
+
+Le LSTM par pays entraîne un réseau par pays et par origine (quelques
+secondes chacun) : ``--max-countries`` limite tous les modèles aux mêmes
+premiers pays (ordre alphabétique) pour un passage rapide.
+
+``--output`` ajoute les lignes du tableau à un fichier JSON lines (date,
+version des données et des modèles) pour suivre les résultats dans le temps.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_backtest --models prophet rf lstm lstm_panel --origins 2015 2017 2019 \\
+        --workers 3 --output backtest.jsonl
+    python -m benchmarks.bench_backtest --models lstm rf --max-countries 5
+"""
+import argparse
+import json
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from eduvision import models
+from eduvision.data import dataset_version, load_dataset
+from eduvision.forecast_store import MODELS_VERSION
+from eduvision.models.base import TARGET, country_series
+
+COLUMNS = ["Country Name", "Year", TARGET,
+           "GDP_per_capita", "Education_Expenditure", "Urban_Population",
+           "Fertility_Rate", "Child_Marriage_Under18"]
+
+
+def _rss_mb():
+    """Pic de mémoire résidente du processus courant, en Mo (Linux : ru_maxrss en Ko)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# ===============================================
+# AJUSTEMENT / PRÉDICTION PAR MODÈLE
+# ===============================================
+def _run_prophet(train, countries):
+    from eduvision.models import prophet_model
+    prophet_model.init_worker()
+
+    fit_s = predict_s = 0.0
+    previsions = {}
+    for pays in countries:
+        serie = country_series(train, pays)
+        if len(serie) < 2:
+            continue
+        start = time.perf_counter()
+        model = prophet_model.fit_series(serie["Year"].to_numpy(), serie[TARGET].to_numpy())
+        fit_s += time.perf_counter() - start
+        start = time.perf_counter()
+        previsions[pays] = prophet_model.predict_series(model, serie["Year"].max())
+        predict_s += time.perf_counter() - start
+    return previsions, fit_s, predict_s
+
+
+def _run_rf(train, countries):
+    from eduvision.models import random_forest
+
+    start = time.perf_counter()
+    # _fit directement : le registre rechargerait un modèle déjà entraîné
+    rf = random_forest._fit(*random_forest.training_data(train))
+    fit_s = time.perf_counter() - start
+    start = time.perf_counter()
+    previsions = {pays: random_forest.predict(rf, train, pays) for pays in countries}
+    return previsions, fit_s, time.perf_counter() - start
+
+
+def _run_lstm(train, countries):
+    from eduvision.models import lstm
+
+    fit_s = predict_s = 0.0
+    previsions = {}
+    for pays in countries:
+        start = time.perf_counter()
+        try:
+            prevision = lstm.forecast(train, pays)
+        except ValueError:
+            continue   # Historique trop court avant l'origine
+        inference_s = prevision.attrs["inference_ms"] / 1000
+        fit_s += time.perf_counter() - start - inference_s
+        predict_s += inference_s
+        previsions[pays] = prevision
+    return previsions, fit_s, predict_s
+
+
+def _run_lstm_panel(train, countries):
+    from eduvision.models import lstm_panel
+
+    start = time.perf_counter()
+    previsions = lstm_panel.forecast_all(train)
+    total_s = time.perf_counter() - start
+    predict_s = sum(p.attrs["inference_ms"] for p in previsions.values()) / 1000
+    return {pays: previsions[pays] for pays in countries if pays in previsions}, total_s - predict_s, predict_s
+
+
+RUNNERS = {"prophet": _run_prophet, "rf": _run_rf, "lstm": _run_lstm, "lstm_panel": _run_lstm_panel}
+
+
+# ===============================================
+# MÉTRIQUES
+# ===============================================
+def scores(observed, predicted):
+    """RMSE, MAPE (%, valeurs observées non nulles) et R² de deux tableaux alignés."""
+    observed = np.asarray(observed, dtype="float64")
+    predicted = np.asarray(predicted, dtype="float64")
+    erreur = predicted - observed
+    rmse = float(np.sqrt(np.mean(erreur ** 2)))
+    non_nul = observed != 0
+    mape = float(np.mean(np.abs(erreur[non_nul] / observed[non_nul])) * 100)
+    ss_tot = np.sum((observed - observed.mean()) ** 2)
+    r2 = float(1 - np.sum(erreur ** 2) / ss_tot) if ss_tot > 0 else float("nan")
+    return rmse, mape, r2
+
+
+def evaluate(df, previsions, origin, horizon):
+    """Couples (observé, prévu) des années ``origin+1 .. origin+horizon``, tous pays."""
+    test = df[(df["Year"] > origin) & (df["Year"] <= origin + horizon)][["Country Name", "Year", TARGET]]
+    test = test.dropna().astype({"Country Name": str, "Year": "int64"})
+    prevu = pd.concat(
+        [prevision[["Year", "yhat"]].assign(**{"Country Name": pays}) for pays, prevision in previsions.items()],
+        ignore_index=True,
+    ).astype({"Year": "int64"})
+    paires = test.merge(prevu, on=["Country Name", "Year"], how="inner")
+    return paires[TARGET].to_numpy(), paires["yhat"].to_numpy()
+
+
+def backtest(model, origin, horizon, countries=None, max_countries=None):
+    """Une tâche (modèle, origine), exécutée dans un processus neuf."""
+    df = load_dataset(COLUMNS)
+    countries = (countries or sorted(df["Country Name"].unique()))[:max_countries]
+    train = df[df["Year"] <= origin]
+    models.get(model)   # Librairie du modèle importée avant la mémoire de référence
+    memoire_base = _rss_mb()
+
+    previsions, fit_s, predict_s = RUNNERS[model](train, countries)
+    observed, predicted = evaluate(df, previsions, origin, horizon) if previsions else ([], [])
+    rmse, mape, r2 = scores(observed, predicted) if len(observed) else (float("nan"),) * 3
+    memoire_max = _rss_mb()
+    return {
+        "modele": model, "origine": origin, "horizon": horizon,
+        "pays": len(previsions), "points": len(observed),
+        "rmse": round(rmse, 4), "mape": round(mape, 3), "r2": round(r2, 4),
+        "ajustement_s": round(fit_s, 3), "prediction_s": round(predict_s, 3),
+        "memoire_max_mo": round(memoire_max, 1), "memoire_modele_mo": round(memoire_max - memoire_base, 1),
+    }
+
+
+def run(model_names, origins, horizon, countries=None, workers=None, max_countries=None):
+    """Toutes les tâches (modèle, origine) en parallèle ; lignes du tableau de résultats."""
+    tasks = [(model, origin) for model in model_names for origin in origins]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                             max_tasks_per_child=1) as pool:
+        futures = [pool.submit(backtest, model, origin, horizon, countries, max_countries)
+                   for model, origin in tasks]
+        return [future.result() for future in futures]
+
+
+def summary(rows):
+    """Moyenne des métriques et somme des temps par modèle, toutes origines confondues."""
+    table = pd.DataFrame(rows)
+    return table.groupby("modele", sort=False).agg(
+        rmse=("rmse", "mean"), mape=("mape", "mean"), r2=("r2", "mean"),
+        ajustement_s=("ajustement_s", "sum"), prediction_s=("prediction_s", "sum"),
+        memoire_max_mo=("memoire_max_mo", "max"),
+    ).round(3)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", nargs="+", choices=list(RUNNERS), default=list(RUNNERS))
+    parser.add_argument("--origins", type=int, nargs="+", default=[2015, 2017, 2019],
+                        help="Dernières années d'entraînement")
+    parser.add_argument("--horizon", type=int, default=3, help="Années testées après chaque origine")
+    parser.add_argument("--countries", nargs="+", help="Pays testés (par défaut : tous)")
+    parser.add_argument("--max-countries", type=int,
+                        help="Limite tous les modèles aux N premiers pays (LSTM par pays : quelques secondes par pays)")
+    parser.add_argument("--workers", type=int, help="Processus en parallèle (par défaut : nombre de cœurs)")
+    parser.add_argument("--output", type=Path, help="Fichier JSON lines où ajouter les résultats")
+    args = parser.parse_args(argv)
+
+    rows = run(args.models, args.origins, args.horizon, args.countries, args.workers, args.max_countries)
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(pd.DataFrame(rows).to_string(index=False))
+        print()
+        print(summary(rows).to_string())
+
+    if args.output:
+        contexte = {"date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "donnees": dataset_version(), "modeles_version": MODELS_VERSION}
+        with args.output.open("a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps({**contexte, **row}, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# ===============================================
+# BENCHMARK : EN-TÊTE ET MENU DES PAGES
+# ===============================================
+"""
+Mesure ce que coûte l'en-tête commun (style, logo, titre, menu) à chaque rerun.
+
+- « avant » : ancien code des pages, logo d'origine relu et encodé en base64
+  puis CSS, en-tête et menu envoyés en trois ``st.markdown`` ;
+- « après, data: » : :func:`eduvision.layout.chrome_html` avec la miniature
+  intégrée (service statique désactivé) ;
+- « après, statique » : même bloc, le logo étant une URL ``app/static/``
+  (téléchargé une fois puis gardé en cache par le navigateur).
+
+Pour chaque variante : temps de construction par rerun (médiane) et octets
+de HTML envoyés au navigateur par rerun.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_chrome --repetitions 200
+"""
+import argparse
+import base64
+import statistics
+import time
+
+from eduvision import layout
+
+
+def avant():
+    """Ancien en-tête : logo complet encodé à chaque rerun, trois blocs HTML."""
+    logo_base64 = base64.b64encode(layout.LOGO_FILE.read_bytes()).decode()
+    style = f"<style>{layout.CSS}{layout.HIDE_SIDEBAR_CSS}</style>"
+    entete = f"""
+<div class="header">
+    <img src="data:image/png;base64,{logo_base64}" class="logo">
+    <div class="title-block">
+        <p class="main-title">AfricaEduVision</p>
+        <p class="subtitle">Alphabétisation et développement en Afrique</p>
+    </div>
+</div>
+"""
+    menu = "<div class=\"menu\">" + "".join(f'<a href="{href}">{label}</a>' for href, label in layout.MENU) + "</div>"
+    return [style, entete, menu]
+
+
+def apres(static_serving):
+    logo = layout.logo_url(static_serving)
+    return [layout.chrome_html("Alphabétisation et développement en Afrique", logo, hide_sidebar=True)]
+
+
+def _mesure(fn, repetitions):
+    durees = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        blocs = fn()
+        durees.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durees), sum(len(bloc.encode()) for bloc in blocs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repetitions", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    lignes = [
+        ("avant", *_mesure(avant, args.repetitions)),
+        ("après, data:", *_mesure(lambda: apres(False), args.repetitions)),
+        ("après, statique", *_mesure(lambda: apres(True), args.repetitions)),
+    ]
+    print(f"Logo d'origine : {layout.LOGO_FILE.stat().st_size / 1024:.0f} Ko, "
+          f"miniature : {len(layout.logo_png()) / 1024:.1f} Ko (médiane de {args.repetitions} reruns)")
+    print(f"{'variante':<18}{'temps (ms)':>12}{'HTML (Ko)':>12}")
+    for nom, ms, octets in lignes:
+        print(f"{nom:<18}{ms:>12.3f}{octets / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
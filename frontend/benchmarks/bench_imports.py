@@ -0,0 +1,95 @@
+# ===============================================
+# BENCHMARK : TEMPS D'IMPORT AU DÉMARRAGE DES PAGES
+# ===============================================
+"""
+Mesure le coût des imports de chaque page (et de chaque modèle) à froid.
+
+Pour chaque page, les instructions ``import`` de premier niveau sont
+extraites du script puis exécutées dans un processus neuf avec
+``python -X importtime`` ; on additionne le temps cumulé des modules de
+premier niveau et on affiche les plus coûteux. ``--budget-ms`` fait échouer
+la commande (code 1) si une page dépasse le budget, ce qui permet de
+détecter une régression (par exemple un ``import tensorflow`` remis en tête
+de page) ; ``--output`` ajoute les mesures à un fichier JSON lines.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_imports --models --budget-ms 3000 --output importtime.jsonl
+"""
+import argparse
+import ast
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+FRONTEND_DIR = Path(__file__).resolve().parents[1]
+PAGES = [FRONTEND_DIR / "Home.py", *sorted((FRONTEND_DIR / "pages").glob("*.py"))]
+
+
+def page_imports(path):
+    """Code source des instructions import de premier niveau d'une page."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in nodes)
+
+
+def importtime(code):
+    """Exécute ``code`` avec -X importtime ; retourne (total en ms, modules de premier niveau)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=FRONTEND_DIR, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Les modules de premier niveau ne sont pas indentés dans la sortie
+        if not name.startswith("  "):
+            modules[name.strip()] = int(cumulative) / 1000
+    return sum(modules.values()), modules
+
+
+def run(include_models=False):
+    """Mesures ``{cible: (total ms, modules)}`` pour chaque page et, au besoin, chaque modèle."""
+    targets = {path.name: page_imports(path) for path in PAGES}
+    if include_models:
+        from eduvision.models import FORECASTERS
+        for key, spec in FORECASTERS.items():
+            targets[f"modèle:{key}"] = f"import {spec.module}"
+    return {name: importtime(code) for name, code in targets.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", action="store_true", help="Mesurer aussi l'import de chaque modèle")
+    parser.add_argument("--top", type=int, default=3, help="Modules les plus coûteux affichés")
+    parser.add_argument("--budget-ms", type=float, help="Échec si une page dépasse ce temps")
+    parser.add_argument("--output", type=Path, help="Fichier JSON lines où ajouter les mesures")
+    args = parser.parse_args(argv)
+
+    results = run(args.models)
+    depassements = []
+    for name, (total, modules) in results.items():
+        heaviest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        details = ", ".join(f"{module} {ms:.0f} ms" for module, ms in heaviest)
+        print(f"{name:<24}{total:>10.0f} ms   ({details})")
+        if args.budget_ms and not name.startswith("modèle:") and total > args.budget_ms:
+            depassements.append(name)
+
+    if args.output:
+        horodatage = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with args.output.open("a", encoding="utf-8") as f:
+            for name, (total, _) in results.items():
+                f.write(json.dumps({"date": horodatage, "cible": name, "import_ms": round(total, 1)},
+                                   ensure_ascii=False) + "\n")
+
+    if depassements:
+        print(f"Budget de {args.budget_ms:.0f} ms dépassé : {', '.join(depassements)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
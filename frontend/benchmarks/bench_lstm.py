@@ -0,0 +1,52 @@
+# ===============================================
+# BENCHMARK : LSTM PAR PAYS vs LSTM COMMUN (PANEL)
+# ===============================================
+"""
+Compare le temps total pour prévoir tous les pays avec le LSTM.
+
+- « par pays » : la boucle d'origine, un réseau entraîné par pays
+  (``batch_size=1``, une prédiction Keras par année) ;
+- « panel » : un seul réseau pour tous les pays, fenêtres construites par
+  ``sliding_window_view`` et prévision d'une année pour tous les pays à la fois.
+
+La boucle par pays peut être limitée à quelques pays (``--countries``) :
+le temps total est alors extrapolé à partir du temps moyen par pays.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_lstm --countries 3
+"""
+import argparse
+import time
+
+from eduvision.data import load_dataset
+from eduvision.models import lstm, lstm_panel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=3,
+                        help="Nombre de pays mesurés pour la boucle par pays")
+    args = parser.parse_args(argv)
+
+    df = load_dataset()
+    tous = sorted(df["Country Name"].unique())
+
+    start = time.perf_counter()
+    for pays in tous[:args.countries]:
+        lstm.forecast(df, pays)
+    par_pays = (time.perf_counter() - start) / args.countries
+
+    start = time.perf_counter()
+    lstm_panel.forecast_all(df)
+    panel = time.perf_counter() - start
+
+    total_par_pays = par_pays * len(tous)
+    print(f"{'mode':<12}{'pays':>6}{'temps total (s)':>18}")
+    print(f"{'par pays':<12}{len(tous):>6}{total_par_pays:>18.1f}   (extrapolé : {par_pays:.1f} s/pays)")
+    print(f"{'panel':<12}{len(tous):>6}{panel:>18.1f}")
+    print(f"Accélération : x{total_par_pays / panel:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# ===============================================
+# BENCHMARK : FILTRES PAR MASQUE vs INDEX DU PANEL
+# ===============================================
+"""
+Compare les filtres des pages EDA et Comparaison.
+
+- EDA : ``(pays == p) & (Year >= a) & (Year <= b)`` contre
+  ``PanelIndex.country(p, a, b)`` ;
+- Comparaison : ``df[df["Year"] == annee]`` contre ``PanelIndex.year(annee)``.
+
+Chaque requête tire un pays et une période au hasard ; on mesure le temps
+médian par requête. ``--countries``/``--years`` remplacent le dataset par un
+panel synthétique plus grand.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_panel --queries 2000
+    python -m benchmarks.bench_panel --countries 1000 --years 60
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from eduvision.data import load_dataset
+from eduvision.panel import PanelIndex
+
+
+def _per_query_us(fn, queries, repeat=5):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for q in queries:
+            fn(*q)
+        durations.append((time.perf_counter() - start) / len(queries))
+    return statistics.median(durations) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--countries", type=int, help="Panel synthétique : nombre de pays")
+    parser.add_argument("--years", type=int, default=60, help="Panel synthétique : nombre d'années")
+    args = parser.parse_args(argv)
+
+    if args.countries:
+        from benchmarks.bench_imputation import synthetic_panel
+        df, _ = synthetic_panel(args.countries, args.years, 12, missing=0)
+        df["Country Name"] = df["Country Name"].astype("category")
+    else:
+        df = load_dataset()
+
+    start = time.perf_counter()
+    panel = PanelIndex(df)
+    construction = (time.perf_counter() - start) * 1000
+
+    rng = np.random.default_rng(42)
+    pays = rng.choice(panel.countries, args.queries)
+    bornes = np.sort(rng.choice(panel.years, (args.queries, 2)), axis=1)
+    eda = [(p, int(a), int(b)) for p, (a, b) in zip(pays, bornes)]
+    annees = [(int(a),) for a in rng.choice(panel.years, args.queries)]
+
+    def eda_masque(p, a, b):
+        return df[(df["Country Name"] == p) & (df["Year"] >= a) & (df["Year"] <= b)]
+
+    def annee_masque(a):
+        return df[df["Year"] == a]
+
+    resultats = [
+        ("EDA pays + période", _per_query_us(eda_masque, eda), _per_query_us(panel.country, eda)),
+        ("Comparaison année", _per_query_us(annee_masque, annees), _per_query_us(panel.year, annees)),
+    ]
+
+    print(f"Panel : {len(df)} lignes, {len(panel.countries)} pays, {len(panel.years)} années "
+          f"(index construit en {construction:.1f} ms)")
+    print(f"{'filtre':<22}{'masque (µs)':>14}{'index (µs)':>14}{'gain':>8}")
+    for nom, masque, index in resultats:
+        print(f"{nom:<22}{masque:>14.1f}{index:>14.1f}{masque / index:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
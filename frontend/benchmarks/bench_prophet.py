@@ -0,0 +1,44 @@
+# ===============================================
+# BENCHMARK : PROPHET EN PARALLÈLE (1 → N CŒURS)
+# ===============================================
+"""
+Mesure le temps d'ajustement de Prophet pour tous les pays selon le nombre
+de processus utilisés par ``prophet_model.forecast_all``.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_prophet --workers 1 2 4 8 --all-literacy
+"""
+import argparse
+import os
+import time
+
+from eduvision.data import load_dataset
+from eduvision.models import prophet_model
+from eduvision.models.base import LITERACY, TARGET
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--all-literacy", action="store_true",
+                        help="Quatre indicateurs d'alphabétisation au lieu d'un seul")
+    args = parser.parse_args(argv)
+
+    df = load_dataset()
+    indicators = LITERACY if args.all_literacy else (TARGET,)
+
+    print(f"{'processus':>10}{'modèles':>10}{'temps (s)':>12}{'accélération':>15}")
+    reference = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        previsions = prophet_model.forecast_all(df, indicators=indicators, workers=workers)
+        elapsed = time.perf_counter() - start
+        reference = reference or elapsed
+        n_models = previsions.groupby(["Country Name", "indicator"]).ngroups
+        print(f"{workers:>10}{n_models:>10}{elapsed:>12.1f}{reference / elapsed:>14.2f}x")
+
+
+if __name__ == "__main__":
+    main()
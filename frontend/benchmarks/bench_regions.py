@@ -0,0 +1,136 @@
+# ===============================================
+# BENCHMARK : PANEL RÉGIONAL, EN MÉMOIRE OU PAR MORCEAUX
+# ===============================================
+"""
+Temps et mémoire du traitement d'un panel régional quand il grandit.
+
+Pour chaque nombre de régions par pays, un panel synthétique
+(:func:`pipeline.synthetic.generate_regions`, 10 % de valeurs manquantes)
+est écrit puis traité de deux façons, chacune dans un processus neuf :
+
+- « en mémoire » : tout le fichier lu dans un DataFrame, puis imputation
+  par cluster (pandas), agrégation au niveau pays et filtre ;
+- « par morceaux » : :mod:`pipeline.regional` et :mod:`eduvision.regions`,
+  un pays à la fois.
+
+Pour chaque variante : temps de chaque étape et mémoire ajoutée au
+processus (pic de mémoire résidente moins la mémoire après les imports).
+Les médianes des deux variantes sont comparées.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_regions --regions 100 1000 3000
+"""
+import argparse
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from eduvision.data import REGION, load_dataset
+from eduvision.regions import write_regions
+from pipeline.synthetic import generate_regions
+
+
+def _rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _en_memoire(path, output):
+    import pyarrow.parquet as pq
+
+    from eduvision.regions import indicator_columns
+    from pipeline.imputation import cluster_profiles
+
+    temps = {}
+    start = time.perf_counter()
+    df = pq.read_table(path).to_pandas()
+    indicators = indicator_columns(df.columns)
+    cles = [df["Country Name"].astype(str), df[REGION].astype(str)]
+    profils = df.groupby(cles)[indicators].mean()
+    clusters = cluster_profiles(profils)
+    cluster_ligne = clusters.reindex(pd.MultiIndex.from_arrays(cles)).to_numpy()
+    values = df[indicators].to_numpy(dtype="float32", copy=True)
+    medians = pd.DataFrame(values).groupby(cluster_ligne).median()
+    fill = medians.reindex(cluster_ligne).to_numpy(dtype="float32")
+    missing = np.isnan(values)
+    values[missing] = fill[missing]
+    df[indicators] = values
+    df["Cluster"] = cluster_ligne
+    df.to_parquet(output, index=False)
+    temps["imputation_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df.groupby(["Country Name", "Year"], observed=True)[indicators].mean()
+    temps["agregation_s"] = time.perf_counter() - start
+    start = time.perf_counter()
+    df[df["Country Name"].isin(["Kenya", "Senegal"]) & df["Year"].between(2010, 2015)]
+    temps["filtre_s"] = time.perf_counter() - start
+    return temps, medians.to_numpy()
+
+
+def _par_morceaux(path, output):
+    from eduvision.regions import aggregate_to_country, filter_regions
+    from pipeline.regional import impute_regions
+
+    temps = {}
+    start = time.perf_counter()
+    imputer = impute_regions(path, output, log=lambda _: None)
+    temps["imputation_s"] = time.perf_counter() - start
+    start = time.perf_counter()
+    aggregate_to_country(output)
+    temps["agregation_s"] = time.perf_counter() - start
+    start = time.perf_counter()
+    filter_regions(output, countries={"Kenya", "Senegal"}, years=(2010, 2015))
+    temps["filtre_s"] = time.perf_counter() - start
+    return temps, imputer.medians
+
+
+VARIANTES = {"en mémoire": _en_memoire, "par morceaux": _par_morceaux}
+
+
+def measure(variante, path, output):
+    """Une variante dans un processus neuf : (temps par étape, mémoire ajoutée en Mo, médianes)."""
+    import pyarrow.parquet  # noqa: F401  (imports comptés dans la mémoire de référence)
+    import sklearn.cluster  # noqa: F401
+
+    base = _rss_mb()
+    temps, medians = VARIANTES[variante](path, output)
+    return temps, _rss_mb() - base, medians
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--regions", type=int, nargs="+", default=[100, 1000, 3000],
+                        help="Nombres de régions par pays")
+    parser.add_argument("--missing", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    base = load_dataset()
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir, ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("spawn"), max_tasks_per_child=1) as pool:
+        for n_regions in args.regions:
+            path = Path(workdir) / f"regions_x{n_regions}.parquet"
+            lignes = write_regions(generate_regions(base, n_regions, missing=args.missing), path)
+            medians = {}
+            for variante in VARIANTES:
+                output = Path(workdir) / f"imputees_{len(rows)}.parquet"
+                temps, memoire, medians[variante] = pool.submit(measure, variante, path, output).result()
+                rows.append({"regions_par_pays": n_regions, "lignes": lignes, "variante": variante,
+                             **{k: round(v, 2) for k, v in temps.items()}, "memoire_mo": round(memoire, 1),
+                             "fichier_mo": round(path.stat().st_size / 2**20, 1)})
+            identiques = np.array_equal(*medians.values(), equal_nan=True)
+            print(f" {n_regions} régions par pays : médianes identiques = {identiques}", flush=True)
+
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ===============================================
+# BENCHMARK : CLIENT DU BACKEND DISTANT
+# ===============================================
+"""
+Mesure le coût des requêtes des pages vers l'API de prévision.
+
+- « nouvelle connexion » : une requête par pays, un client HTTP neuf à
+  chaque fois (connexion TCP ouverte puis fermée) ;
+- « keep-alive, séquentiel » : même client partagé, pays l'un après l'autre ;
+- « keep-alive, parallèle » : :func:`eduvision.remote.forecasts`.
+
+L'API doit tourner (réponses déjà en cache côté serveur après le premier
+tour, qui est exclu des mesures) ::
+
+    python -m api.app --port 8000 &
+    EDUVISION_API_URL=http://127.0.0.1:8000 python -m benchmarks.bench_remote --model rf
+"""
+import argparse
+import statistics
+import time
+
+import httpx
+
+from eduvision import remote
+
+
+def _mesure(fn, repetitions):
+    durees = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        fn()
+        durees.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durees)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default="rf")
+    parser.add_argument("--countries", type=int, default=5, help="Nombre de pays par vue")
+    parser.add_argument("--repetitions", type=int, default=20)
+    args = parser.parse_args(argv)
+    if not remote.enabled():
+        parser.error("définir EDUVISION_API_URL (adresse de l'API lancée avec python -m api.app)")
+
+    pays_list = [pays["name"] for pays in remote.get("/countries")["countries"][:args.countries]]
+    remote.forecasts(args.model, pays_list)   # Premier tour : entraînement éventuel côté API
+
+    def nouvelle_connexion():
+        for pays in pays_list:
+            with httpx.Client(base_url=remote.api_url()) as client:
+                client.get(f"/forecast/{pays}", params={"model": args.model}).raise_for_status()
+
+    def sequentiel():
+        for pays in pays_list:
+            remote.forecast(args.model, pays)
+
+    lignes = [
+        ("nouvelle connexion", _mesure(nouvelle_connexion, args.repetitions)),
+        ("keep-alive, séquentiel", _mesure(sequentiel, args.repetitions)),
+        ("keep-alive, parallèle", _mesure(lambda: remote.forecasts(args.model, pays_list), args.repetitions)),
+    ]
+    print(f"{len(pays_list)} pays, modèle {args.model} (médiane de {args.repetitions} vues)")
+    print(f"{'variante':<26}{'temps (ms)':>12}")
+    for nom, ms in lignes:
+        print(f"{nom:<26}{ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
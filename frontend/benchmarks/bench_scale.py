@@ -0,0 +1,148 @@
+# ===============================================
+# BENCHMARK : MONTÉE EN CHARGE DU PANEL
+# ===============================================
+"""
+Temps des étapes de l'application quand le panel grandit (10×, 100×, 1000×).
+
+Pour chaque facteur, un panel synthétique (:mod:`pipeline.synthetic`) est
+écrit en Parquet puis mesuré dans un processus neuf (caches vides, pic de
+mémoire propre à la mesure) :
+
+- ``chargement`` : lecture typée du Parquet (:func:`eduvision.data.load_dataset`) ;
+- ``index`` : construction de l'index pays/années (:class:`eduvision.panel.PanelIndex`) ;
+- ``filtre pays`` / ``filtre année`` : médiane d'une requête sur l'index ;
+- ``corrélations`` : statistiques de la page EDA (:func:`eduvision.stats.build_stats`) ;
+- ``animation`` : figure Gapminder de la page Comparaison, et taille de son JSON ;
+- ``rf`` : ajustement du Random Forest global, puis prédiction d'un pays ;
+- ``prophet`` : ajustement et prévision d'un pays (indépendant de la taille) ;
+- ``lstm`` (sur demande, ``--steps``) : réseau commun à toutes les entités.
+
+Le facteur 1 est le dataset de base lui-même. ``--output`` ajoute les
+lignes à un fichier JSON lines.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m benchmarks.bench_scale --scales 1 10 100 1000 --output scale.jsonl
+"""
+import argparse
+import json
+import resource
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from eduvision.data import dataset_version, load_dataset
+from pipeline.synthetic import generate, write_synthetic
+
+STEPS = ["chargement", "index", "filtres", "corrélations", "animation", "rf", "prophet", "lstm"]
+DEFAULT_STEPS = [step for step in STEPS if step != "lstm"]
+
+
+def _ms(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _median_ms(fn, arguments):
+    return statistics.median(_ms(fn, *args)[1] for args in arguments)
+
+
+def measure(path, steps, queries=200, seed=0):
+    """Mesures d'un panel (exécuté dans un processus neuf) : ``{mesure: valeur}``."""
+    from eduvision.panel import PanelIndex
+
+    mesures = {}
+    df, mesures["chargement_ms"] = _ms(load_dataset, None, path)
+    mesures["lignes"], mesures["entites"] = len(df), df["Country Name"].nunique()
+    pays = sorted(df["Country Name"].unique())
+    echantillon = np.random.default_rng(seed).choice(pays, size=min(queries, len(pays)), replace=False)
+
+    if "index" in steps or "filtres" in steps:
+        index, mesures["index_ms"] = _ms(PanelIndex, df)
+        if "filtres" in steps:
+            mesures["filtre_pays_ms"] = _median_ms(index.country, [(p, 2010, 2020) for p in echantillon])
+            mesures["filtre_annee_ms"] = _median_ms(index.year, [(a,) for a in index.years])
+
+    if "corrélations" in steps:
+        from eduvision.stats import build_stats
+
+        arrays, mesures["correlations_ms"] = _ms(build_stats, df)
+        mesures["correlations_mo"] = round(sum(a.nbytes for a in arrays.values()) / 2**20, 1)
+
+    if "animation" in steps:
+        from eduvision.animation import build_animation, payload_size
+
+        fig, mesures["animation_ms"] = _ms(build_animation, df, "Literacy_Female_Adult", "Fertility_Rate")
+        mesures["animation_mo"] = round(payload_size(fig)[0] / 2**20, 2)
+
+    if "rf" in steps:
+        from eduvision.models import random_forest
+
+        X, y = random_forest.training_data(df)
+        rf, mesures["rf_ajustement_ms"] = _ms(random_forest._fit, X, y)
+        mesures["rf_prediction_ms"] = _median_ms(lambda p: random_forest.predict(rf, df, p),
+                                                 [(p,) for p in echantillon[:10]])
+
+    if "prophet" in steps:
+        from eduvision.models import prophet_model
+
+        prophet_model.init_worker()
+        mesures["prophet_pays_ms"] = _median_ms(lambda p: prophet_model.forecast(df, p),
+                                                [(p,) for p in echantillon[:3]])
+
+    if "lstm" in steps:
+        from eduvision.models import lstm_panel
+
+        _, mesures["lstm_ms"] = _ms(lstm_panel.forecast_all, df)
+
+    mesures["memoire_max_mo"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return {k: round(v, 3) if isinstance(v, float) else v for k, v in mesures.items()}
+
+
+def run(scales, steps, workdir, base=None, seed=0):
+    """Une ligne de résultats par facteur ; chaque mesure dans son propre processus."""
+    base_path = Path(base) if base else None
+    base_df = load_dataset(path=base_path)
+    rows = []
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"), max_tasks_per_child=1) as pool:
+        for scale in scales:
+            path = Path(workdir) / f"panel_x{scale}.parquet"
+            write_synthetic(generate(base_df, scale, seed=seed), path)
+            mesures = pool.submit(measure, path, steps, seed=seed).result()
+            rows.append({"facteur": scale, **mesures})
+            print(f" x{scale} : {mesures}", flush=True)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--steps", nargs="+", choices=STEPS, default=DEFAULT_STEPS)
+    parser.add_argument("--base", type=Path, help="Dataset de base (par défaut : dataset courant)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Fichier JSON lines où ajouter les résultats")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        rows = run(args.scales, args.steps, workdir, args.base, args.seed)
+    with pd.option_context("display.width", 250, "display.max_columns", None):
+        print(pd.DataFrame(rows).set_index("facteur").T.to_string())
+
+    if args.output:
+        contexte = {"date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "donnees": dataset_version(args.base)}
+        with args.output.open("a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps({**contexte, **row}, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
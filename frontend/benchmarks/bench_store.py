@@ -0,0 +1,93 @@
+# ===============================================
+# BENCHMARK : CSV vs PARQUET vs FEATHER (mmap)
+# ===============================================
+"""
+Compare le chargement à froid du dataset selon le format de stockage.
+
+Chaque mesure tourne dans un processus neuf (aucun cache, aucun import
+déjà payé) ; on relève le temps de lecture et la hausse du pic de mémoire
+résidente (RSS) provoquée par le chargement.
+
+Utilisation (depuis le dossier ``frontend``, après ``python -m eduvision.store``) ::
+
+    python -m benchmarks.bench_store --repeat 5
+"""
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+FORMATS = ["csv", "parquet", "feather-mmap"]
+
+
+def _peak_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _worker(fmt, dataset):
+    """Charge le dataset une fois dans le format demandé et affiche la mesure en JSON."""
+    import pandas as pd
+    import pyarrow.feather as feather
+    import pyarrow.parquet  # noqa: F401  (import exclu de la mesure)
+
+    from eduvision.data import DATA_DIR, apply_schema, columnar_path
+
+    csv_path = DATA_DIR / dataset
+    rss_before = _peak_rss_kb()
+    start = time.perf_counter()
+    if fmt == "csv":
+        df = apply_schema(pd.read_csv(csv_path))
+    elif fmt == "parquet":
+        df = pd.read_parquet(columnar_path(csv_path))
+    else:
+        df = feather.read_table(columnar_path(csv_path, ".feather"), memory_map=True).to_pandas()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "format": fmt,
+        "seconds": elapsed,
+        "rss_kb": _peak_rss_kb() - rss_before,
+        "rows": len(df),
+    }))
+
+
+def run(repeat, dataset):
+    """Lance ``repeat`` processus par format et retourne les médianes."""
+    results = []
+    for fmt in FORMATS:
+        runs = []
+        for _ in range(repeat):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_store", "--worker", fmt, "--dataset", dataset],
+                capture_output=True, text=True, check=True,
+            )
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        results.append({
+            "format": fmt,
+            "ms": statistics.median(r["seconds"] for r in runs) * 1000,
+            "rss_kb": statistics.median(r["rss_kb"] for r in runs),
+            "rows": runs[0]["rows"],
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--dataset", default="Africa_Education_Development_Top30_ClusterImputed.csv")
+    parser.add_argument("--worker", choices=FORMATS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        _worker(args.worker, args.dataset)
+        return
+
+    print(f"{'format':<14}{'lignes':>8}{'temps (ms)':>14}{'RSS (Ko)':>12}")
+    for r in run(args.repeat, args.dataset):
+        print(f"{r['format']:<14}{r['rows']:>8}{r['ms']:>14.2f}{r['rss_kb']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""
+Couche partagée d'AfricaEduVision (données, modèles, utilitaires)
+utilisée par les pages Streamlit du dossier ``frontend``.
+"""
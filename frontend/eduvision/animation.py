@@ -0,0 +1,138 @@
+# ===============================================
+# ANIMATION GAPMINDER (PAGE COMPARAISON)
+# ===============================================
+"""
+Figure animée « style Gapminder » construite une fois par paire d'axes.
+
+``px.scatter(..., animation_frame=...)`` coûte plusieurs secondes et produit
+un JSON où chaque image répète toute la définition des traces (modèle de
+survol, couleur, légende...). Ici :
+
+- la figure est mise en cache (:mod:`eduvision.figures`) par version des
+  données, axes et pas : un rerun ou une autre session la réutilise, sans
+  même la reconvertir en dictionnaire ;
+- les images ne gardent que ce qui change d'une année à l'autre
+  (positions, tailles, identifiants) ; l'année affichée au survol passe par
+  ``customdata`` ;
+- ``pas`` ne garde qu'une année sur ``pas`` (la dernière année est toujours
+  conservée) ;
+- sur un grand panel (tout le continent, données synthétiques ou
+  régionales), px crée une trace par couleur : au-delà de ``MAX_TRACES``
+  entités, les bulles sont colorées par cluster, et seules les
+  ``MAX_BULLES`` plus grosses (``SIZE`` moyen) sont animées.
+
+En mode distant (:mod:`eduvision.remote`), les lignes animées
+(:func:`animation_rows`) viennent de l'API : le dataset n'est pas lu par
+Streamlit, et seulement quand la figure n'est pas déjà en cache.
+
+:func:`payload_size` mesure la taille du JSON envoyé au navigateur, brut et
+compressé (gzip).
+"""
+import gzip
+
+import plotly.express as px
+import plotly.io as pio
+
+from eduvision import remote
+from eduvision.data import load_dataset
+from eduvision.figures import cached_figure
+
+SIZE = "GDP_per_capita"
+MAX_TRACES = 60     # Une couleur (donc une trace) par pays jusqu'à ce nombre d'entités
+MAX_BULLES = 1000   # Entités animées au plus
+# Attributs réellement animés : le reste des traces est défini une seule fois
+FRAME_KEYS = ("x", "y", "ids", "hovertext", "customdata")
+
+
+def decimate_years(df, pas):
+    """Garde une année sur ``pas`` (plus la dernière)."""
+    if pas <= 1:
+        return df
+    annees = sorted(df["Year"].unique())
+    gardees = set(annees[::pas]) | {annees[-1]}
+    return df[df["Year"].isin(gardees)]
+
+
+def _compact(fig):
+    """Allège les images : seuls les attributs animés y restent."""
+    for trace in fig.data:
+        trace.hovertemplate = trace.hovertemplate.replace(
+            f"Year={trace.customdata[0][0]}", "Year=%{customdata[0]}")
+    frames = []
+    for frame in fig.frames:
+        data = []
+        for trace in frame.data:
+            compact = {key: trace[key] for key in FRAME_KEYS if trace[key] is not None}
+            compact["marker"] = {"size": trace.marker.size}
+            data.append(compact)
+        frames.append({"name": frame.name, "data": data})
+    fig.frames = frames
+    return fig
+
+
+def limit_entities(df, max_bulles=MAX_BULLES):
+    """Garde les ``max_bulles`` entités dont la taille moyenne (``SIZE``) est la plus grande."""
+    moyennes = df.groupby("Country Name", observed=True)[SIZE].mean()
+    if len(moyennes) <= max_bulles:
+        return df
+    return df[df["Country Name"].isin(moyennes.nlargest(max_bulles).index)]
+
+
+def animation_rows(df, x, y, pas=1):
+    """Lignes et colonnes utiles à l'animation : années décimées, entités limitées."""
+    colonnes = list(dict.fromkeys(["Country Name", "Year", x, y, SIZE] + (["Cluster"] if "Cluster" in df else [])))
+    return limit_entities(decimate_years(df[colonnes], pas))
+
+
+def build_animation(df, x, y, labels=None, pas=1, title=None):
+    """Figure animée ``y`` en fonction de ``x`` (une image par année)."""
+    return _figure(animation_rows(df, x, y, pas), x, y, labels, title)
+
+
+def _figure(df, x, y, labels, title):
+    """Figure de lignes déjà préparées par :func:`animation_rows`."""
+    couleur = "Country Name"
+    if df["Country Name"].nunique() > MAX_TRACES:
+        couleur = None
+        if "Cluster" in df:
+            couleur = "Cluster"
+            df = df.assign(Cluster=df["Cluster"].astype(str))   # Couleurs discrètes
+    fig = px.scatter(
+        df,
+        x=x,
+        y=y,
+        animation_frame="Year",            # animation par année
+        animation_group="Country Name",    # chaque pays = une trajectoire
+        size=SIZE,                         # taille des bulles
+        color=couleur,                     # couleur par pays (par cluster sur un grand panel)
+        hover_name="Country Name",         # affichage au survol
+        custom_data=["Year"],              # année affichée au survol
+        log_x=False,
+        size_max=60,
+        labels=labels or {},
+        title=title,
+    )
+    return _compact(fig)
+
+
+def animation_figure(x, y, labels=None, pas=1, title=None, version=None):
+    """
+    Figure animée du dataset courant, construite une seule fois par paire d'axes.
+
+    La figure vient du cache commun (:mod:`eduvision.figures`) : elle est
+    partagée entre sessions et figée. En mode distant, ``version`` est la
+    version des données de l'API et les lignes sont demandées à l'API.
+    """
+    def build():
+        if remote.enabled():
+            return _figure(remote.animation(x, y, pas), x, y, labels, title)
+        return build_animation(load_dataset(), x, y, labels, pas, title)
+
+    state = {"x": x, "y": y, "labels": labels or {}, "pas": pas, "title": title}
+    return cached_figure("Comparaison/animation", state, build, version)
+
+
+def payload_size(fig):
+    """Taille du JSON de la figure en octets : ``(brut, gzip)``."""
+    payload = pio.to_json(fig, validate=False).encode()
+    return len(payload), len(gzip.compress(payload))
@@ -0,0 +1,121 @@
+# ===============================================
+# ACCÈS AUX DONNÉES (partagé par toutes les pages)
+# ===============================================
+"""
+Chargement unique du dataset pour tout le processus Streamlit.
+
+Le CSV est lu et typé une seule fois par processus, puis servi depuis la
+mémoire à chaque rerun et à chaque session. Le cache est indexé sur la date
+de modification du fichier : si le CSV est régénéré, il est relu
+automatiquement au prochain appel.
+
+La variable ``EDUVISION_DATASET`` remplace le dataset Top 30 par un autre
+fichier au même schéma (nom dans ``data/`` ou chemin, CSV ou Parquet) :
+dataset de tout le continent (``python -m pipeline.build --all-countries``)
+ou panel synthétique agrandi (``python -m pipeline.synthetic``). Toutes les
+pages, l'API et les caches (statistiques, figures, modèles, prévisions)
+suivent, puisqu'ils sont indexés sur :func:`dataset_version`.
+"""
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from eduvision.paths import DATA_DIR, DATASET_FILE, dataset_file  # noqa: F401  (réexportés)
+from eduvision.profiling import traced
+
+# ===============================================
+# CHEMINS ET SCHÉMA
+# ===============================================
+COLUMNAR_DIR = DATA_DIR / "columnar"   # Fichiers Parquet/Feather générés par eduvision.store
+
+ID_COLUMNS = ["Country Name", "Country Code"]
+REGION = "Region"   # Niveau infranational des panels régionaux (eduvision.regions)
+
+INDICATORS = [
+    "Literacy_Female_Adult",
+    "Literacy_Male_Adult",
+    "Literacy_Female_Youth",
+    "Literacy_Male_Youth",
+    "GDP_per_capita",
+    "Education_Expenditure",
+    "Urban_Population",
+    "Poverty",
+    "Child_Marriage_Under18",
+    "Child_Marriage_Under15",
+    "Net_Migration",
+    "Fertility_Rate",
+]
+
+
+def apply_schema(df):
+    """Applique les types compacts : pays en catégories, années en int16, indicateurs en float32."""
+    df = df.copy()
+    for col in ID_COLUMNS + [REGION]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if "Year" in df.columns:
+        df["Year"] = df["Year"].astype("int16")
+    if "Cluster" in df.columns:
+        df["Cluster"] = df["Cluster"].astype("int8")
+    valeurs = [col for col in df.columns if col not in ID_COLUMNS + [REGION, "Year", "Cluster"]]
+    df[valeurs] = df[valeurs].astype("float32")
+    return df
+
+
+def columnar_path(csv_path, suffix=".parquet"):
+    """Chemin du fichier colonne (``<dossier du CSV>/columnar/``) correspondant à un CSV."""
+    csv_path = Path(csv_path)
+    return csv_path.parent / COLUMNAR_DIR.name / csv_path.with_suffix(suffix).name
+
+
+def _resolve_source(csv_path):
+    """Préfère le Parquet s'il existe et n'est pas plus ancien que le CSV."""
+    parquet = columnar_path(csv_path)
+    if parquet.exists() and (
+        not csv_path.exists() or parquet.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns
+    ):
+        return parquet
+    return csv_path
+
+
+# ===============================================
+# CACHE PROCESSUS
+# ===============================================
+@lru_cache(maxsize=32)
+def _read_dataset(path, mtime_ns, columns):
+    """Lit et type le fichier ; ``mtime_ns`` fait partie de la clé de cache."""
+    columns = list(columns) if columns is not None else None
+    if path.endswith(".parquet"):
+        # Le schéma est déjà stocké dans le Parquet (catégories, int16, float32)
+        return pd.read_parquet(path, columns=columns)
+    return apply_schema(pd.read_csv(path, usecols=columns))
+
+
+@traced("données:chargement")
+def load_dataset(columns=None, path=None):
+    """
+    Retourne le dataset typé, lu une seule fois par processus.
+
+    ``columns`` limite la lecture aux colonnes utiles (projection) ; le
+    Parquet de ``data/columnar`` est utilisé s'il est à jour, sinon le CSV.
+    Le DataFrame renvoyé est une copie superficielle du cache : il ne coûte
+    rien à créer et, avec le Copy-on-Write de pandas 3, toute écriture crée
+    sa propre copie au lieu d'altérer les données partagées.
+    """
+    path = Path(path) if path is not None else _resolve_source(dataset_file())
+    columns = tuple(columns) if columns is not None else None
+    mtime_ns = path.stat().st_mtime_ns
+    return _read_dataset(str(path), mtime_ns, columns).copy(deep=False)
+
+
+@lru_cache(maxsize=8)
+def _file_hash(path, mtime_ns):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def dataset_version(path=None):
+    """Empreinte (sha256 abrégé) du fichier source : change dès que les données changent."""
+    path = Path(path) if path is not None else dataset_file()
+    return _file_hash(str(path), path.stat().st_mtime_ns)[:12]
@@ -0,0 +1,176 @@
+# ===============================================
+# CACHE DE FIGURES (TOUTES LES PAGES)
+# ===============================================
+"""
+Figures Plotly partagées entre reruns et sessions.
+
+Une figure est identifiée par sa page et l'état de ses widgets (pays, années,
+indicateurs...) : la clé est l'empreinte sha256 d'un JSON canonique de cet
+état et de la version des données. Deux niveaux :
+
+- mémoire : LRU borné en octets (taille du JSON de chaque figure) ;
+- disque (facultatif) : ``data/figures/<clé>.json.gz``, pour survivre à un
+  redémarrage du serveur ; nombre de fichiers borné, les plus anciens
+  (dernier accès) sont supprimés.
+
+Les figures sont servies sous forme de :class:`FrozenFigure` : leur
+dictionnaire est calculé une seule fois, ``st.plotly_chart`` n'a plus qu'à
+l'encoder en JSON. Les compteurs de succès/échecs sont lisibles avec
+``figure_cache.stats()``.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from eduvision.data import DATA_DIR, dataset_version
+from eduvision.profiling import span
+
+FIGURE_DIR = DATA_DIR / "figures"
+
+
+class FrozenFigure(go.Figure):
+    """
+    Figure en lecture seule : enveloppe d'un dictionnaire Plotly déjà calculé.
+
+    ``st.plotly_chart`` appelle ``to_dict()`` (copie profonde de toutes les
+    traces) à chaque rerun ; ici il reçoit directement le dictionnaire. Pour
+    modifier la figure, en faire une copie avec ``go.Figure(fig.to_dict())``.
+    """
+
+    def __init__(self, figure):
+        super().__init__()
+        self._frozen = figure.to_dict() if isinstance(figure, go.Figure) else figure
+
+    def to_dict(self):
+        return self._frozen
+
+    def to_plotly_json(self):
+        return self._frozen
+
+
+def cache_key(page, state, version=None):
+    """Empreinte canonique de (page, état des widgets, version des données)."""
+    canonical = json.dumps({"page": page, "state": state, "version": version or dataset_version()},
+                           sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+class FigureCache:
+    """Cache LRU de figures en mémoire (borné en octets), avec niveau disque facultatif."""
+
+    def __init__(self, max_bytes=64 * 2**20, disk_dir=None, max_disk_files=500):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_files = max_disk_files
+        self._entries = OrderedDict()   # clé -> (FrozenFigure, taille en octets)
+        self._size = 0
+        self._lock = threading.Lock()
+        self._counters = {"memoire": 0, "disque": 0, "absent": 0}
+
+    # -- niveau mémoire ------------------------------------------------
+    def _remember(self, key, figure, size):
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (figure, size)
+            self._size += size
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def _from_memory(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counters["memoire"] += 1
+                return entry[0]
+        return None
+
+    # -- niveau disque -------------------------------------------------
+    def _disk_path(self, key):
+        return self.disk_dir / f"{key}.json.gz"
+
+    def _from_disk(self, key):
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            payload = gzip.decompress(path.read_bytes())
+            figure = FrozenFigure(json.loads(payload))
+            os.utime(path)   # Date d'accès pour l'éviction
+        except (OSError, EOFError, ValueError):
+            # Absent, ou écrit à moitié : la figure sera reconstruite
+            return None
+        with self._lock:
+            self._counters["disque"] += 1
+        return figure, len(payload)
+
+    def _to_disk(self, key, payload):
+        if self.disk_dir is None:
+            return
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.disk_dir / f".{key}.tmp"
+        tmp.write_bytes(gzip.compress(payload))
+        tmp.replace(self._disk_path(key))
+        files = sorted(self.disk_dir.glob("*.json.gz"), key=lambda p: p.stat().st_mtime_ns)
+        for old in files[:max(0, len(files) - self.max_disk_files)]:
+            old.unlink(missing_ok=True)
+
+    # -- API -----------------------------------------------------------
+    def get_or_build(self, page, state, build, version=None):
+        """
+        Figure de ``page`` pour l'état ``state`` des widgets.
+
+        ``build()`` n'est appelé qu'en l'absence de la figure dans les deux
+        niveaux ; il renvoie une ``go.Figure`` (ou son dictionnaire).
+        ``version`` remplace la version du dataset local (données de l'API
+        en mode distant).
+        """
+        with span(f"figure:{page}") as attributs:
+            key = cache_key(page, state, version)
+            figure = self._from_memory(key)
+            if figure is not None:
+                attributs["niveau"] = "memoire"
+                return figure
+            found = self._from_disk(key)
+            if found is not None:
+                attributs["niveau"] = "disque"
+                self._remember(key, *found)
+                return found[0]
+
+            attributs["niveau"] = "absent"
+            with self._lock:
+                self._counters["absent"] += 1
+            with span("figure:construction"):
+                figure = FrozenFigure(build())
+            with span("figure:sérialisation"):
+                payload = pio.to_json(figure.to_dict(), validate=False).encode()
+            self._remember(key, figure, len(payload))
+            self._to_disk(key, payload)
+            return figure
+
+    def stats(self):
+        """Compteurs de succès (mémoire, disque) et d'échecs, et occupation mémoire."""
+        with self._lock:
+            return {**self._counters, "entrees": len(self._entries), "octets": self._size}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Cache commun à toutes les pages (un par processus Streamlit)
+figure_cache = FigureCache(disk_dir=FIGURE_DIR)
+
+
+def cached_figure(page, state, build, version=None):
+    """Raccourci : :meth:`FigureCache.get_or_build` sur le cache commun."""
+    return figure_cache.get_or_build(page, state, build, version)
@@ -0,0 +1,165 @@
+# ===============================================
+# STOCK DE PRÉVISIONS PRÉCALCULÉES
+# ===============================================
+"""
+Prévisions calculées hors ligne pour les 30 pays et tous les modèles du registre.
+
+Le lot d'entraînement écrit un dossier versionné
+``data/forecasts/<version>/`` contenant ``forecasts.parquet`` (valeur prévue
+et intervalle par modèle, pays et année) et ``manifest.json``. La version
+combine l'empreinte du dataset et ``MODELS_VERSION`` : dès que les données ou
+les modèles changent, le stock devient périmé et la page Prévisions revient
+à l'entraînement en direct.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m eduvision.forecast_store --models prophet rf lstm lstm_panel --workers 4
+"""
+import argparse
+import json
+import shutil
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import pandas as pd
+
+from eduvision import models
+from eduvision.data import DATA_DIR, dataset_version, load_dataset
+from eduvision.models.base import FORECAST_COLUMNS, LITERACY, TARGET
+from eduvision.profiling import traced
+
+FORECAST_DIR = DATA_DIR / "forecasts"
+FORECAST_FILE = "forecasts.parquet"
+MANIFEST_FILE = "manifest.json"
+KEY_COLUMNS = ["model", "Country Name", "indicator"]
+
+# À incrémenter dès qu'un modèle ou ses hyperparamètres changent
+MODELS_VERSION = 4
+
+
+def store_version(data_version=None):
+    """Version du stock correspondant aux données et aux modèles actuels."""
+    return f"{data_version or dataset_version()}-m{MODELS_VERSION}"
+
+
+# ===============================================
+# CONSTRUCTION (LOT HORS LIGNE)
+# ===============================================
+def _global_predictor(name, df):
+    """Fonction pays -> prévision pour un modèle global, entraîné une seule fois ici ; sinon ``None``."""
+    # Modules importés à la demande : lire le stock ne charge aucune librairie de modèle
+    if name == "rf":
+        random_forest = models.get("rf")
+        rf = random_forest.fit(df)
+        return lambda pays: random_forest.predict(rf, df, pays)
+    return None
+
+
+def build_forecasts(df, model_names=tuple(models.MODEL_LABELS), countries=None,
+                    workers=None, prophet_indicators=(TARGET,), log=print):
+    """
+    Entraîne les modèles demandés pour chaque pays ; retourne (prévisions, durées par modèle).
+
+    Prophet est ajusté en parallèle sur ``workers`` processus, pour chaque
+    indicateur de ``prophet_indicators`` ; les autres modèles passent par
+    ``models.forecast_many`` (un seul entraînement pour le LSTM commun, un
+    processus par réseau pour le LSTM pays par pays).
+    """
+    countries = countries or sorted(df["Country Name"].unique())
+    frames, durations = [], {}
+    for name in model_names:
+        start = time.perf_counter()
+        if name == "prophet":
+            previsions = models.get("prophet").forecast_all(df, countries, prophet_indicators, workers)
+            frames.append(previsions.assign(model=name))
+        else:
+            previsions, _ = models.forecast_many(name, df, countries, _global_predictor(name, df), workers)
+            for pays, prevision in previsions.items():
+                if isinstance(prevision, str):
+                    log(f"[{name}] {pays} ignoré : {prevision}")
+                    continue
+                frames.append(prevision.assign(model=name, indicator=TARGET, **{"Country Name": pays}))
+        durations[name] = round(time.perf_counter() - start, 2)
+        log(f"[{name}] {len(countries)} pays en {durations[name]} s")
+    return pd.concat(frames, ignore_index=True), durations
+
+
+def write_store(forecasts, version, durations=None):
+    """Écrit le stock ``version`` de façon atomique (dossier temporaire puis renommage)."""
+    target = FORECAST_DIR / version
+    tmp = FORECAST_DIR / f".{version}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    # Un lot partiel (quelques modèles ou pays) complète le stock existant de la même version
+    previous = target / FORECAST_FILE
+    if previous.exists():
+        old = pd.read_parquet(previous)
+        keys = pd.MultiIndex.from_frame(forecasts[KEY_COLUMNS]).unique()
+        old = old[~pd.MultiIndex.from_frame(old[KEY_COLUMNS]).isin(keys)]
+        forecasts = pd.concat([old, forecasts], ignore_index=True)
+        old_manifest = json.loads((target / MANIFEST_FILE).read_text())
+        durations = {**old_manifest.get("training_seconds", {}), **(durations or {})}
+
+    forecasts.to_parquet(tmp / FORECAST_FILE, index=False)
+    manifest = {
+        "version": version,
+        "models_version": MODELS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "models": sorted(forecasts["model"].unique()),
+        "countries": sorted(forecasts["Country Name"].unique()),
+        "indicators": sorted(forecasts["indicator"].unique()),
+        "training_seconds": durations or {},
+    }
+    (tmp / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2, ensure_ascii=False))
+
+    shutil.rmtree(target, ignore_errors=True)
+    tmp.rename(target)
+    return target
+
+
+# ===============================================
+# LECTURE (PAGE PRÉVISIONS)
+# ===============================================
+@lru_cache(maxsize=4)
+def _read_store(path, mtime_ns):
+    """Charge le stock une fois par processus, indexé par (modèle, pays, indicateur)."""
+    forecasts = pd.read_parquet(path)
+    return {
+        key: group[FORECAST_COLUMNS].reset_index(drop=True)
+        for key, group in forecasts.groupby(KEY_COLUMNS, observed=True)
+    }
+
+
+@traced("prévision:stock")
+def load_forecast(model, pays, indicator=TARGET, version=None):
+    """Prévision précalculée de ``pays`` pour ``model`` ; ``None`` si absente ou périmée."""
+    path = FORECAST_DIR / (version or store_version()) / FORECAST_FILE
+    if not path.exists():
+        return None
+    return _read_store(str(path), path.stat().st_mtime_ns).get((model, pays, indicator))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Précalcule les prévisions de tous les pays.")
+    parser.add_argument("--models", nargs="+", choices=list(models.MODEL_LABELS),
+                        default=list(models.MODEL_LABELS))
+    parser.add_argument("--countries", nargs="+", help="Pays à traiter (par défaut : tous)")
+    parser.add_argument("--workers", type=int,
+                        help="Processus pour Prophet et le LSTM pays par pays (par défaut : nombre de cœurs)")
+    parser.add_argument("--all-literacy", action="store_true",
+                        help="Prophet aussi pour les alphabétisations hommes/jeunes")
+    args = parser.parse_args(argv)
+
+    df = load_dataset()
+    forecasts, durations = build_forecasts(
+        df, args.models, args.countries, args.workers,
+        LITERACY if args.all_literacy else (TARGET,),
+    )
+    target = write_store(forecasts, store_version(), durations)
+    print(f"Stock écrit : {target}")
+
+
+if __name__ == "__main__":
+    main()
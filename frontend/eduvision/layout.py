@@ -0,0 +1,196 @@
+# ===============================================
+# EN-TÊTE COMMUN DES PAGES (CSS, LOGO, MENU)
+# ===============================================
+"""
+CSS, en-tête (logo + titre) et menu partagés par toutes les pages.
+
+Le bloc HTML de chaque page est assemblé une seule fois par processus puis
+envoyé en un seul ``st.markdown`` à chaque rerun.
+
+Le logo n'est plus intégré en base64 à chaque rerun (plus d'un Mo par
+page) : une miniature à la taille d'affichage est écrite une fois dans
+``frontend/static/`` sous un nom contenant son empreinte, puis servie par
+Streamlit (``server.enableStaticServing``, voir ``.streamlit/config.toml``)
+avec ``ETag``/``Last-Modified`` : le navigateur la garde en cache d'une page
+à l'autre, et l'empreinte dans le nom garantit qu'un nouveau logo ne sera
+jamais confondu avec l'ancien. Si le service statique est désactivé, la
+miniature est intégrée en URI ``data:``, encodée une seule fois par
+processus.
+"""
+import base64
+import hashlib
+import io
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+from eduvision.profiling import span
+
+FRONTEND_DIR = Path(__file__).resolve().parents[1]
+LOGO_FILE = FRONTEND_DIR / "Images" / "AfricaEduVision.png"
+STATIC_DIR = FRONTEND_DIR / "static"   # Dossier servi par Streamlit sous app/static/
+LOGO_PX = 130                          # Deux fois la taille affichée (écrans haute densité)
+
+MENU = [
+    ("/", "Accueil"),
+    ("/EDA", "Analyse exploratoire"),
+    ("/Predictions", "Prévisions"),
+    ("/Comparaison", "Comparaisons"),
+    ("/Methodologie", "Méthodologie"),
+    ("/Conclusion", "Conclusion"),
+]
+
+CSS = """
+/* HEADER (logo + titre) */
+.header {
+    display: flex;
+    align-items: center;
+    background-color: #ECF0F1;
+    padding: 15px 25px;
+    border-radius: 8px;
+    margin-bottom: 10px;
+}
+.logo {
+    width: 65px; height: 65px;
+    border-radius: 50%;
+    margin-right: 20px;
+    object-fit: cover;
+}
+.title-block {
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+}
+.main-title {
+    font-size: 28px;
+    font-weight: bold;
+    color: #1ABC9C;
+    margin: 0;
+}
+.subtitle {
+    font-size: 14px;
+    color: #2C3E50;
+    margin: 0;
+}
+
+/* MENU de navigation */
+.menu {
+    display: flex;
+    justify-content: center;
+    gap: 15px;
+    margin-top: 15px;
+}
+.menu a {
+    background-color: white;
+    color: #1ABC9C !important;
+    padding: 6px 14px;
+    border-radius: 6px;
+    font-weight: bold;
+    text-decoration: none;
+    transition: 0.3s;
+    border: 1px solid #1ABC9C;
+}
+.menu a:hover {
+    background-color: #16A085;
+    color: white !important;
+    transform: scale(1.05);
+}
+
+/* CHIFFRES CLÉS (Accueil, Conclusion) */
+.metrics {
+    display: flex;
+    justify-content: space-around;
+    margin-top: 40px;
+    padding: 20px;
+    background-color: #ECF0F1;
+    border-radius: 10px;
+}
+.metric {
+    text-align: center;
+    font-size: 18px;
+    font-weight: bold;
+}
+.metric-value {
+    font-size: 26px;
+    color: #1F618D;
+    margin-top: 5px;
+}
+.section {
+    margin-top: 30px;
+    margin-bottom: 20px;
+}
+"""
+
+# Sidebar native (remplacée par le menu)
+HIDE_SIDEBAR_CSS = """
+[data-testid="stSidebarNav"] {display: none;}
+[data-testid="stSidebar"] {display: none;}
+"""
+
+# Menu, pied de page et barre d'outils de Streamlit
+HIDE_STREAMLIT_CSS = """
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+header {visibility: hidden;}
+"""
+
+
+# ===============================================
+# LOGO
+# ===============================================
+@lru_cache(maxsize=1)
+def logo_png():
+    """Miniature PNG du logo (``LOGO_PX`` de côté au plus), calculée une fois par processus."""
+    from PIL import Image   # dépendance de Streamlit
+
+    with Image.open(LOGO_FILE) as image:
+        image.thumbnail((LOGO_PX, LOGO_PX))
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=2)
+def logo_url(static_serving):
+    """URL du logo : fichier statique versionné par son empreinte, sinon URI ``data:``."""
+    data = logo_png()
+    if not static_serving:
+        return "data:image/png;base64," + base64.b64encode(data).decode()
+    name = f"AfricaEduVision-{hashlib.sha256(data).hexdigest()[:12]}.png"
+    path = STATIC_DIR / name
+    if not path.exists():
+        STATIC_DIR.mkdir(exist_ok=True)
+        tmp = STATIC_DIR / f".{name}.tmp"
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    return f"app/static/{name}"
+
+
+# ===============================================
+# EN-TÊTE + MENU
+# ===============================================
+@lru_cache(maxsize=32)
+def chrome_html(subtitle, logo, hide_sidebar=False, hide_streamlit=False):
+    """Bloc HTML complet (style, en-tête, menu) d'une page."""
+    style = CSS + (HIDE_SIDEBAR_CSS if hide_sidebar else "") + (HIDE_STREAMLIT_CSS if hide_streamlit else "")
+    liens = "\n".join(f'    <a href="{href}">{label}</a>' for href, label in MENU)
+    return f"""<style>{style}</style>
+<div class="header">
+    <img src="{logo}" class="logo">
+    <div class="title-block">
+        <p class="main-title">AfricaEduVision</p>
+        <p class="subtitle">{subtitle}</p>
+    </div>
+</div>
+<div class="menu">
+{liens}
+</div>
+"""
+
+
+def page_header(subtitle, hide_sidebar=False, hide_streamlit=False):
+    """Affiche le style, l'en-tête et le menu de la page en un seul élément."""
+    with span("mise_en_page:en_tête"):
+        logo = logo_url(bool(st.get_option("server.enableStaticServing")))
+        st.markdown(chrome_html(subtitle, logo, hide_sidebar, hide_streamlit), unsafe_allow_html=True)
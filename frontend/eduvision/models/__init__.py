@@ -0,0 +1,136 @@
+"""
+Modèles de prévision de l'alphabétisation des femmes adultes.
+
+Chaque modèle est un module exposant ``forecast(df, pays)`` qui renvoie une
+prévision au format commun défini dans :mod:`eduvision.models.base`.
+
+Les modèles sont déclarés dans un registre par le chemin de leur module et
+ne sont importés qu'au premier ``get`` : importer ce paquet ne charge ni
+Prophet, ni scikit-learn, ni TensorFlow.
+
+``forecast_many`` prévoit plusieurs pays à la fois, dans un pool de threads
+ou de processus selon le modèle (champ ``pool`` du registre), en série
+quand un seul worker est disponible, ou avec un seul entraînement commun à
+tous les pays pour un modèle « panel ».
+"""
+import functools
+import importlib
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+
+from eduvision.models.base import FORECAST_COLUMNS, HORIZON, TARGET
+from eduvision.profiling import span
+
+Forecaster = namedtuple("Forecaster", ["label", "module", "pool"])
+
+# Clé courte du modèle -> libellé affiché et module qui l'implémente
+FORECASTERS = {}
+
+
+def register(key, label, module, pool="thread"):
+    """
+    Déclare un modèle ; ``module`` n'est importé qu'à sa première utilisation.
+
+    ``pool`` indique comment entraîner plusieurs pays : en parallèle,
+    ``"thread"`` si l'entraînement libère le GIL, ``"process"`` sinon (la
+    fonction ``init_worker()`` du module, si elle existe, initialise alors
+    chaque processus une fois) ;
+    ``"panel"`` pour un modèle entraîné une seule fois sur tous les pays,
+    dont le module expose ``forecast_all_cached(df)`` (``{pays: prévision}``).
+    """
+    FORECASTERS[key] = Forecaster(label, module, pool)
+
+
+# Le pré/post-traitement Python de Prophet garde le GIL : des threads ne gagnent presque rien.
+# Processus initialisés une fois (backend Stan chargé) : gain proportionnel au nombre de cœurs.
+register("prophet", "Prophet (Séries temporelles)", "eduvision.models.prophet_model", pool="process")
+register("rf", "Random Forest (Machine Learning)", "eduvision.models.random_forest", pool="thread")
+# Un réseau par pays : chaque entraînement TensorFlow dans son propre processus
+register("lstm", "LSTM (Deep Learning)", "eduvision.models.lstm", pool="process")
+# Réseau commun à tous les pays : un seul entraînement sert toutes les prévisions
+register("lstm_panel", "LSTM commun (Deep Learning)", "eduvision.models.lstm_panel", pool="panel")
+
+MODEL_LABELS = {key: spec.label for key, spec in FORECASTERS.items()}
+
+
+def get(key):
+    """Module du modèle ``key``, importé à la demande."""
+    return importlib.import_module(FORECASTERS[key].module)
+
+
+def forecast(model, df, pays):
+    """Entraîne le modèle ``model`` (clé du registre) et prévoit pour ``pays``."""
+    with span(f"modèle:{model}", pays=pays):
+        return get(model).forecast(df, pays)
+
+
+def _init_process(module):
+    """Initialisation d'un processus du pool : ``init_worker()`` du module du modèle, s'il en a une."""
+    init_worker = getattr(importlib.import_module(module), "init_worker", None)
+    if init_worker is not None:
+        init_worker()
+
+
+def timed(predict, pays):
+    """``(prévision ou message d'erreur, durée en ms)`` de ``predict(pays)``."""
+    start = time.perf_counter()
+    try:
+        result = predict(pays)
+    except ValueError as exc:
+        result = str(exc)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def forecast_many(model, df, countries, predict=None, workers=None):
+    """
+    Prévisions de plusieurs pays, calculées en parallèle.
+
+    ``predict(pays)`` remplace l'entraînement pays par pays quand un modèle
+    déjà ajusté est en mémoire (Random Forest global, LSTM commun) : il est
+    alors appelé dans des threads. Un modèle « panel » est entraîné une seule
+    fois pour tous les pays (``forecast_all_cached``, partagé par les appels
+    suivants sur les mêmes données). Sinon ``forecast(model, df, pays)``
+    tourne dans le pool déclaré pour le modèle (threads ou processus
+    « spawn », un par cœur par défaut), ou en série dans le processus courant
+    s'il n'y a qu'un seul worker (machine à un cœur, ou un seul pays).
+
+    Retourne ``(previsions, durees)`` : ``{pays: DataFrame}`` (ou le message
+    d'erreur si le pays n'a pas assez d'historique) et ``{pays: ms}``.
+    """
+    countries = list(countries)
+    if not countries:
+        return {}, {}
+    pool = "thread" if predict is not None else FORECASTERS[model].pool
+    if pool == "panel":
+        # Un seul entraînement pour tout le lot : sa durée vaut pour chaque pays
+        start = time.perf_counter()
+        with span(f"modèle:{model}:lot", pays=len(countries), pool=pool):
+            panel = get(model).forecast_all_cached(df)
+        ms = (time.perf_counter() - start) * 1000
+        return ({pays: panel.get(pays, "Pas assez de données pour entraîner le modèle.") for pays in countries},
+                dict.fromkeys(countries, ms))
+
+    predict = predict or functools.partial(forecast, model, df)
+    # Processus : un par cœur (TensorFlow ou Stan par processus) ; threads : 8 au plus
+    workers = min(len(countries), workers or ((os.cpu_count() or 1) if pool == "process" else 8))
+
+    if workers <= 1:
+        # Un seul cœur ou un seul pays : démarrer un pool (et réimporter Stan ou
+        # TensorFlow dans un processus neuf) coûterait plus que le calcul en série
+        with span(f"modèle:{model}:lot", pays=len(countries), pool="série"):
+            results = [timed(predict, pays) for pays in countries]
+        return ({pays: result for pays, (result, _) in zip(countries, results)},
+                {pays: ms for pays, (_, ms) in zip(countries, results)})
+
+    if pool == "process":
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                                       initializer=_init_process, initargs=(FORECASTERS[model].module,))
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    with span(f"modèle:{model}:lot", pays=len(countries), pool=pool), executor:
+        results = list(executor.map(timed, [predict] * len(countries), countries))
+    return ({pays: result for pays, (result, _) in zip(countries, results)},
+            {pays: ms for pays, (_, ms) in zip(countries, results)})
@@ -0,0 +1,31 @@
+"""
+Éléments communs aux modèles de prévision : cible, horizon et format de sortie.
+
+Chaque modèle renvoie un DataFrame ``FORECAST_COLUMNS`` (année, valeur prévue,
+bornes basse et haute de l'intervalle), ce qui permet de stocker et
+d'afficher les prévisions de la même façon quel que soit le modèle.
+"""
+import pandas as pd
+
+TARGET = "Literacy_Female_Adult"   # Variable prédite : alphabétisation des femmes adultes
+HORIZON = 2030                     # Dernière année prévue
+FORECAST_COLUMNS = ["Year", "yhat", "yhat_lower", "yhat_upper"]
+
+# Indicateurs d'alphabétisation (Prophet peut tous les prévoir)
+LITERACY = ["Literacy_Female_Adult", "Literacy_Male_Adult",
+            "Literacy_Female_Youth", "Literacy_Male_Youth"]
+
+
+def country_series(df, pays, colonne=TARGET):
+    """Série historique (Year, colonne) d'un pays, sans valeurs manquantes."""
+    return df[df["Country Name"] == pays][["Year", colonne]].dropna()
+
+
+def forecast_frame(years, yhat, lower, upper):
+    """Assemble une prévision au format commun."""
+    return pd.DataFrame({
+        "Year": pd.Series(years, dtype="int16"),
+        "yhat": yhat,
+        "yhat_lower": lower,
+        "yhat_upper": upper,
+    })
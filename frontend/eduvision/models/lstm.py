@@ -0,0 +1,56 @@
+"""Prévision par réseau de neurones récurrent (LSTM)."""
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler
+from tensorflow.keras.layers import LSTM, Dense
+from tensorflow.keras.models import Sequential
+
+from eduvision.models.base import HORIZON, TARGET, country_series, forecast_frame
+from eduvision.models.rollout import shared_rollout
+
+WINDOW = 3            # Fenêtre de 3 ans
+MIN_HISTORY = 10      # Historique minimum pour entraîner le réseau
+
+
+def forecast(df, pays):
+    """Entraîne un LSTM sur la série du pays et prévoit jusqu'à ``HORIZON``."""
+    df_pays = country_series(df, pays)
+    if len(df_pays) < MIN_HISTORY:
+        raise ValueError("Pas assez de données pour entraîner un LSTM.")
+
+    # Normalisation des valeurs
+    data = df_pays[TARGET].to_numpy(dtype="float64").reshape(-1, 1)
+    scaler = MinMaxScaler(feature_range=(0, 1))
+    scaled_data = scaler.fit_transform(data)
+
+    # Création des séquences
+    X, y_seq = [], []
+    for i in range(WINDOW, len(scaled_data)):
+        X.append(scaled_data[i-WINDOW:i, 0])
+        y_seq.append(scaled_data[i, 0])
+    X, y_seq = np.array(X), np.array(y_seq)
+    X = np.reshape(X, (X.shape[0], X.shape[1], 1))
+
+    # Modèle LSTM
+    model = Sequential()
+    model.add(LSTM(50, return_sequences=True, input_shape=(X.shape[1], 1)))
+    model.add(LSTM(50))
+    model.add(Dense(1))
+    model.compile(optimizer="adam", loss="mean_squared_error")
+    model.fit(X, y_seq, epochs=50, batch_size=1, verbose=0)
+
+    # Erreur d'ajustement, utilisée comme largeur de l'intervalle (±1,96 écart-type)
+    residus = scaler.inverse_transform(model.predict(X, verbose=0)) - scaler.inverse_transform(y_seq.reshape(-1, 1))
+    marge = 1.96 * float(np.std(residus))
+
+    # Prévisions futures jusqu'à l'horizon (boucle récursive compilée une fois pour tous les pays)
+    last_year = int(df_pays["Year"].max())
+    rollout = shared_rollout(model)
+    predictions = rollout(scaled_data[-WINDOW:, 0][None, :], HORIZON - last_year, weights=model.get_weights())[0]
+
+    # Inverser la normalisation
+    yhat = scaler.inverse_transform(predictions.reshape(-1, 1)).flatten()
+    prevision = forecast_frame(np.arange(last_year + 1, HORIZON + 1), yhat, yhat - marge, yhat + marge)
+    stats = rollout.stats()
+    prevision.attrs["inference_ms"] = stats["per_forecast_ms"]   # À chaud, traçage exclu
+    prevision.attrs["trace_ms"] = stats["trace_ms"]
+    return prevision
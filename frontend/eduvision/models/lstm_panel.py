@@ -0,0 +1,151 @@
+"""
+LSTM « panel » : un seul réseau entraîné sur les 30 pays à la fois.
+
+Les séries de tous les pays sont rangées dans une matrice (pays, années),
+normalisées pays par pays, puis découpées en fenêtres glissantes avec
+``sliding_window_view`` (aucune boucle Python sur les fenêtres). Le réseau
+reçoit en plus un plongement (embedding) du pays, ce qui lui permet de
+partager l'apprentissage tout en gardant un niveau propre à chaque pays.
+L'entraînement se fait par lots de taille réaliste et la prévision de tous
+les pays passe par une seule boucle compilée (:mod:`eduvision.models.rollout`).
+
+:func:`forecast_all_cached` garde en mémoire les prévisions des derniers
+panels entraînés (clé : empreinte des séries) : :func:`forecast` et
+``models.forecast_many`` n'entraînent le réseau qu'une fois par jeu de données.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from tensorflow.keras.layers import LSTM, Concatenate, Dense, Embedding, Flatten, Input
+from tensorflow.keras.models import Model
+
+from eduvision.models.base import HORIZON, TARGET, forecast_frame
+from eduvision.models.lstm import MIN_HISTORY, WINDOW
+from eduvision.models.rollout import shared_rollout
+from eduvision.profiling import traced
+
+EPOCHS = 100
+BATCH_SIZE = 32
+EMBEDDING_DIM = 4
+CACHED_PANELS = 2   # Jeux de données dont les prévisions restent en mémoire
+
+_panels = OrderedDict()   # empreinte des séries -> {pays: prévision}
+_panels_lock = threading.Lock()
+
+
+def panel_matrix(df):
+    """Matrice (pays, années) de la cible ; NaN là où la donnée manque."""
+    matrix = df.pivot_table(index="Country Name", columns="Year", values=TARGET, observed=True)
+    counts = matrix.notna().sum(axis=1)
+    matrix = matrix[counts >= MIN_HISTORY]
+    return matrix.index.tolist(), matrix.columns.to_numpy(dtype="int64"), matrix.to_numpy(dtype="float64")
+
+
+def scale(values):
+    """Normalisation min-max par pays ; retourne (valeurs normalisées, minimum, étendue)."""
+    low = np.nanmin(values, axis=1, keepdims=True)
+    span = np.nanmax(values, axis=1, keepdims=True) - low
+    span[span == 0] = 1.0
+    return (values - low) / span, low, span
+
+
+def windows(scaled):
+    """Fenêtres (entrées, cible, pays) de tous les pays, sans boucle sur les années."""
+    # (pays, positions, WINDOW + 1) : WINDOW années d'entrée puis l'année cible
+    view = sliding_window_view(scaled, WINDOW + 1, axis=1)
+    country_ids = np.broadcast_to(np.arange(scaled.shape[0])[:, None], view.shape[:2])
+    complete = ~np.isnan(view).any(axis=2)
+    samples = view[complete]
+    return samples[:, :WINDOW, None], samples[:, WINDOW], country_ids[complete]
+
+
+def build_model(n_countries):
+    """Deux couches LSTM sur la fenêtre, concaténées au plongement du pays."""
+    sequence = Input(shape=(WINDOW, 1), name="sequence")
+    country = Input(shape=(1,), dtype="int32", name="country")
+
+    x = LSTM(50, return_sequences=True)(sequence)
+    x = LSTM(50)(x)
+    e = Flatten()(Embedding(n_countries, EMBEDDING_DIM)(country))
+    output = Dense(1)(Concatenate()([x, e]))
+
+    model = Model(inputs=[sequence, country], outputs=output)
+    model.compile(optimizer="adam", loss="mean_squared_error")
+    return model
+
+
+def last_windows(scaled):
+    """Dernière fenêtre complète de chaque pays et année correspondante (indice de colonne)."""
+    last_index = scaled.shape[1] - 1 - np.argmax(~np.isnan(scaled[:, ::-1]), axis=1)
+    offsets = last_index[:, None] - np.arange(WINDOW - 1, -1, -1)[None, :]
+    return np.take_along_axis(scaled, offsets, axis=1), last_index
+
+
+@traced("modèle:lstm:entraînement")
+def forecast_all(df, epochs=EPOCHS, batch_size=BATCH_SIZE):
+    """Entraîne le réseau commun et retourne ``{pays: prévision}`` pour tous les pays."""
+    countries, years, values = panel_matrix(df)
+    scaled, low, span = scale(values)
+    X, y, ids = windows(scaled)
+
+    model = build_model(len(countries))
+    model.fit([X, ids], y, epochs=epochs, batch_size=batch_size, shuffle=True, verbose=0)
+
+    # Erreur d'ajustement par pays (en unités d'origine) pour l'intervalle ±1,96 écart-type
+    fitted = model.predict([X, ids], batch_size=len(X), verbose=0)[:, 0]
+    residus = (fitted - y) * span[ids, 0]
+    # Écart-type par pays en une passe (pas de masque par pays : linéaire en nombre d'entités)
+    n = np.bincount(ids, minlength=len(countries))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        moyenne = np.bincount(ids, residus, len(countries)) / n
+        variance = np.bincount(ids, residus ** 2, len(countries)) / n - moyenne ** 2
+    marge = 1.96 * np.sqrt(np.maximum(variance, 0))
+
+    # Prévision récursive compilée, tous les pays dans le même lot
+    buffer, last_index = last_windows(scaled)
+    steps = HORIZON - int(years[last_index].min())
+    rollout = shared_rollout(model, with_country=True)
+    predictions = rollout(buffer, steps, np.arange(len(countries)), weights=model.get_weights())
+    stats = rollout.stats()   # Coût à chaud par pays ; le traçage est mesuré à part
+
+    predictions = predictions * span + low
+    result = {}
+    for c, pays in enumerate(countries):
+        last_year = int(years[last_index[c]])
+        n = HORIZON - last_year
+        yhat = predictions[c, :n]
+        result[pays] = forecast_frame(np.arange(last_year + 1, HORIZON + 1),
+                                      yhat, yhat - marge[c], yhat + marge[c])
+        result[pays].attrs["inference_ms"] = stats["per_forecast_ms"]
+        result[pays].attrs["trace_ms"] = stats["trace_ms"]
+    return result
+
+
+def panel_key(df):
+    """Empreinte des séries (pays, année, cible) utilisées pour l'entraînement."""
+    series = df[["Country Name", "Year", TARGET]]
+    return hashlib.sha256(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes()).hexdigest()
+
+
+def forecast_all_cached(df):
+    """:func:`forecast_all`, entraîné une seule fois par jeu de données (même entre threads)."""
+    key = panel_key(df)
+    with _panels_lock:
+        if key not in _panels:
+            _panels[key] = forecast_all(df)
+            while len(_panels) > CACHED_PANELS:
+                _panels.popitem(last=False)
+        _panels.move_to_end(key)
+        return _panels[key]
+
+
+def forecast(df, pays):
+    """Prévision d'un pays avec le réseau commun (entraîné une fois sur tous les pays)."""
+    result = forecast_all_cached(df)
+    if pays not in result:
+        raise ValueError("Pas assez de données pour entraîner un LSTM.")
+    return result[pays]
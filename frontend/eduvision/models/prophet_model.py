@@ -0,0 +1,124 @@
+"""
+Prévision par séries temporelles avec Prophet.
+
+``forecast`` entraîne un modèle pour un pays ; ``forecast_all`` entraîne
+tous les pays (et, au besoin, plusieurs indicateurs) en parallèle dans un
+``ProcessPoolExecutor``. Chaque processus est initialisé une seule fois :
+Prophet est importé, le backend Stan (modèle cmdstan précompilé) est chargé
+et les journaux de cmdstanpy sont coupés ; chaque tâche ne paie ensuite que
+l'ajustement.
+
+Le backend est gardé par thread (:func:`stan_backend`) et donné à chaque
+modèle Prophet : les ajustements successifs d'un même thread réutilisent le
+même modèle cmdstan au lieu d'en charger un nouveau.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pandas as pd
+from prophet import Prophet
+
+from eduvision.models.base import FORECAST_COLUMNS, HORIZON, TARGET, country_series, forecast_frame
+from eduvision.profiling import traced
+
+_local = threading.local()   # Backend Stan propre à chaque thread (il garde l'état du dernier ajustement)
+
+
+def stan_backend():
+    """Backend cmdstanpy du thread courant, chargé au premier appel puis réutilisé."""
+    backend = getattr(_local, "backend", None)
+    if backend is None:
+        from prophet.models import CmdStanPyBackend
+        backend = _local.backend = CmdStanPyBackend()
+    return backend
+
+
+@traced("modèle:prophet:ajustement")
+def fit_series(years, values):
+    """Ajuste Prophet sur une série annuelle."""
+    # Adapter au format Prophet (colonnes ds = date, y = valeur)
+    df_prophet = pd.DataFrame({
+        "ds": pd.to_datetime(pd.Series(years).astype(str), format="%Y"),
+        "y": pd.Series(values, dtype="float64"),
+    })
+
+    model = Prophet(stan_backend="CMDSTANPY")
+    model.stan_backend = stan_backend()   # Modèle cmdstan déjà chargé dans ce thread
+    model.fit(df_prophet)
+    return model
+
+
+@traced("modèle:prophet:prédiction")
+def predict_series(model, last_year):
+    """Prévision d'un modèle ajusté, de l'historique jusqu'à ``HORIZON``."""
+    # Une date par début d'année jusqu'à l'horizon (historique compris)
+    future = model.make_future_dataframe(periods=HORIZON - int(last_year), freq="YS")
+    prediction = model.predict(future)
+
+    return forecast_frame(prediction["ds"].dt.year, prediction["yhat"].to_numpy(),
+                          prediction["yhat_lower"].to_numpy(), prediction["yhat_upper"].to_numpy())
+
+
+def _fit_predict(years, values):
+    """Ajuste Prophet sur une série annuelle et prévoit jusqu'à ``HORIZON``."""
+    return predict_series(fit_series(years, values), max(years))
+
+
+def forecast(df, pays, colonne=TARGET):
+    """Entraîne Prophet sur l'historique du pays et prévoit jusqu'à ``HORIZON``."""
+    df_pays = country_series(df, pays, colonne)
+    return _fit_predict(df_pays["Year"].to_numpy(), df_pays[colonne].to_numpy())
+
+
+# ===============================================
+# TOUS LES PAYS EN PARALLÈLE
+# ===============================================
+def init_worker():
+    """Initialisation unique d'un processus : journaux coupés, backend Stan chargé pour ses tâches."""
+    for name in ("cmdstanpy", "prophet"):
+        logger = logging.getLogger(name)
+        # Un gestionnaire déjà présent empêche cmdstanpy de réinstaller le sien au niveau INFO
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        logger.setLevel(logging.ERROR)
+    stan_backend()
+
+
+def _task(pays, colonne, years, values):
+    return pays, colonne, _fit_predict(years, values)
+
+
+def forecast_all(df, countries=None, indicators=(TARGET,), workers=None):
+    """
+    Prévisions Prophet de chaque (pays, indicateur), calculées en parallèle.
+
+    ``workers`` fixe le nombre de processus (par défaut : nombre de cœurs).
+    Retourne un DataFrame long (colonnes de prévision + pays et indicateur).
+    """
+    countries = countries or sorted(df["Country Name"].unique())
+    workers = workers or os.cpu_count()
+
+    # Chaque tâche ne reçoit que sa série, pas tout le dataset
+    tasks = []
+    for pays in countries:
+        for colonne in indicators:
+            serie = country_series(df, pays, colonne)
+            if len(serie) >= 2:
+                tasks.append((pays, colonne, serie["Year"].to_numpy(), serie[colonne].to_numpy()))
+
+    if not tasks:
+        return pd.DataFrame(columns=FORECAST_COLUMNS + ["Country Name", "indicator"])
+
+    # « spawn » : processus neufs, sans hériter de l'état (threads TensorFlow…) du parent
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                             initializer=init_worker) as pool:
+        results = list(pool.map(_task, *zip(*tasks)))
+
+    return pd.concat(
+        [prevision.assign(**{"Country Name": pays, "indicator": colonne})
+         for pays, colonne, prevision in results],
+        ignore_index=True,
+    )
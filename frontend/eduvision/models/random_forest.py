@@ -0,0 +1,96 @@
+"""Prévision par Random Forest à partir des facteurs socio-économiques."""
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+from eduvision import registry
+from eduvision.models.base import HORIZON, TARGET, forecast_frame
+from eduvision.profiling import traced
+
+# Variables explicatives (facteurs socio-éco)
+FEATURES = ["GDP_per_capita", "Education_Expenditure", "Urban_Population",
+            "Fertility_Rate", "Child_Marriage_Under18"]
+
+# Scénario d'évolution annuelle de chaque facteur
+GROWTH = {
+    "GDP_per_capita": 1.05,
+    "Education_Expenditure": 1.03,
+    "Urban_Population": 1.02,
+    "Fertility_Rate": 0.98,
+    "Child_Marriage_Under18": 0.99,
+}
+
+# Hyperparamètres : font partie de la clé du registre des modèles
+PARAMS = {"n_estimators": 200, "random_state": 42}
+
+# Panel agrandi (continent, synthétique) : au-delà de ce nombre de lignes, chaque
+# arbre n'est entraîné que sur un tirage de MAX_SAMPLES lignes (temps et mémoire bornés)
+MAX_SAMPLES = 20_000
+
+
+def training_data(df):
+    """Variables explicatives et cible, valeurs manquantes remplacées par la médiane."""
+    X = df[FEATURES]
+    y = df[TARGET]
+
+    # Nettoyer les valeurs manquantes
+    X = X.fillna(X.median())
+    y = y.fillna(y.median())
+    return X, y
+
+
+def params(n_rows):
+    """Hyperparamètres pour ``n_rows`` lignes d'entraînement ; ``PARAMS`` pour le Top 30."""
+    if n_rows <= MAX_SAMPLES:
+        return PARAMS
+    return {**PARAMS, "max_samples": MAX_SAMPLES}
+
+
+def _fit(X, y):
+    # Entraînement parallèle sur tous les cœurs, puis prédiction mono-thread :
+    # pour une dizaine de lignes, répartir les arbres coûte plus qu'il ne rapporte.
+    rf = RandomForestRegressor(**params(len(X)), n_jobs=-1)
+    rf.fit(X, y)
+    rf.set_params(n_jobs=None)
+    return rf
+
+
+@traced("modèle:rf:ajustement")
+def fit(df):
+    """
+    Modèle global (indépendant du pays), entraîné une seule fois par version des données.
+
+    Le modèle est rechargé depuis le registre s'il a déjà été entraîné sur
+    les mêmes données avec les mêmes hyperparamètres.
+    """
+    X, y = training_data(df)
+    return registry.load_or_fit("random_forest", X, y, params(len(X)), _fit)
+
+
+def future_features(df, pays):
+    """Facteurs futurs du pays selon le scénario ``GROWTH`` (une ligne par année)."""
+    df_pays = df[df["Country Name"] == pays]
+    last_year = int(df_pays["Year"].max())
+    future_years = np.arange(last_year + 1, HORIZON + 1)
+    steps = np.arange(1, len(future_years) + 1)
+
+    X_future = pd.DataFrame({
+        col: df_pays[col].iloc[-1] * (GROWTH[col] ** steps) for col in FEATURES
+    })
+    return future_years, X_future
+
+
+@traced("modèle:rf:prédiction")
+def predict(rf, df, pays):
+    """Prévision du pays ; l'intervalle vient de la dispersion des arbres (5e-95e centiles)."""
+    future_years, X_future = future_features(df, pays)
+    yhat = rf.predict(X_future)
+
+    per_tree = np.stack([tree.predict(X_future.to_numpy()) for tree in rf.estimators_])
+    lower, upper = np.percentile(per_tree, [5, 95], axis=0)
+    return forecast_frame(future_years, yhat, lower, upper)
+
+
+def forecast(df, pays):
+    """Charge (ou entraîne) le modèle global puis prévoit pour le pays."""
+    return predict(fit(df), df, pays)
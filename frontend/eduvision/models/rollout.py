@@ -0,0 +1,122 @@
+"""
+Prévision récursive compilée pour les modèles LSTM.
+
+Au lieu d'appeler ``model.predict`` une fois par année (avec à chaque fois le
+coût complet de Keras et une réallocation ``np.vstack``), toute la boucle
+est tracée une fois en graphe TensorFlow (``tf.function``) : la fenêtre
+glissante reste un tenseur de taille fixe et les prévisions sont écrites
+dans un ``TensorArray`` dimensionné à l'avance. Un même appel traite un ou
+plusieurs pays (axe du lot).
+
+:func:`shared_rollout` garde une boucle compilée par architecture de modèle :
+les réseaux entraînés ensuite (un par pays, ou un nouveau réseau commun) y
+copient leurs poids et réutilisent le graphe déjà tracé.
+"""
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import tensorflow as tf
+
+
+class CompiledRollout:
+    """
+    Boucle de prévision compilée autour d'un modèle Keras entraîné.
+
+    ``with_country`` indique que le modèle attend aussi l'identifiant du pays
+    (LSTM commun). Le coût du traçage (premier appel) est conservé à part
+    dans ``trace_seconds`` ; ``timings`` ne contient que les appels à chaud
+    (secondes, nombre de séries prévues).
+    """
+
+    def __init__(self, model, with_country=False, history=100):
+        self.model = model
+        self.with_country = with_country
+        self.timings = deque(maxlen=history)
+        self.trace_seconds = None
+        self._lock = threading.Lock()
+        # Signature fixe : taille du lot, longueur de fenêtre et horizon variables sans retraçage
+        self._rollout = tf.function(self._loop, input_signature=[
+            tf.TensorSpec([None, None], tf.float32),
+            tf.TensorSpec([], tf.int32),
+            tf.TensorSpec([None], tf.int32),
+        ])
+
+    def _loop(self, window, steps, country_ids):
+        predictions = tf.TensorArray(tf.float32, size=steps)
+        for t in tf.range(steps):
+            inputs = window[:, :, None]
+            if self.with_country:
+                inputs = [inputs, country_ids[:, None]]
+            pred = self.model(inputs, training=False)[:, 0]
+            predictions = predictions.write(t, pred)
+            window = tf.concat([window[:, 1:], pred[:, None]], axis=1)
+        return tf.transpose(predictions.stack())
+
+    def _run(self, windows, steps, country_ids):
+        start = time.perf_counter()
+        predictions = self._rollout(windows, steps, country_ids).numpy()
+        return predictions, time.perf_counter() - start
+
+    def __call__(self, windows, steps, country_ids=None, weights=None):
+        """
+        Prévoit ``steps`` années pour chaque fenêtre (lot, taille de fenêtre) ; retourne (lot, steps).
+
+        ``weights`` (``model.get_weights()`` d'un réseau de même architecture)
+        remplace d'abord les poids du modèle compilé.
+        """
+        windows = tf.convert_to_tensor(np.asarray(windows, dtype="float32"))
+        if country_ids is None:
+            country_ids = np.zeros(windows.shape[0], dtype="int32")
+        steps = tf.constant(steps, dtype=tf.int32)
+        country_ids = tf.convert_to_tensor(country_ids, dtype=tf.int32)
+        with self._lock:
+            if weights is not None:
+                self.model.set_weights(weights)
+            if self.trace_seconds is None:
+                # Premier appel : traçage et exécution mesurés ensemble, puis une exécution à chaud
+                _, self.trace_seconds = self._run(windows, steps, country_ids)
+            predictions, seconds = self._run(windows, steps, country_ids)
+        self.timings.append((seconds, int(windows.shape[0])))
+        return predictions
+
+    def stats(self):
+        """Coût du traçage, latence du dernier appel et coût moyen par série prévue (ms, à chaud)."""
+        if not self.timings:
+            return {}
+        last_seconds, last_batch = self.timings[-1]
+        total_seconds = sum(s for s, _ in self.timings)
+        total_series = sum(n for _, n in self.timings)
+        return {
+            "calls": len(self.timings),
+            "trace_ms": self.trace_seconds * 1000,
+            "last_ms": last_seconds * 1000,
+            "per_forecast_ms": last_seconds * 1000 / last_batch,
+            "mean_per_forecast_ms": total_seconds * 1000 / total_series,
+        }
+
+
+_rollouts = {}   # architecture -> CompiledRollout
+_rollouts_lock = threading.Lock()
+
+
+def _architecture(model, with_country):
+    """Clé d'architecture : types des couches et formes des poids (pas les noms, propres à chaque instance)."""
+    return (with_country,
+            tuple(type(layer).__name__ for layer in model.layers),
+            tuple(tuple(weight.shape) for weight in model.weights))
+
+
+def shared_rollout(model, with_country=False):
+    """
+    Boucle compilée commune à tous les modèles de l'architecture de ``model``.
+
+    Le modèle compilé est un clone de ``model`` : l'appeler avec
+    ``weights=model.get_weights()`` pour prévoir avec ``model``.
+    """
+    key = _architecture(model, with_country)
+    with _rollouts_lock:
+        if key not in _rollouts:
+            _rollouts[key] = CompiledRollout(tf.keras.models.clone_model(model), with_country)
+        return _rollouts[key]
@@ -0,0 +1,89 @@
+"""
+Scénarios « what-if » vectorisés pour le Random Forest.
+
+Un scénario est un vecteur de taux de croissance annuels, un par facteur de
+``random_forest.FEATURES`` (1.05 = +5 % par an). Pour S scénarios, C pays et
+T années, les facteurs futurs sont construits en un seul tenseur NumPy
+(S, C, T, F) puis prédits en un seul appel à ``rf.predict`` ; les quantiles
+sur l'axe des scénarios donnent les bandes du graphique en éventail.
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from eduvision.models.base import HORIZON
+from eduvision.models.random_forest import FEATURES, GROWTH
+
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+# ===============================================
+# GÉNÉRATION DES SCÉNARIOS (S, F)
+# ===============================================
+def baseline():
+    """Scénario unique de référence (``GROWTH``)."""
+    return np.array([[GROWTH[col] for col in FEATURES]])
+
+
+def sweep(rates):
+    """
+    Balayage : produit cartésien des taux proposés pour chaque facteur.
+
+    ``rates`` associe un facteur à une liste de taux ; les facteurs absents
+    gardent leur taux de référence.
+    """
+    axes = [rates.get(col, [GROWTH[col]]) for col in FEATURES]
+    return np.array(list(itertools.product(*axes)))
+
+
+def monte_carlo(n, mean=None, sd=0.01, seed=42):
+    """``n`` tirages gaussiens autour de ``mean`` (par défaut ``GROWTH``), écart-type ``sd``."""
+    mean = mean or GROWTH
+    center = np.array([mean[col] for col in FEATURES])
+    rng = np.random.default_rng(seed)
+    return center + rng.normal(0.0, sd, size=(n, len(FEATURES)))
+
+
+# ===============================================
+# PROJECTION VECTORISÉE
+# ===============================================
+def project(rf, df, rates, countries=None):
+    """
+    Prévisions de tous les scénarios pour tous les pays, en un seul ``rf.predict``.
+
+    Retourne ``(predictions, countries, years)`` avec ``predictions`` de forme
+    (S, C, T) ; les années au-delà de ``HORIZON`` pour un pays valent NaN.
+    """
+    countries = list(countries) if countries is not None else sorted(df["Country Name"].unique())
+    last_rows = (df[df["Country Name"].isin(countries)]
+                 .sort_values("Year")
+                 .groupby("Country Name", observed=True)
+                 .tail(1)
+                 .set_index("Country Name")
+                 .loc[countries])
+    base = last_rows[FEATURES].to_numpy(dtype="float64")              # (C, F)
+    last_years = last_rows["Year"].to_numpy(dtype="int64")            # (C,)
+
+    years = np.arange(last_years.min() + 1, HORIZON + 1)
+    steps = years[None, :] - last_years[:, None]                      # (C, T)
+
+    rates = np.asarray(rates, dtype="float64")                        # (S, F)
+    # facteur[s, c, t, f] = dernière valeur[c, f] * taux[s, f] ** pas[c, t]
+    X = base[None, :, None, :] * rates[:, None, None, :] ** np.maximum(steps, 0)[None, :, :, None]
+
+    S, C, T, F = X.shape
+    flat = pd.DataFrame(X.reshape(S * C * T, F), columns=FEATURES)
+    predictions = rf.predict(flat).reshape(S, C, T)
+    predictions[:, steps < 1] = np.nan
+    return predictions, countries, years
+
+
+def fan_chart(predictions, countries, years, quantiles=QUANTILES):
+    """Quantiles par pays et par année sur l'axe des scénarios (format long)."""
+    q = np.nanquantile(predictions, quantiles, axis=0)                 # (Q, C, T)
+    index = pd.MultiIndex.from_product([countries, years], names=["Country Name", "Year"])
+    return pd.DataFrame(
+        {f"q{round(level * 100):02d}": q[i].reshape(-1) for i, level in enumerate(quantiles)},
+        index=index,
+    ).reset_index()
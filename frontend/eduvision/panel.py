@@ -0,0 +1,88 @@
+# ===============================================
+# INDEX DU PANEL (PAYS × ANNÉES)
+# ===============================================
+"""
+Filtres pays/période et année sans masque booléen sur tout le tableau.
+
+Le dataset est trié une fois par (pays, année) : les lignes d'un pays forment
+un bloc contigu, et comme ses années se suivent, la ligne d'une année se
+calcule par simple décalage depuis le début du bloc. Une seconde copie triée
+par (année, pays) fait de même pour « toutes les lignes d'une année ».
+
+Chaque requête renvoie une tranche ``iloc[début:fin]`` : une vue, sans copie
+des données (Copy-on-Write), en temps constant.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from eduvision.data import dataset_version, load_dataset
+from eduvision.profiling import traced
+
+
+class PanelIndex:
+    """Tranches contiguës par pays (et par année) d'un DataFrame panel."""
+
+    def __init__(self, df):
+        self.by_country = df.sort_values(["Country Name", "Year"], kind="stable", ignore_index=True)
+        self.by_year = df.sort_values(["Year", "Country Name"], kind="stable", ignore_index=True)
+
+        self._blocks = self._offsets(self.by_country["Country Name"].to_numpy(),
+                                     self.by_country["Year"].to_numpy())
+        years = self.by_year["Year"].to_numpy()
+        self._year_blocks = self._offsets(years, years)
+        self.countries = list(self._blocks)
+        self.years = sorted(self._year_blocks)
+
+    @staticmethod
+    def _offsets(keys, years):
+        """
+        ``{clé: (début, fin, première année, années consécutives ?)}`` pour des
+        ``keys`` déjà triées.
+        """
+        bounds = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        starts = np.concatenate([[0], bounds]).tolist()
+        stops = np.concatenate([bounds, [len(keys)]]).tolist()
+        blocks = {}
+        for key, start, stop in zip(keys[starts].tolist(), starts, stops):
+            first, last = int(years[start]), int(years[stop - 1])
+            # Années strictement croissantes sans trou : décalage direct possible
+            dense = last - first == stop - start - 1 and bool(np.all(np.diff(years[start:stop]) == 1))
+            blocks[key] = (start, stop, first, dense)
+        return blocks
+
+    @traced("filtrage:pays")
+    def country(self, pays, debut=None, fin=None):
+        """Lignes de ``pays`` (années ``debut``–``fin`` incluses), triées par année."""
+        start, stop, first, dense = self._blocks[pays]
+        if debut is None and fin is None:
+            return self.by_country.iloc[start:stop]
+        debut = first if debut is None else debut
+        fin = first + (stop - start) if fin is None else fin
+        if dense:
+            # Années consécutives : position = décalage depuis la première année
+            i = start + min(max(debut - first, 0), stop - start)
+            j = start + min(max(fin - first + 1, 0), stop - start)
+        else:
+            years = self.by_country["Year"].to_numpy()[start:stop]
+            i = start + int(np.searchsorted(years, debut, "left"))
+            j = start + int(np.searchsorted(years, fin, "right"))
+        return self.by_country.iloc[i:max(i, j)]
+
+    @traced("filtrage:année")
+    def year(self, annee):
+        """Lignes de tous les pays pour ``annee``, triées par pays."""
+        start, stop, _, _ = self._year_blocks.get(int(annee), (0, 0, 0, True))
+        return self.by_year.iloc[start:stop]
+
+
+@lru_cache(maxsize=8)
+def _load_panel(version, columns):
+    return PanelIndex(load_dataset(columns))
+
+
+@traced("données:index")
+def load_panel(columns=None):
+    """Index du dataset courant (colonnes ``columns``), construit une fois par version des données."""
+    columns = tuple(columns) if columns is not None else None
+    return _load_panel(dataset_version(), columns)
@@ -0,0 +1,20 @@
+# ===============================================
+# CHEMINS DES DONNÉES (SANS PANDAS)
+# ===============================================
+"""
+Emplacement du dataset courant, sans importer pandas.
+
+Séparé de :mod:`eduvision.data` pour les modules légers (résumé de la page
+d'accueil) qui ont besoin du chemin du dataset mais jamais de le lire.
+:mod:`eduvision.data` réexporte ces noms.
+"""
+import os
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+DATASET_FILE = "Africa_Education_Development_Top30_ClusterImputed.csv"
+
+
+def dataset_file():
+    """Fichier du dataset courant : ``EDUVISION_DATASET`` s'il est défini, sinon ``DATASET_FILE``."""
+    return DATA_DIR / os.environ.get("EDUVISION_DATASET", DATASET_FILE)
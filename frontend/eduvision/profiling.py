@@ -0,0 +1,196 @@
+# ===============================================
+# PROFILAGE DES RERUNS (SPANS)
+# ===============================================
+"""
+Mesure légère du temps passé dans chaque étape d'un rerun de page.
+
+Chaque page ouvre une trace avec :func:`start_page` et la ferme avec
+:func:`end_page`. Entre les deux, les étapes coûteuses sont des *spans* :
+
+- ``with span("modèle:rf", pays=pays): ...`` (gestionnaire de contexte) ;
+- ``@traced("données:chargement")`` (décorateur).
+
+Hors d'une trace (benchmarks, API, threads d'un pool), un span ne fait
+qu'une lecture de ``ContextVar`` : la couche ``eduvision`` peut donc être
+instrumentée sans coût mesurable.
+
+En fin de rerun :
+
+- le panneau de débogage (paramètre d'URL ``?debug=1`` ou variable
+  ``EDUVISION_DEBUG=1``) affiche la cascade des spans ;
+- si ``EDUVISION_PROFILE_FILE`` est définie, les spans sont exportés : une
+  ligne JSON par rerun (``*.jsonl``), ou des compteurs au format texte
+  Prometheus (``*.prom``, réécrit à chaque rerun) pour une agrégation
+  hors ligne.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+
+_current = ContextVar("eduvision_trace", default=None)
+
+
+class Trace:
+    """Spans d'un rerun : (nom, début, durée, profondeur, attributs), temps relatifs au début."""
+
+    def __init__(self, page):
+        self.page = page
+        self.start = time.perf_counter()
+        self.spans = []
+        self.depth = 0
+        self.total_ms = None
+
+    def close(self):
+        self.total_ms = (time.perf_counter() - self.start) * 1000
+        return self
+
+
+@contextmanager
+def span(name, **attrs):
+    """Mesure le bloc ``with`` dans la trace courante (sans effet hors trace)."""
+    trace = _current.get()
+    if trace is None:
+        yield attrs
+        return
+    record = {"nom": name, "debut_ms": (time.perf_counter() - trace.start) * 1000,
+              "profondeur": trace.depth, "attributs": attrs}
+    trace.spans.append(record)
+    trace.depth += 1
+    try:
+        yield attrs   # Le bloc peut compléter les attributs (niveau de cache...)
+    finally:
+        trace.depth -= 1
+        record["duree_ms"] = (time.perf_counter() - trace.start) * 1000 - record["debut_ms"]
+
+
+def traced(name=None):
+    """Décorateur : chaque appel de la fonction est un span (nom par défaut : module.fonction)."""
+    def decorator(fn):
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return fn(*args, **kwargs)
+            with span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current():
+    return _current.get()
+
+
+# ===============================================
+# TRACE D'UNE PAGE
+# ===============================================
+def start_page(page):
+    """Ouvre la trace du rerun de ``page`` (remplace celle d'un rerun précédent)."""
+    trace = Trace(page)
+    _current.set(trace)
+    return trace
+
+
+def end_page():
+    """Ferme la trace courante, l'exporte et affiche le panneau de débogage s'il est demandé."""
+    trace = _current.get()
+    if trace is None:
+        return None
+    _current.set(None)
+    trace.close()
+    path = os.environ.get("EDUVISION_PROFILE_FILE")
+    if path:
+        export(trace, Path(path))
+    if debug_enabled():
+        render_panel(trace)
+    return trace
+
+
+def stop_page():
+    """Arrête le rerun (``st.stop()``) après avoir fermé et exporté sa trace, comme en fin de page."""
+    import streamlit as st
+
+    end_page()
+    st.stop()
+
+
+def debug_enabled():
+    import streamlit as st
+
+    if os.environ.get("EDUVISION_DEBUG", "").strip() not in ("", "0"):
+        return True
+    return st.query_params.get("debug", "0") not in ("", "0")
+
+
+# ===============================================
+# EXPORT (JSON LINES / PROMETHEUS)
+# ===============================================
+_lock = threading.Lock()
+_totals = defaultdict(lambda: [0, 0.0])   # (page, span) -> [nombre, secondes cumulées]
+
+
+def export(trace, path):
+    """Ajoute le rerun à ``path`` : JSON lines, ou texte Prometheus si l'extension est ``.prom``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".prom":
+        with _lock:
+            for nom, duree_ms in [("rerun", trace.total_ms)] + [(s["nom"], s["duree_ms"]) for s in trace.spans]:
+                cumul = _totals[(trace.page, nom)]
+                cumul[0] += 1
+                cumul[1] += duree_ms / 1000
+            lignes = ["# HELP eduvision_span_seconds Durée des spans de profilage des pages",
+                      "# TYPE eduvision_span_seconds summary"]
+            for (page, nom), (nombre, secondes) in sorted(_totals.items()):
+                etiquettes = f'page="{page}",span="{nom}"'
+                lignes.append(f"eduvision_span_seconds_count{{{etiquettes}}} {nombre}")
+                lignes.append(f"eduvision_span_seconds_sum{{{etiquettes}}} {secondes:.6f}")
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_text("\n".join(lignes) + "\n", encoding="utf-8")
+            tmp.replace(path)
+        return
+    ligne = {"date": datetime.now(timezone.utc).isoformat(timespec="milliseconds"), "page": trace.page,
+             "total_ms": round(trace.total_ms, 3),
+             "spans": [{**s, "debut_ms": round(s["debut_ms"], 3), "duree_ms": round(s["duree_ms"], 3)}
+                       for s in trace.spans]}
+    with _lock, path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(ligne, ensure_ascii=False, default=str) + "\n")
+
+
+# ===============================================
+# PANNEAU DE DÉBOGAGE
+# ===============================================
+def waterfall(trace):
+    """Figure en cascade : une barre par span, de son début à sa fin."""
+    import plotly.graph_objects as go
+
+    spans = [s for s in trace.spans if "duree_ms" in s]
+    etiquettes = [f"{i:>2}. " + "· " * s["profondeur"] + s["nom"] for i, s in enumerate(spans, 1)]
+    fig = go.Figure(go.Bar(
+        y=etiquettes, x=[s["duree_ms"] for s in spans], base=[s["debut_ms"] for s in spans],
+        orientation="h", marker_color=[s["profondeur"] for s in spans], marker_colorscale="Teal",
+        hovertext=[", ".join(f"{k}={v}" for k, v in s["attributs"].items()) for s in spans],
+        hovertemplate="%{y}<br>%{base:.1f} → %{x:.1f} ms<br>%{hovertext}<extra></extra>",
+    ))
+    fig.update_layout(title=f"Rerun {trace.page} : {trace.total_ms:.0f} ms",
+                      xaxis_title="Temps depuis le début du rerun (ms)",
+                      yaxis=dict(autorange="reversed"), height=120 + 22 * len(spans),
+                      margin=dict(l=10, r=10, t=40, b=10))
+    return fig
+
+
+def render_panel(trace):
+    import streamlit as st
+
+    from eduvision.figures import figure_cache
+
+    with st.expander(f"Débogage : profil du rerun ({trace.total_ms:.0f} ms)"):
+        st.plotly_chart(waterfall(trace), use_container_width=True)
+        st.caption("Cache de figures : " + ", ".join(f"{k} {v}" for k, v in figure_cache.stats().items()))
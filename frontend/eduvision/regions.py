@@ -0,0 +1,197 @@
+# ===============================================
+# PANEL RÉGIONAL (TRAITEMENT PAR MORCEAUX)
+# ===============================================
+"""
+Données infranationales (``Region``) lues et traitées pays par pays.
+
+Un panel régional peut compter des dizaines de milliers d'entités : il n'est
+jamais chargé en entier dans un worker Streamlit. Il est stocké dans un
+fichier Parquet unique :
+
+- colonnes ``Country Name``, ``Country Code``, ``Region``, ``Year`` puis
+  les indicateurs (types compacts de :mod:`eduvision.store`) ;
+- lignes triées par (pays, région, année) ;
+- groupes de lignes (*row groups*) d'au plus ``ROW_GROUP_ROWS`` lignes, qui
+  ne mélangent jamais deux pays.
+
+Les statistiques min/max de ``Country Name`` de chaque groupe (métadonnées
+du fichier, lues sans toucher aux données) donnent les groupes de chaque
+pays. Un pays se lit donc sans parcourir le reste du fichier, et un
+traitement complet (imputation, agrégation, filtre) enchaîne les pays avec
+en mémoire un seul pays à la fois, plus son résultat.
+
+- :func:`write_regions` écrit un panel à partir de morceaux (un par pays) ;
+- :func:`iter_countries` / :func:`read_country` lisent pays par pays ;
+- :func:`iter_batches` parcourt le fichier par lots Arrow de taille fixe
+  (comptages, histogrammes) ;
+- :func:`filter_regions` et :func:`aggregate_to_country` produisent de
+  petits tableaux à partir du fichier complet.
+
+:func:`aggregate_to_country` ramène le panel au schéma pays de
+l'application (moyenne des régions par pays et par année) : le résultat peut
+être servi aux pages avec ``EDUVISION_DATASET``.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m pipeline.synthetic --regions 200
+    python -m eduvision.regions ../data/synthetic/regions_x200.parquet --output pays.parquet
+"""
+import argparse
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from eduvision.data import ID_COLUMNS, REGION, apply_schema
+from eduvision.profiling import traced
+from eduvision.store import arrow_schema
+
+KEYS = ["Country Name", REGION, "Year"]
+ROW_GROUP_ROWS = 65_536   # Lignes par groupe au plus (un pays peut en occuper plusieurs)
+
+
+def indicator_columns(columns):
+    """Colonnes d'indicateurs d'un panel régional (ni identifiants, ni année, ni cluster)."""
+    return [col for col in columns if col not in ID_COLUMNS + [REGION, "Year", "Cluster"]]
+
+
+# ===============================================
+# ÉCRITURE
+# ===============================================
+def write_regions(chunks, path, row_group_rows=ROW_GROUP_ROWS):
+    """
+    Écrit les morceaux ``chunks`` (un DataFrame par pays) dans ``path``.
+
+    Chaque morceau est trié par région et année puis écrit dans ses propres
+    groupes de lignes ; un seul morceau est en mémoire à la fois. Écriture
+    atomique (fichier temporaire renommé). Retourne le nombre de lignes écrites.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    writer, schema, rows = None, None, 0
+    try:
+        for chunk in chunks:
+            if chunk["Country Name"].nunique() != 1:
+                raise ValueError("Chaque morceau doit contenir un seul pays.")
+            chunk = apply_schema(chunk.sort_values(KEYS, kind="stable", ignore_index=True))
+            if writer is None:
+                schema = arrow_schema(chunk.columns)
+                writer = pq.ParquetWriter(tmp, schema, compression="zstd")
+            writer.write_table(pa.Table.from_pandas(chunk[schema.names], schema=schema, preserve_index=False),
+                               row_group_size=row_group_rows)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError("Aucun morceau à écrire.")
+    tmp.replace(path)
+    return rows
+
+
+# ===============================================
+# LECTURE PAR PAYS
+# ===============================================
+@lru_cache(maxsize=16)
+def _row_groups(path, mtime_ns):
+    metadata = pq.ParquetFile(path).metadata
+    column = metadata.schema.to_arrow_schema().get_field_index("Country Name")
+    groups = defaultdict(list)
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max or stats.min != stats.max:
+            raise ValueError(f"{path} : groupe de lignes {i} sans pays unique (écrire avec write_regions)")
+        groups[stats.min].append(i)
+    return dict(groups)
+
+
+def country_row_groups(path):
+    """``{pays: [indices des groupes de lignes]}``, lu dans les métadonnées du fichier."""
+    path = Path(path)
+    return _row_groups(str(path), path.stat().st_mtime_ns)
+
+
+def read_country(path, pays, columns=None):
+    """Lignes de ``pays`` (toutes ses régions), sans lire les autres pays."""
+    groups = country_row_groups(path)[pays]
+    return pq.ParquetFile(path).read_row_groups(groups, columns=columns).to_pandas()
+
+
+def iter_countries(path, columns=None, countries=None):
+    """Itère ``(pays, DataFrame)`` : un seul pays en mémoire à la fois."""
+    parquet = pq.ParquetFile(path)
+    for pays, groups in country_row_groups(path).items():
+        if countries is None or pays in countries:
+            yield pays, parquet.read_row_groups(groups, columns=columns).to_pandas()
+
+
+def iter_batches(path, columns=None, batch_size=ROW_GROUP_ROWS):
+    """Itère des lots Arrow (``pyarrow.RecordBatch``) d'au plus ``batch_size`` lignes."""
+    yield from pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns)
+
+
+# ===============================================
+# FILTRE ET AGRÉGATION EN FLUX
+# ===============================================
+@traced("régions:filtrage")
+def filter_regions(path, countries=None, years=None, regions=None, columns=None):
+    """
+    Lignes des pays ``countries``, années ``years`` (début, fin) et régions ``regions``.
+
+    Seuls les groupes de lignes des pays demandés sont lus ; la mémoire
+    utilisée est celle du résultat plus un pays.
+    """
+    morceaux = []
+    for _, chunk in iter_countries(path, columns, countries):
+        garde = np.ones(len(chunk), dtype=bool)
+        if years is not None:
+            garde &= chunk["Year"].between(*years).to_numpy()
+        if regions is not None:
+            garde &= chunk[REGION].isin(regions).to_numpy()
+        morceaux.append(chunk[garde])
+    if not morceaux:
+        return pd.DataFrame(columns=columns or pq.ParquetFile(path).schema_arrow.names)
+    # Catégories différentes d'un pays à l'autre : union pour garder le type category
+    return pd.concat(morceaux, ignore_index=True).pipe(apply_schema)
+
+
+@traced("régions:agrégation")
+def aggregate_to_country(path, columns=None):
+    """
+    Panel pays (schéma de l'application) : moyenne des régions par pays et par année.
+
+    Retourne ``Year``, les indicateurs, ``Country Name`` et ``Country Code``,
+    comme les datasets pays.
+    """
+    morceaux = []
+    for pays, chunk in iter_countries(path, columns):
+        indicateurs = indicator_columns(chunk.columns)
+        moyennes = chunk.groupby("Year", observed=True)[indicateurs].mean()
+        moyennes["Country Name"] = pays
+        if "Country Code" in chunk:
+            moyennes["Country Code"] = str(chunk["Country Code"].iloc[0])
+        morceaux.append(moyennes.reset_index())
+    return apply_schema(pd.concat(morceaux, ignore_index=True))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Agrège un panel régional au niveau pays, pays par pays.")
+    parser.add_argument("path", type=Path, help="Panel régional (Parquet écrit par write_regions)")
+    parser.add_argument("--output", type=Path, required=True, help="Panel pays (.parquet ou .csv)")
+    args = parser.parse_args(argv)
+
+    pays = aggregate_to_country(args.path)
+    if args.output.suffix == ".csv":
+        pays.to_csv(args.output, index=False)
+    else:
+        pays.to_parquet(args.output, index=False)
+    print(f"{len(pays)} lignes, {pays['Country Name'].nunique()} pays : {args.output}")
+
+
+if __name__ == "__main__":
+    main()
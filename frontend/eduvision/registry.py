@@ -0,0 +1,47 @@
+# ===============================================
+# REGISTRE DES MODÈLES ENTRAÎNÉS
+# ===============================================
+"""
+Sauvegarde sur disque des modèles entraînés (joblib).
+
+Un modèle est identifié par son nom et par une empreinte de ses données
+d'entraînement et de ses hyperparamètres : tant qu'aucun des deux ne change,
+le modèle est rechargé depuis ``data/models`` au lieu d'être réentraîné.
+"""
+import hashlib
+import json
+
+import joblib
+import pandas as pd
+
+from eduvision.data import DATA_DIR
+
+MODEL_DIR = DATA_DIR / "models"
+
+
+def training_key(X, y, params):
+    """Empreinte des données (valeurs, colonnes) et des hyperparamètres."""
+    h = hashlib.sha256()
+    h.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    h.update(pd.util.hash_pandas_object(y, index=False).to_numpy().tobytes())
+    h.update(json.dumps([list(X.columns), params], sort_keys=True).encode())
+    return h.hexdigest()[:16]
+
+
+def model_path(name, key):
+    return MODEL_DIR / f"{name}-{key}.joblib"
+
+
+def load_or_fit(name, X, y, params, fit):
+    """Recharge le modèle ``name`` s'il existe pour ces données, sinon appelle ``fit(X, y)`` et le sauvegarde."""
+    path = model_path(name, training_key(X, y, params))
+    if path.exists():
+        return joblib.load(path)
+
+    model = fit(X, y)
+    MODEL_DIR.mkdir(parents=True, exist_ok=True)
+    # Écriture dans un fichier temporaire puis renommage : jamais de modèle à moitié écrit
+    tmp = path.with_suffix(".tmp")
+    joblib.dump(model, tmp)
+    tmp.replace(path)
+    return model
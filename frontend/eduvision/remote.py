@@ -0,0 +1,191 @@
+# ===============================================
+# BACKEND DISTANT (CLIENT DE L'API DE PRÉVISION)
+# ===============================================
+"""
+Client HTTP des pages Streamlit vers l'API de prévision (:mod:`api.app`).
+
+Le mode distant est activé par la variable d'environnement
+``EDUVISION_API_URL`` (par exemple ``http://127.0.0.1:8000``) : les pages
+Prévisions et Comparaison demandent alors leurs prévisions et classements à
+l'API au lieu d'entraîner les modèles dans le processus Streamlit. Sans cette
+variable, tout reste calculé en local.
+
+Un seul ``httpx.Client`` est partagé par processus : connexions maintenues
+ouvertes (keep-alive) et réutilisées d'un rerun à l'autre, délais bornés
+(``EDUVISION_API_TIMEOUT`` secondes pour la lecture, 120 par défaut : un
+premier entraînement du LSTM est long). Les vues multi-pays envoient leurs
+requêtes en parallèle (:func:`forecasts`, :func:`get_many`).
+
+Pour tester en local ::
+
+    python -m api.app --port 8000 &
+    EDUVISION_API_URL=http://127.0.0.1:8000 streamlit run Home.py
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import pandas as pd
+
+from eduvision.data import apply_schema
+from eduvision.models import timed
+from eduvision.models.base import FORECAST_COLUMNS
+from eduvision.profiling import span
+
+MAX_CONNECTIONS = 8
+
+
+class RemoteError(RuntimeError):
+    """L'API est injoignable ou a répondu par une erreur serveur."""
+
+
+def api_url():
+    """Adresse de l'API, ou ``None`` si le mode distant n'est pas activé."""
+    url = os.environ.get("EDUVISION_API_URL", "").strip()
+    return url.rstrip("/") or None
+
+
+def enabled():
+    return api_url() is not None
+
+
+@lru_cache(maxsize=4)
+def _client(base_url, read_timeout):
+    import httpx   # dépendance facultative, seulement en mode distant
+
+    return httpx.Client(
+        base_url=base_url,
+        timeout=httpx.Timeout(read_timeout, connect=3.0),
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS,
+                            max_keepalive_connections=MAX_CONNECTIONS, keepalive_expiry=60.0),
+        headers={"Accept": "application/json"},
+    )
+
+
+def client():
+    """Client HTTP partagé (thread-safe) vers l'API configurée."""
+    if not enabled():
+        raise RemoteError("Mode distant désactivé : EDUVISION_API_URL n'est pas définie.")
+    return _client(api_url(), float(os.environ.get("EDUVISION_API_TIMEOUT", 120)))
+
+
+def _error_detail(response):
+    """
+    Message d'une erreur de l'API (``detail`` de FastAPI), ou ``None`` si le
+    corps n'en est pas une (page HTML d'un proxy, JSON d'une autre forme...).
+    """
+    try:
+        payload = response.json()
+    except ValueError:
+        return None
+    detail = payload.get("detail") if isinstance(payload, dict) else None
+    if isinstance(detail, list):
+        # Erreurs de validation (422) : [{"loc": ["query", "year"], "msg": ...}, ...]
+        messages = []
+        for erreur in detail:
+            if not isinstance(erreur, dict):
+                messages.append(str(erreur))
+                continue
+            champ = ".".join(str(part) for part in erreur.get("loc", [])[1:])
+            messages.append(f"{champ} : {erreur.get('msg', '')}" if champ else str(erreur.get("msg", "")))
+        return " ; ".join(messages) or None
+    return str(detail) if detail else None
+
+
+def get(path, **params):
+    """
+    Réponse JSON de ``GET path``.
+
+    Les erreurs 4xx de l'API (pays inconnu, historique insuffisant, paramètre
+    invalide...) sont levées en ``ValueError`` avec leur message, comme les
+    modèles locaux ; le reste (réseau, délai, 5xx, réponse qui ne vient pas
+    de l'API ou corps illisible) en :class:`RemoteError`.
+    """
+    import httpx
+
+    try:
+        with span("api:requête", chemin=path):
+            response = client().get(path, params={k: v for k, v in params.items() if v is not None})
+    except httpx.HTTPError as exc:
+        raise RemoteError(f"API injoignable ({api_url()}) : {exc}") from exc
+    if 400 <= response.status_code < 500:
+        detail = _error_detail(response)
+        if detail is not None:
+            raise ValueError(detail)
+    if response.is_error:
+        raise RemoteError(f"Erreur {response.status_code} de l'API sur {path}")
+    try:
+        return response.json()
+    except ValueError as exc:
+        raise RemoteError(f"Réponse illisible de l'API sur {path}") from exc
+
+
+def get_many(requests):
+    """Plusieurs ``(path, params)`` envoyés en parallèle ; réponses dans le même ordre."""
+    if len(requests) <= 1:
+        return [get(path, **params) for path, params in requests]
+    with ThreadPoolExecutor(max_workers=min(len(requests), MAX_CONNECTIONS)) as pool:
+        return list(pool.map(lambda req: get(req[0], **req[1]), requests))
+
+
+# ===============================================
+# POINTS D'ACCÈS UTILISÉS PAR LES PAGES
+# ===============================================
+def _forecast_frame(payload):
+    return pd.DataFrame(payload["forecast"], columns=FORECAST_COLUMNS)
+
+
+def forecast(model, pays):
+    """Prévision de ``pays`` par ``model`` et sa provenance côté API (``stock`` ou ``direct``)."""
+    payload = get(f"/forecast/{pays}", model=model)
+    return _forecast_frame(payload), payload["source"]
+
+
+def forecasts(model, pays_list):
+    """
+    Prévisions de plusieurs pays, demandées en parallèle.
+
+    Retourne ``(previsions, durees)`` comme :func:`eduvision.models.forecast_many` :
+    un pays refusé par l'API (``ValueError``) est associé à son message
+    d'erreur au lieu d'interrompre les autres.
+    """
+    def one(pays):
+        return timed(lambda p: forecast(model, p)[0], pays)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(pays_list), MAX_CONNECTIONS))) as pool:
+        results = list(pool.map(one, pays_list))
+    return ({pays: result for pays, (result, _) in zip(pays_list, results)},
+            {pays: ms for pays, (_, ms) in zip(pays_list, results)})
+
+
+def dataset():
+    """Années couvertes par le dataset de l'API (sélecteurs d'année des pages) et sa version."""
+    payload = get("/countries")
+    return payload["years"], payload["version"]
+
+
+def years():
+    return dataset()[0]
+
+
+def animation(x, y, pas=1):
+    """Lignes de l'animation ``y`` en fonction de ``x`` (:func:`eduvision.animation.animation_rows`)."""
+    payload = get("/animation", x=x, y=y, pas=pas)
+    # Mêmes types que le dataset local : figure identique à celle construite en local
+    return apply_schema(pd.DataFrame(payload["rows"], columns=payload["columns"]))
+
+
+def ranking(year, indicator):
+    """Valeurs d'``indicator`` par pays pour ``year``, triées par ordre décroissant."""
+    return _ranking_frame(get("/compare", year=year, indicator=indicator))
+
+
+def _ranking_frame(payload):
+    valeurs = pd.DataFrame(payload["values"], columns=["country", "value"])
+    return valeurs.rename(columns={"country": "Country Name", "value": payload["indicator"]})
+
+
+def rankings(requests):
+    """Plusieurs classements ``(year, indicator)`` demandés en parallèle."""
+    payloads = get_many([("/compare", {"year": year, "indicator": indicator}) for year, indicator in requests])
+    return [_ranking_frame(payload) for payload in payloads]
@@ -0,0 +1,214 @@
+# ===============================================
+# STATISTIQUES PRÉCALCULÉES (PAGE EDA)
+# ===============================================
+"""
+Corrélations servies sans recalcul à chaque rerun, et droites de tendance.
+
+Le calcul repose sur des sommes suffisantes (effectifs, sommes, sommes des
+carrés et des produits croisés) sur des données centrées :
+
+- par année, cumulées : la matrice de corrélation de n'importe quelle
+  période s'obtient par différence de deux cumuls ;
+- par pays : une matrice de corrélation par pays.
+
+Les corrélations sont calculées sur les observations complètes de chaque
+paire de colonnes, comme ``DataFrame.corr()``.
+
+La droite de tendance (MCO d'un indicateur sur ``TREND_X``) n'est pas
+précalculée : :func:`trend` l'ajuste à la demande sur les lignes du pays et
+de la période affichés (une tranche de :class:`eduvision.panel.PanelIndex`,
+quelques dizaines de lignes), sans statsmodels. Précalculer des cumuls par
+(pays, année, indicateur) coûterait environ 390 Mo à 1000 fois la taille
+du Top 30, pour une seule droite affichée à la fois.
+
+Les tableaux sont écrits dans ``data/stats/<version des données>/eda.npz`` :
+une nouvelle version du dataset est recalculée automatiquement au premier
+accès. Pour les précalculer (depuis le dossier ``frontend``) ::
+
+    python -m eduvision.stats
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from eduvision.data import DATA_DIR, dataset_version, load_dataset
+from eduvision.profiling import traced
+
+STATS_DIR = DATA_DIR / "stats"
+STATS_FILE = "eda.npz"
+
+# Variable explicative des droites de tendance de la page EDA
+TREND_X = "Literacy_Female_Adult"
+
+
+# ===============================================
+# SOMMES SUFFISANTES
+# ===============================================
+def _pair_moments(X):
+    """
+    Moments par paire de colonnes sur les lignes où les deux sont renseignées.
+
+    Retourne ``(n, s, ss, sp)`` de forme (F, F) : ``s[i, j]`` est la somme de
+    la colonne i sur les lignes où j est renseignée, ``sp[i, j]`` la somme des
+    produits.
+    """
+    valid = (~np.isnan(X)).astype("float64")
+    X0 = np.nan_to_num(X)
+    return valid.T @ valid, X0.T @ valid, (X0 ** 2).T @ valid, X0.T @ X0
+
+
+def correlation(n, s, ss, sp):
+    """Matrice de Pearson à partir des moments de :func:`_pair_moments`."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = n * sp - s * s.T
+        var_i = n * ss - s ** 2
+        corr = cov / np.sqrt(var_i * var_i.T)
+    # Colonne constante (variance nulle aux erreurs d'arrondi près) : corrélation indéfinie
+    constant = var_i <= 1e-12 * n * ss
+    corr[(n < 2) | constant | constant.T] = np.nan
+    return np.clip(corr, -1, 1)
+
+
+def _grouped_pair_moments(X, codes, n_groups):
+    """Moments par paire pour chaque groupe de lignes : tableaux (G, 4, F, F)."""
+    out = np.zeros((n_groups, 4, X.shape[1], X.shape[1]))
+    # Lignes regroupées une fois (tri stable) : chaque groupe est une tranche,
+    # sans masque sur tout le tableau (coût linéaire même avec des milliers de groupes)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(n_groups + 1))
+    X = X[order]
+    for g in range(n_groups):
+        out[g] = _pair_moments(X[bounds[g]:bounds[g + 1]])
+    return out
+
+
+def build_stats(df):
+    """Calcule tous les tableaux de statistiques du DataFrame ``df``."""
+    columns = df.select_dtypes(include="number").columns.tolist()
+    X = df[columns].to_numpy(dtype="float64")
+    # Centrer améliore la précision des différences de sommes
+    X = X - np.nanmean(X, axis=0)
+
+    country_codes, countries = pd.factorize(df["Country Name"], sort=True)
+    year_codes, years = pd.factorize(df["Year"], sort=True)
+
+    by_year = _grouped_pair_moments(X, year_codes, len(years))
+    by_country = _grouped_pair_moments(X, country_codes, len(countries))
+
+    def cumulative(a, axis):
+        shape = list(a.shape)
+        shape[axis] = 1
+        return np.concatenate([np.zeros(shape), np.cumsum(a, axis=axis)], axis=axis)
+
+    return {
+        "columns": np.array(columns),
+        "countries": np.array(countries.astype(str).tolist()),
+        "years": np.asarray(years, dtype="int64"),
+        "global": correlation(*by_year.sum(axis=0)),
+        "country": np.stack([correlation(*m) for m in by_country]),
+        "year_cumsum": cumulative(by_year, axis=0),
+    }
+
+
+# ===============================================
+# CONSULTATION
+# ===============================================
+class EdaStats:
+    """Accès aux corrélations précalculées d'une version du dataset."""
+
+    ARRAYS = ("columns", "countries", "years", "global", "country", "year_cumsum")
+
+    def __init__(self, arrays):
+        self.columns = arrays["columns"].tolist()
+        self.countries = arrays["countries"].tolist()
+        self.years = arrays["years"]
+        self._global = arrays["global"]
+        self._country = arrays["country"]
+        self._year_cumsum = arrays["year_cumsum"]
+        self._country_index = {pays: i for i, pays in enumerate(self.countries)}
+
+    def _frame(self, matrix):
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def _span(self, debut, fin):
+        """Indices [i, j) des années comprises entre ``debut`` et ``fin``."""
+        return np.searchsorted(self.years, debut, "left"), np.searchsorted(self.years, fin, "right")
+
+    def global_corr(self):
+        """Corrélations entre indicateurs sur tout le dataset."""
+        return self._frame(self._global)
+
+    def country_corr(self, pays):
+        """Corrélations entre indicateurs pour un pays (toutes années)."""
+        return self._frame(self._country[self._country_index[pays]])
+
+    def period_corr(self, debut, fin):
+        """Corrélations entre indicateurs sur les années ``debut``–``fin`` (tous pays)."""
+        i, j = self._span(debut, fin)
+        return self._frame(correlation(*(self._year_cumsum[j] - self._year_cumsum[i])))
+
+
+def trend(rows, colonne):
+    """
+    Droite MCO ``colonne ~ TREND_X`` sur les lignes ``rows`` (un pays, une période).
+
+    Seules les lignes où les deux colonnes sont renseignées comptent.
+    Retourne ``{"pente", "ordonnee", "r2", "n"}`` (``None`` si moins de deux
+    points ou si ``TREND_X`` est constant).
+    """
+    x = rows[TREND_X].to_numpy(dtype="float64")
+    y = rows[colonne].to_numpy(dtype="float64")
+    valid = ~np.isnan(x) & ~np.isnan(y)
+    x, y = x[valid], y[valid]
+    n = len(x)
+    if n < 2:
+        return None
+    # Écarts à la moyenne : pas de différence de grandes sommes
+    dx, dy = x - x.mean(), y - y.mean()
+    sxx, sxy, syy = dx @ dx, dx @ dy, dy @ dy
+    if sxx <= 0:
+        return None
+    pente = sxy / sxx
+    r2 = sxy ** 2 / (sxx * syy) if syy > 0 else np.nan
+    return {"pente": float(pente), "ordonnee": float(y.mean() - pente * x.mean()), "r2": float(r2), "n": n}
+
+
+def stats_path(version=None):
+    return STATS_DIR / (version or dataset_version()) / STATS_FILE
+
+
+def write_stats(df, version=None):
+    """Calcule et écrit les statistiques de ``df`` pour ``version`` (écriture atomique)."""
+    path = stats_path(version)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, **build_stats(df))
+    tmp.replace(path)
+    return path
+
+
+@lru_cache(maxsize=4)
+def _read_stats(path, mtime_ns):
+    with np.load(path) as arrays:
+        # Seuls les tableaux utilisés sont lus (un ancien fichier peut en contenir d'autres)
+        return EdaStats({name: arrays[name] for name in EdaStats.ARRAYS})
+
+
+@traced("données:statistiques")
+def load_stats(version=None):
+    """Statistiques de la version courante du dataset, calculées au premier accès si absentes."""
+    path = stats_path(version)
+    if not path.exists():
+        write_stats(load_dataset(), version)
+    return _read_stats(str(path), path.stat().st_mtime_ns)
+
+
+def main():
+    path = write_stats(load_dataset())
+    print(f"Statistiques écrites : {path}")
+
+
+if __name__ == "__main__":
+    main()
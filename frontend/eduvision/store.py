@@ -0,0 +1,99 @@
+# ===============================================
+# STOCKAGE EN COLONNES (Parquet / Feather)
+# ===============================================
+"""
+Conversion des CSV du dossier ``data`` en fichiers colonnes.
+
+Chaque CSV de la chaîne de préparation est converti avec un schéma Arrow
+explicite (pays encodés en dictionnaire, années en int16, indicateurs en
+float32) vers :
+
+- un fichier Parquet, lu par les pages avec projection de colonnes ;
+- un fichier Feather (Arrow IPC) non compressé, lisible en mémoire mappée.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m eduvision.store
+"""
+import argparse
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from eduvision.data import DATA_DIR, ID_COLUMNS, REGION, apply_schema, columnar_path
+
+# Chaîne de préparation (notebooks) : brut → Final → Top30 → ClusterImputed
+LINEAGE = [
+    "Africa_Education_Development.csv",
+    "Africa_Education_Development_Final.csv",
+    "Africa_Education_Development_Top30.csv",
+    "Africa_Education_Development_Top30_ClusterImputed.csv",
+    "Top30_Countries_MissingValues.csv",
+]
+
+
+def arrow_field(name):
+    """Type Arrow d'une colonne du dataset."""
+    if name in ID_COLUMNS:
+        return pa.field(name, pa.dictionary(pa.int16(), pa.string()))
+    if name == REGION:
+        # Des dizaines de milliers de régions : index int32
+        return pa.field(name, pa.dictionary(pa.int32(), pa.string()))
+    if name == "Year":
+        return pa.field(name, pa.int16())
+    if name == "Cluster":
+        return pa.field(name, pa.int8())
+    return pa.field(name, pa.float32())
+
+
+def arrow_schema(columns):
+    """Schéma Arrow explicite pour une liste de colonnes."""
+    return pa.schema([arrow_field(col) for col in columns])
+
+
+def csv_to_table(csv_path):
+    """Lit un CSV et le convertit en table Arrow typée."""
+    df = apply_schema(pd.read_csv(csv_path))
+    return pa.Table.from_pandas(df, schema=arrow_schema(df.columns), preserve_index=False)
+
+
+def build_store(data_dir=DATA_DIR, files=LINEAGE):
+    """Écrit les versions Parquet et Feather de chaque CSV ; retourne les chemins écrits."""
+    written = []
+    for name in files:
+        csv_path = Path(data_dir) / name
+        table = csv_to_table(csv_path)
+
+        parquet_path = columnar_path(csv_path)
+        parquet_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, parquet_path, compression="zstd")
+
+        # Feather non compressé : condition pour une lecture en mémoire mappée sans copie
+        feather_path = columnar_path(csv_path, ".feather")
+        feather.write_feather(table, feather_path, compression="uncompressed")
+
+        written += [parquet_path, feather_path]
+    return written
+
+
+def read_feather(csv_path, columns=None, memory_map=True):
+    """Lit la version Feather d'un CSV, en mémoire mappée par défaut."""
+    table = feather.read_table(columnar_path(csv_path, ".feather"), columns=columns,
+                               memory_map=memory_map)
+    return table.to_pandas()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convertit les CSV de data/ en Parquet et Feather.")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    args = parser.parse_args(argv)
+
+    for path in build_store(args.data_dir):
+        print(f"Écrit : {path}")
+
+
+if __name__ == "__main__":
+    main()
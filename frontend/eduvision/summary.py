@@ -0,0 +1,123 @@
+# ===============================================
+# RÉSUMÉ STATISTIQUE PRÉCALCULÉ (PAGE D'ACCUEIL)
+# ===============================================
+"""
+Agrégats des indicateurs produits par la construction des données.
+
+Pour chaque indicateur : effectif, moyenne, écart-type, médiane, minimum et
+maximum, calculés sur tout le dataset (``global``), par année (``annee``)
+et par cluster de pays (``cluster``).
+
+Le résumé est écrit par ``python -m pipeline.build`` dans
+``data/stats/summary/<empreinte>.json``. L'empreinte (:func:`file_stamp`)
+vient du nom, de la taille et de la date de modification du fichier du
+dataset : la page d'accueil trouve et lit ce petit fichier JSON sans lire
+le dataset, sans calculer son sha256 et sans importer pandas. Si le fichier
+manque pour l'empreinte courante (données modifiées hors de la chaîne de
+construction), il est calculé au premier accès. Pour le régénérer (depuis
+le dossier ``frontend``) ::
+
+    python -m eduvision.summary
+"""
+import hashlib
+import json
+import math
+from functools import lru_cache
+from pathlib import Path
+
+from eduvision.paths import DATA_DIR, dataset_file
+from eduvision.profiling import traced
+
+SUMMARY_FILE = "summary.json"
+AGGREGATES = ["count", "mean", "std", "median", "min", "max"]
+FIELDS = ["n", "moyenne", "ecart_type", "mediane", "minimum", "maximum"]
+
+
+# ===============================================
+# CALCUL
+# ===============================================
+def _records(table):
+    """``{indicateur: {champ: valeur}}`` ; NaN (groupe vide) devient ``None``."""
+    out = {}
+    for indicateur, ligne in table.iterrows():
+        valeurs = [None if math.isnan(v) else float(v) for v in ligne.to_numpy(dtype="float64")]
+        valeurs[0] = int(valeurs[0] or 0)
+        out[str(indicateur)] = dict(zip(FIELDS, valeurs))
+    return out
+
+
+def build_summary(df):
+    """Résumé ``{"indicateurs", "global", "annee", "cluster"}`` du DataFrame ``df``."""
+    from eduvision.data import ID_COLUMNS
+
+    indicateurs = [col for col in df.select_dtypes(include="number").columns
+                   if col not in ID_COLUMNS + ["Year", "Cluster"]]
+    valeurs = df[indicateurs].astype("float64")
+    summary = {"indicateurs": indicateurs,
+               "global": _records(valeurs.agg(AGGREGATES).T),
+               "annee": {}, "cluster": {}}
+    for niveau, colonne in [("annee", "Year"), ("cluster", "Cluster")]:
+        if colonne not in df:
+            continue
+        groupes = valeurs.groupby(df[colonne].astype("int64").to_numpy()).agg(AGGREGATES)
+        for groupe, ligne in groupes.iterrows():
+            summary[niveau][str(groupe)] = _records(ligne.unstack())
+    return summary
+
+
+def file_stamp(path=None):
+    """Empreinte bon marché du fichier du dataset : nom, taille et date de modification (sans le lire)."""
+    path = Path(path) if path is not None else dataset_file()
+    stat = path.stat()
+    return hashlib.sha256(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:12]
+
+
+def summary_path(stamp=None, data_dir=DATA_DIR):
+    return data_dir / "stats" / "summary" / f"{stamp or file_stamp()}.json"
+
+
+def write_summary(df, stamp=None, data_dir=DATA_DIR):
+    """Calcule et écrit le résumé de ``df`` pour l'empreinte ``stamp`` (écriture atomique)."""
+    stamp = stamp or file_stamp()
+    path = summary_path(stamp, data_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps({"stamp": stamp, **build_summary(df)},
+                              ensure_ascii=False, allow_nan=False), encoding="utf-8")
+    tmp.replace(path)
+    return path
+
+
+# ===============================================
+# CONSULTATION
+# ===============================================
+@lru_cache(maxsize=4)
+def _read_summary(path, mtime_ns):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@traced("données:résumé")
+def load_summary(stamp=None):
+    """
+    Résumé du dataset courant (dictionnaire partagé, à ne pas modifier).
+
+    ``load_summary()["global"]["Fertility_Rate"]["moyenne"]`` : moyenne du
+    taux de fécondité sur tout le dataset.
+    """
+    path = summary_path(stamp)
+    if not path.exists():
+        from eduvision.data import load_dataset
+        write_summary(load_dataset(), stamp)
+    return _read_summary(str(path), path.stat().st_mtime_ns)
+
+
+def main():
+    from eduvision.data import load_dataset
+
+    path = write_summary(load_dataset())
+    print(f"Résumé écrit : {path}")
+
+
+if __name__ == "__main__":
+    main()
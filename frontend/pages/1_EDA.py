@@ -3,9 +3,12 @@
 # ===============================================
 import plotly.express as px       # Pour créer des graphiques interactifs
 import streamlit as st            # Pour construire l’application web
-import pandas as pd               # Pour gérer et manipuler le dataset
-import os                         # Pour gérer les chemins de fichiers
-import base64                     # Pour convertir le logo en base64 (affichage dans header HTML)
+from eduvision.data import load_dataset   # Chargement du dataset partagé (mis en cache)
+from eduvision.figures import cached_figure   # Figures partagées entre reruns et sessions
+from eduvision.panel import load_panel    # Tranches pays/période sans masque booléen
+from eduvision.stats import load_stats, trend   # Corrélations précalculées, tendance à la demande
+from eduvision import profiling    # Temps de chaque étape du rerun (panneau ?debug=1)
+from eduvision.layout import page_header    # En-tête commun (CSS, logo, menu)
 
 # ===============================================
 # CONFIGURATION DE LA PAGE
@@ -15,117 +18,18 @@ st.set_page_config(
     page_icon="🌍",                                      # Icône (globe)
     layout="wide"                                        # Mise en page large
 )
+profiling.start_page("EDA")
 
 # ===============================================
-# CSS GLOBAL
-# ===============================================
-st.markdown("""
-    <style>
-    /* Masquer la sidebar native de Streamlit */
-    [data-testid="stSidebarNav"] {display: none;}
-    [data-testid="stSidebar"] {display: none;}
-
-    /* HEADER : logo + titre */
-    .header {
-        display: flex;                  
-        align-items: center;            
-        background-color: #ECF0F1;      
-        padding: 15px 25px;
-        border-radius: 8px;             
-        margin-bottom: 10px;
-    }
-    .logo {
-        width: 65px; height: 65px;      
-        border-radius: 50%;             
-        margin-right: 20px;
-        object-fit: cover;
-    }
-    .title-block {                      
-        display: flex;
-        flex-direction: column;
-    }
-    .main-title {
-        font-size: 28px;
-        font-weight: bold;
-        color: #1ABC9C;                 
-        margin: 0;
-    }
-    .subtitle {
-        font-size: 14px;
-        color: #2C3E50;                 
-        margin: 0;
-    }
-
-    /* MENU de navigation */
-    .menu {
-        display: flex;
-        justify-content: center;
-        gap: 15px;
-        margin-top: 15px;
-    }
-    .menu a {
-        background-color: white;
-        color: #1ABC9C !important;
-        padding: 6px 14px;
-        border-radius: 6px;
-        font-weight: bold;
-        text-decoration: none;
-        transition: 0.3s;
-        border: 1px solid #1ABC9C;
-    }
-    .menu a:hover {
-        background-color: #16A085;
-        color: white !important;
-        transform: scale(1.05);         
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# ===============================================
-# LOGO (en base64 pour affichage dans HTML)
-# ===============================================
-logo_path = os.path.join(os.path.dirname(__file__), "..", "Images", "AfricaEduVision.png")
-
-def img_to_base64(path):
-    """Convertit le logo en base64 pour l’afficher dans le header."""
-    with open(path, "rb") as f:
-        data = f.read()
-    return base64.b64encode(data).decode()
-
-logo_base64 = img_to_base64(logo_path)
-
-# ===============================================
-# HEADER AVEC LOGO + TITRE
-# ===============================================
-st.markdown(f"""
-<div class="header">
-    <img src="data:image/png;base64,{logo_base64}" class="logo">
-    <div class="title-block">
-        <p class="main-title">AfricaEduVision</p>
-        <p class="subtitle">Alphabétisation et développement en Afrique</p>
-    </div>
-</div>
-""", unsafe_allow_html=True)
-
-# ===============================================
-# MENU DE NAVIGATION
-# ===============================================
-st.markdown("""
-<div class="menu">
-    <a href="/"> Accueil</a>
-    <a href="/EDA"> Analyse exploratoire</a>
-    <a href="/Predictions"> Prévisions</a>
-    <a href="/Comparaisons"> Comparaisons</a>
-    <a href="/Methodologie"> Méthodologie</a>
-    <a href="/Conclusion"> Conclusion</a>
-</div>
-""", unsafe_allow_html=True)
+# EN-TÊTE + MENU
+# ===============================================
+page_header("Alphabétisation et développement en Afrique", hide_sidebar=True)
 
 # ===============================================
 # CHARGEMENT DU DATASET
 # ===============================================
-data_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "Africa_Education_Development_Top30_ClusterImputed.csv")
-df = pd.read_csv(os.path.abspath(data_path))
+df = load_dataset()   # Dataset typé, lu une seule fois par processus (cache partagé)
+stats = load_stats()  # Statistiques de la version courante des données (calculées une seule fois)
 
 # Affichage du titre et d’un aperçu du dataset
 st.title("Analyse exploratoire")
@@ -140,12 +44,10 @@ pays = st.selectbox("Choisissez un pays :", sorted(df["Country Name"].unique()))
 annees = st.slider("Choisissez la plage d'années :", 
                    int(df["Year"].min()), 
                    int(df["Year"].max()), 
-                   (2006, 2022))
+                   (int(df["Year"].min()), int(df["Year"].max())))
 
-# Application du filtre
-df_filtre = df[(df["Country Name"] == pays) & 
-               (df["Year"] >= annees[0]) & 
-               (df["Year"] <= annees[1])]
+# Application du filtre : tranche contiguë du panel trié (vue, sans copie)
+df_filtre = load_panel().country(pays, annees[0], annees[1])
 
 st.write(f"### Données filtrées pour {pays} ({annees[0]}–{annees[1]})")
 st.dataframe(df_filtre)
@@ -180,21 +82,26 @@ graph_type = st.radio(
     horizontal=True
 )
 
-# Génération du graphique
-if colonnes_selectionnees:
+# Génération du graphique (servi depuis le cache de figures si déjà construit)
+def graphique_indicateurs():
     if graph_type == "Courbes":
-        fig = px.line(df_filtre, x="Year", y=colonnes_selectionnees,
+        return px.line(df_filtre, x="Year", y=colonnes_selectionnees,
+                       labels={"value": "Valeur", "Year": "Année"},
+                       title=f"Évolution des indicateurs choisis ({pays})")
+    if graph_type == "Barres":
+        return px.bar(df_filtre, x="Year", y=colonnes_selectionnees,
+                      barmode="group", labels={"value": "Valeur", "Year": "Année"},
+                      title=f"Comparaison par barres ({pays})")
+    return px.scatter(df_filtre, x="Year", y=colonnes_selectionnees,
                       labels={"value": "Valeur", "Year": "Année"},
-                      title=f"Évolution des indicateurs choisis ({pays})")
-    elif graph_type == "Barres":
-        fig = px.bar(df_filtre, x="Year", y=colonnes_selectionnees,
-                     barmode="group", labels={"value": "Valeur", "Year": "Année"},
-                     title=f"Comparaison par barres ({pays})")
-    else:
-        fig = px.scatter(df_filtre, x="Year", y=colonnes_selectionnees,
-                         labels={"value": "Valeur", "Year": "Année"},
-                         title=f"Nuage de points des indicateurs ({pays})")
-    st.plotly_chart(fig, use_container_width=True)
+                      title=f"Nuage de points des indicateurs ({pays})")
+
+if colonnes_selectionnees:
+    fig = cached_figure("EDA/indicateurs",
+                        {"pays": pays, "annees": annees, "colonnes": colonnes_selectionnees, "type": graph_type},
+                        graphique_indicateurs)
+    with profiling.span("graphique:envoi"):
+        st.plotly_chart(fig, use_container_width=True)
 else:
     st.warning("Veuillez sélectionner au moins un indicateur.")
 
@@ -213,14 +120,29 @@ facteurs = {
 facteur_choisi = st.selectbox(" Choisissez un facteur à comparer :", list(facteurs.keys()))
 colonne_facteur = facteurs[facteur_choisi]
 
-# Scatter + droite de tendance
-fig_corr = px.scatter(df_filtre, x="Literacy_Female_Adult", y=colonne_facteur,
-                      color="Year", trendline="ols", hover_name="Year",
-                      labels={"Literacy_Female_Adult": "Alphabétisation femmes adultes (%)",
-                              colonne_facteur: facteur_choisi,
-                              "Year": "Année"},
-                      title=f"Relation entre alphabétisation des femmes et {facteur_choisi} ({pays})")
-st.plotly_chart(fig_corr, use_container_width=True)
+# Scatter + droite de tendance (MCO sur la tranche du pays déjà filtrée)
+def graphique_relation():
+    fig_corr = px.scatter(df_filtre, x="Literacy_Female_Adult", y=colonne_facteur,
+                          color="Year", hover_name="Year",
+                          labels={"Literacy_Female_Adult": "Alphabétisation femmes adultes (%)",
+                                  colonne_facteur: facteur_choisi,
+                                  "Year": "Année"},
+                          title=f"Relation entre alphabétisation des femmes et {facteur_choisi} ({pays})")
+    tendance = trend(df_filtre, colonne_facteur)
+    if tendance is not None:
+        x_min, x_max = df_filtre["Literacy_Female_Adult"].min(), df_filtre["Literacy_Female_Adult"].max()
+        fig_corr.add_scatter(
+            x=[x_min, x_max],
+            y=[tendance["ordonnee"] + tendance["pente"] * x for x in (x_min, x_max)],
+            mode="lines", showlegend=False,
+            name=f"MCO : y = {tendance['pente']:.3g}x + {tendance['ordonnee']:.3g} (R² = {tendance['r2']:.3f})",
+        )
+    return fig_corr
+
+fig_corr = cached_figure("EDA/relation", {"pays": pays, "annees": annees, "facteur": colonne_facteur},
+                         graphique_relation)
+with profiling.span("graphique:envoi"):
+    st.plotly_chart(fig_corr, use_container_width=True)
 
 
 # =========================
@@ -229,15 +151,32 @@ st.plotly_chart(fig_corr, use_container_width=True)
 st.markdown("---")
 st.subheader(" Corrélations globales entre indicateurs")
 
-colonnes_numeriques = df.select_dtypes(include=["float64", "int64"]).columns
-df_corr = df[colonnes_numeriques].corr()
-
-fig_corr_matrix = px.imshow(
-    df_corr,
-    text_auto=True,   # Affiche les coefficients dans la matrice
-    color_continuous_scale="RdBu_r",
-    title="Matrice de corrélation entre les indicateurs"
+# Matrices précalculées : sélection par simple lecture
+portee = st.radio(
+    "Portée des corrélations :",
+    ["Tous les pays", "Pays choisi", "Période choisie"],
+    horizontal=True
 )
-
-st.plotly_chart(fig_corr_matrix, use_container_width=True)
-
+def matrice_correlation():
+    if portee == "Tous les pays":
+        df_corr = stats.global_corr()
+    elif portee == "Pays choisi":
+        df_corr = stats.country_corr(pays)
+    else:
+        df_corr = stats.period_corr(annees[0], annees[1])
+    return px.imshow(
+        df_corr,
+        text_auto=True,   # Affiche les coefficients dans la matrice
+        color_continuous_scale="RdBu_r",
+        title="Matrice de corrélation entre les indicateurs"
+    )
+
+# Seuls les widgets dont dépend la portée choisie entrent dans la clé du cache
+etat_matrice = {"portee": portee, "pays": pays if portee == "Pays choisi" else None,
+                "annees": annees if portee == "Période choisie" else None}
+fig_corr_matrix = cached_figure("EDA/correlations", etat_matrice, matrice_correlation)
+
+with profiling.span("graphique:envoi"):
+    st.plotly_chart(fig_corr_matrix, use_container_width=True)
+
+profiling.end_page()
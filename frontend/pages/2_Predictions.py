@@ -2,25 +2,21 @@
 # LIBRAIRIES
 # ===============================================
 import streamlit as st
-import pandas as pd
-import os
-import base64
-import numpy as np
-import plotly.express as px
+import time
 import plotly.graph_objects as go
+from plotly.colors import qualitative
 
-# Prophet : pour prévisions séries temporelles
-from prophet import Prophet
+from eduvision import models, profiling, remote
+from eduvision.data import dataset_version, load_dataset
+from eduvision.figures import cached_figure
+from eduvision.forecast_store import load_forecast, store_version
+from eduvision.layout import page_header
+from eduvision.models import HORIZON, MODEL_LABELS, TARGET
+from eduvision.models.base import country_series
 
-# Machine Learning classique
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
-
-# Deep Learning (réseaux de neurones récurrents)
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense
-from sklearn.preprocessing import MinMaxScaler
+# Les librairies de modèles (Prophet, scikit-learn, TensorFlow) ne sont
+# importées que par models.get(...), au moment où un modèle est réellement
+# entraîné : une prévision servie depuis le stock n'en charge aucune.
 
 # ===============================================
 # CONFIGURATION DE LA PAGE
@@ -30,247 +26,294 @@ st.set_page_config(
     page_icon="🌍",
     layout="wide"
 )
+profiling.start_page("Prévisions")
 
 # ===============================================
-# CSS GLOBAL + HEADER
+# EN-TÊTE + MENU
 # ===============================================
-st.markdown("""
-    <style>
-    .header {
-        display: flex;
-        align-items: center;
-        background-color: #ECF0F1;
-        padding: 15px 25px;
-        border-radius: 8px;
-        margin-bottom: 10px;
-    }
-    .logo {
-        width: 65px;
-        height: 65px;
-        border-radius: 50%;
-        margin-right: 20px;
-        object-fit: cover;
-    }
-    .main-title {
-        font-size: 28px;
-        font-weight: bold;
-        color: #1ABC9C;
-        margin: 0;
-    }
-    .subtitle {
-        font-size: 14px;
-        color: #2C3E50;
-        margin: 0;
-    }
-    .menu {
-        display: flex;
-        justify-content: center;
-        gap: 15px;
-        margin-top: 15px;
-    }
-    .menu a {
-        background-color: white;
-        color: #1ABC9C !important;
-        padding: 6px 14px;
-        border-radius: 6px;
-        font-weight: bold;
-        text-decoration: none;
-        border: 1px solid #1ABC9C;
-    }
-    .menu a:hover {
-        background-color: #16A085;
-        color: white !important;
-        transform: scale(1.05);
-    }
-    </style>
-""", unsafe_allow_html=True)
+page_header("Prévisions alphabétisation et développement")
 
 # ===============================================
-# LOGO EN BASE64
-# ===============================================
-logo_path = os.path.join(os.path.dirname(__file__), "..", "Images", "AfricaEduVision.png")
-
-def img_to_base64(path):
-    """Convertit le logo en base64 pour l’afficher dans le header."""
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
-
-logo_base64 = img_to_base64(logo_path)
-
-# ===============================================
-# HEADER AVEC LOGO + TITRE
+# CHARGEMENT DU DATASET
 # ===============================================
-st.markdown(f"""
-<div class="header">
-    <img src="data:image/png;base64,{logo_base64}" class="logo">
-    <div>
-        <p class="main-title">AfricaEduVision</p>
-        <p class="subtitle">Prévisions alphabétisation et développement</p>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+# Seules les colonnes utilisées par les modèles sont lues (cache partagé)
+df = load_dataset(["Country Name", "Year", "Literacy_Female_Adult",
+                   "GDP_per_capita", "Education_Expenditure", "Urban_Population",
+                   "Fertility_Rate", "Child_Marriage_Under18"])
+
+@st.cache_resource(show_spinner="Chargement du modèle Random Forest…")
+def foret_globale(version_donnees):
+    """Random Forest global, chargé (ou entraîné) une fois par version des données."""
+    return models.get("rf").fit(df)
+
+
+@st.cache_resource(show_spinner="Entraînement du LSTM commun à tous les pays…")
+def lstm_commun(version_donnees):
+    """Prévisions LSTM de tous les pays, calculées une fois par version des données."""
+    return models.get("lstm_panel").forecast_all(df)
+
+
+def prevision_directe(modele):
+    """
+    Fonction pays -> prévision s'appuyant sur un modèle global déjà en mémoire
+    (Random Forest, LSTM commun) ; ``None`` si le modèle s'entraîne pays par pays.
+    """
+    if modele == "rf":
+        # Modèle global : seule la prédiction dépend du pays choisi
+        foret = foret_globale(dataset_version())
+        return lambda pays: models.get("rf").predict(foret, df, pays)
+    if modele == "lstm_panel":
+        # Réseau commun : un entraînement sert ensuite tous les pays
+        previsions_lstm = lstm_commun(dataset_version())
+
+        def depuis_lstm(pays):
+            if pays not in previsions_lstm:
+                raise ValueError("Pas assez de données pour entraîner un LSTM.")
+            return previsions_lstm[pays]
+        return depuis_lstm
+    return None
+
+
+@st.cache_resource
+def previsions_calculees(version_stock):
+    """
+    Prévisions déjà entraînées ici, (modèle, pays) -> DataFrame, partagées entre sessions.
+
+    Indexées sur la version du stock (données et ``MODELS_VERSION``) : un
+    changement de modèle ou d'hyperparamètres repart de zéro.
+    """
+    return {}
+
+
+def prevision_en_direct(modele, pays):
+    """Prévision entraînée ici (modèle global en mémoire ou entraînement du pays), gardée en mémoire."""
+    memoire = previsions_calculees(store_version())
+    if (modele, pays) not in memoire:
+        predict = prevision_directe(modele)
+        memoire[(modele, pays)] = predict(pays) if predict is not None else models.forecast(modele, df, pays)
+    return memoire[(modele, pays)]
+
+# Provenance « entraînement en direct » dans les clés de figures : change avec les données et les modèles
+SOURCE_DIRECTE = f"direct-{store_version()}"
 
 # ===============================================
-# MENU
+# SELECTION UTILISATEUR
 # ===============================================
-st.markdown("""
-<div class="menu">
-    <a href="/"> Accueil</a>
-    <a href="/EDA"> Analyse exploratoire</a>
-    <a href="/Predictions"> Prévisions</a>
-    <a href="/Comparaison"> Comparaisons</a>
-    <a href="/Methodologie"> Méthodologie</a>
-    <a href="/Conclusion"> Conclusion</a>
-</div>
-""", unsafe_allow_html=True)
+liste_pays = sorted(df["Country Name"].unique())
+affichage = st.radio(" Affichage :", ["Un pays", "Plusieurs pays"], horizontal=True)
+
+# Pays choisi(s)
+if affichage == "Un pays":
+    pays = st.selectbox(" Choisissez un pays :", liste_pays)
+else:
+    selection = st.multiselect(" Choisissez des pays :", liste_pays, default=liste_pays[:3], max_selections=8)
+
+# Type de modèle à utiliser (le LSTM commun est un mode du LSTM, choisi ci-dessous)
+familles = {label: cle for cle, label in MODEL_LABELS.items() if cle != "lstm_panel"}
+modele = familles[st.radio(" Choisissez un modèle :", list(familles))]
+if modele == "lstm":
+    modes_lstm = {"Un réseau par pays": "lstm", "Réseau commun à tous les pays (panel)": "lstm_panel"}
+    modele = modes_lstm[st.radio(" Entraînement du LSTM :", list(modes_lstm), horizontal=True)]
+nom_modele = MODEL_LABELS[modele].split(" (")[0]
 
 # ===============================================
-# CHARGEMENT DU DATASET
+# PLUSIEURS PAYS : PRÉVISIONS CALCULÉES EN UN LOT ET SUPERPOSÉES
 # ===============================================
-data_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "Africa_Education_Development_Top30_ClusterImputed.csv")
-df = pd.read_csv(os.path.abspath(data_path))
+if affichage == "Plusieurs pays":
+    st.subheader(f" Prévisions {nom_modele} : comparaison de pays")
+    if not selection:
+        st.info("Choisissez au moins un pays.")
+        profiling.stop_page()
+
+    debut = time.perf_counter()
+    previsions, durees, sources, provenances = {}, {}, {}, {}
+    if remote.enabled():
+        # Mode distant : une requête par pays, envoyées en parallèle
+        try:
+            with st.spinner("Prévisions demandées à l'API…"):
+                previsions, durees = remote.forecasts(modele, selection)
+        except remote.RemoteError as exc:
+            st.error(str(exc))
+            profiling.stop_page()
+        sources = dict.fromkeys(selection, f"distant-{store_version()}")
+        provenances = dict.fromkeys(selection, "API")
+    else:
+        # Stock précalculé, puis prévisions déjà entraînées ici, puis le reste en un lot
+        memoire = previsions_calculees(store_version())
+        for p in selection:
+            t = time.perf_counter()
+            prevision = load_forecast(modele, p)
+            if prevision is not None:
+                previsions[p], sources[p], provenances[p] = prevision, store_version(), "stock"
+            elif (modele, p) in memoire:
+                previsions[p], sources[p], provenances[p] = memoire[(modele, p)], SOURCE_DIRECTE, "mémoire"
+            else:
+                continue
+            durees[p] = (time.perf_counter() - t) * 1000
+
+        manquants = [p for p in selection if p not in previsions]
+        if manquants:
+            with st.spinner(f"Entraînement de {nom_modele} pour {len(manquants)} pays…"):
+                predict = prevision_directe(modele)
+                calculees, durees_calcul = models.forecast_many(modele, df, manquants, predict=predict)
+            # Modèle global en mémoire : threads ; sinon le pool déclaré pour le modèle
+            pool = "thread" if predict is not None else models.FORECASTERS[modele].pool
+            for p, prevision in calculees.items():
+                if not isinstance(prevision, str):
+                    memoire[(modele, p)] = prevision
+                previsions[p], sources[p], durees[p] = prevision, SOURCE_DIRECTE, durees_calcul[p]
+                provenances[p] = f"calcul ({pool})"
+    duree_totale = (time.perf_counter() - debut) * 1000
+
+    refuses = {p: message for p, message in previsions.items() if isinstance(message, str)}
+    for p, message in refuses.items():
+        st.warning(f"{p} : {message}")
+    affiches = [p for p in selection if p not in refuses]
+
+    def graphique_comparaison():
+        fig = go.Figure()
+        couleurs = qualitative.Plotly
+        for i, p in enumerate(affiches):
+            couleur = couleurs[i % len(couleurs)]
+            historique = country_series(df, p)
+            fig.add_scatter(x=historique["Year"], y=historique[TARGET], mode="lines+markers",
+                            name=p, legendgroup=p, line=dict(color=couleur))
+            fig.add_scatter(x=previsions[p]["Year"], y=previsions[p]["yhat"], mode="lines",
+                            name=f"{p} (prévision)", legendgroup=p, line=dict(color=couleur, dash="dot"))
+        fig.update_layout(title=f"Prévisions {nom_modele} de l'alphabétisation des femmes jusqu'en {HORIZON}",
+                          xaxis_title="Année", yaxis_title="Taux d'alphabétisation (%)")
+        return fig
+
+    fig = cached_figure("Predictions/comparaison",
+                        {"modele": modele, "pays": affiches, "sources": [sources[p] for p in affiches]},
+                        graphique_comparaison)
+    with profiling.span("graphique:envoi"):
+        st.plotly_chart(fig, use_container_width=True)
+
+    with st.expander("Débogage : temps de calcul par pays"):
+        st.dataframe([{"Pays": p, "Provenance": provenances[p], "Durée (ms)": round(durees[p], 1)}
+                      for p in selection], hide_index=True)
+        st.caption(f"Temps total : {duree_totale:.0f} ms pour {len(selection)} pays.")
+    profiling.stop_page()
+
+st.subheader(f" Prévision avec {nom_modele}")
 
 # ===============================================
-# SELECTION UTILISATEUR
+# PRÉVISION : STOCK PRÉCALCULÉ OU ENTRAÎNEMENT EN DIRECT
 # ===============================================
-# Pays choisi
-pays = st.selectbox(" Choisissez un pays :", sorted(df["Country Name"].unique()))
-
-# Type de modèle à utiliser
-modele_type = st.radio(
-    " Choisissez un modèle :",
-    ["Prophet (Séries temporelles)", "Random Forest (Machine Learning)", "LSTM (Deep Learning)"]
-)
+# Le stock (python -m eduvision.forecast_store) est servi tant qu'il
+# correspond aux données actuelles ; sinon on entraîne le modèle ici.
+# En mode distant (EDUVISION_API_URL), c'est l'API qui sert le stock ou entraîne.
+forecast = None if remote.enabled() else load_forecast(modele, pays)
+# Une prévision précalculée et une prévision en direct ne donnent pas la même figure
+source = store_version() if forecast is not None else SOURCE_DIRECTE
+if remote.enabled():
+    try:
+        with st.spinner("Prévision demandée à l'API…"):
+            forecast, source_api = remote.forecast(modele, pays)
+    except ValueError as exc:
+        st.warning(str(exc))
+        profiling.stop_page()
+    except remote.RemoteError as exc:
+        st.error(str(exc))
+        profiling.stop_page()
+    source = f"distant-{source_api}-{store_version()}"
+    st.caption(f"Prévision servie par l'API {remote.api_url()} ({source_api}).")
+elif forecast is not None:
+    st.caption(f"Prévision précalculée (stock {store_version()}).")
+else:
+    # Entraînement seulement si la figure n'est pas déjà en cache (voir graphique_prevision)
+    st.caption("Stock de prévisions absent ou périmé : entraînement du modèle en direct.")
 
 # ===============================================
-# MODELE 1 : PROPHET
+# GRAPHIQUE : HISTORIQUE + PRÉVISIONS + INTERVALLE
 # ===============================================
-if modele_type == "Prophet (Séries temporelles)":
-    st.subheader(" Prévision avec Prophet")
-
-    # Filtrer données pour le pays choisi
-    df_pays = df[df["Country Name"] == pays][["Year", "Literacy_Female_Adult"]].dropna()
-
-    # Adapter au format Prophet (colonnes ds = date, y = valeur)
-    df_prophet = df_pays.rename(columns={"Year": "ds", "Literacy_Female_Adult": "y"})
-    df_prophet["ds"] = pd.to_datetime(df_prophet["ds"], format="%Y")
-
-    # Entraîner le modèle
-    model = Prophet()
-    model.fit(df_prophet)
-
-    # Générer prévisions futures jusqu’en 2030
-    future = model.make_future_dataframe(periods=8, freq="Y")
-    forecast = model.predict(future)
-
-    # Graphique
-    fig = px.line(forecast, x="ds", y="yhat",
-                  title=f"Prévision alphabétisation femmes adultes ({pays})")
-    fig.add_scatter(x=df_prophet["ds"], y=df_prophet["y"], mode="markers", name="Historique")
+df_pays = country_series(df, pays)
+
+def graphique_prevision():
+    prevision = forecast if forecast is not None else prevision_en_direct(modele, pays)
+    fig = go.Figure()
+    # Intervalle de prévision (zone entre borne basse et borne haute)
+    fig.add_scatter(x=prevision["Year"], y=prevision["yhat_upper"], mode="lines",
+                    line=dict(width=0), showlegend=False, hoverinfo="skip")
+    fig.add_scatter(x=prevision["Year"], y=prevision["yhat_lower"], mode="lines",
+                    line=dict(width=0), fill="tonexty", fillcolor="rgba(255, 0, 0, 0.15)",
+                    name="Intervalle de prévision")
+    fig.add_scatter(x=df_pays["Year"], y=df_pays[TARGET],
+                    mode="lines+markers", name="Historique", line=dict(color="blue"))
+    fig.add_scatter(x=prevision["Year"], y=prevision["yhat"],
+                    mode="lines+markers", name=f"Prévisions {nom_modele}", line=dict(color="red", dash="dot"))
+    fig.update_layout(title=f"Prévisions alphabétisation femmes ({pays}) jusqu'en {HORIZON}",
+                      xaxis_title="Année", yaxis_title="Taux d'alphabétisation (%)")
+    return fig
+
+try:
+    fig = cached_figure("Predictions/prevision", {"modele": modele, "pays": pays, "source": source},
+                        graphique_prevision)
+except ValueError as exc:
+    st.warning(str(exc))
+    profiling.stop_page()
+with profiling.span("graphique:envoi"):
     st.plotly_chart(fig, use_container_width=True)
 
-# ===============================================
-# MODELE 2 : RANDOM FOREST (ML)
-# ===============================================
-elif modele_type == "Random Forest (Machine Learning)":
-    st.subheader(" Prévision avec Random Forest")
-
-    # Variables explicatives (facteurs socio-éco)
-    X = df[["GDP_per_capita", "Education_Expenditure", "Urban_Population",
-            "Fertility_Rate", "Child_Marriage_Under18"]]
-    y = df["Literacy_Female_Adult"]
-
-    # Nettoyer les valeurs manquantes
-    X = X.fillna(X.median())
-    y = y.fillna(y.median())
-
-    # Entraîner le modèle sur tout le dataset (global)
-    rf = RandomForestRegressor(n_estimators=200, random_state=42)
-    rf.fit(X, y)
-
-    # Récupérer données du pays choisi
-    df_pays = df[df["Country Name"] == pays].copy()
-    last_year = int(df_pays["Year"].max())
-
-    # Créer données futures (scénarios simples d’évolution)
-    future_years = list(range(last_year + 1, 2031))
-    future_data = pd.DataFrame({
-        "Year": future_years,
-        "GDP_per_capita": df_pays["GDP_per_capita"].iloc[-1] * (1.05 ** np.arange(1, len(future_years)+1)),
-        "Education_Expenditure": df_pays["Education_Expenditure"].iloc[-1] * (1.03 ** np.arange(1, len(future_years)+1)),
-        "Urban_Population": df_pays["Urban_Population"].iloc[-1] * (1.02 ** np.arange(1, len(future_years)+1)),
-        "Fertility_Rate": df_pays["Fertility_Rate"].iloc[-1] * (0.98 ** np.arange(1, len(future_years)+1)),
-        "Child_Marriage_Under18": df_pays["Child_Marriage_Under18"].iloc[-1] * (0.99 ** np.arange(1, len(future_years)+1))
-    })
-
-    # Prédire sur ces données futures
-    X_future = future_data.drop(columns=["Year"])
-    y_future_pred = rf.predict(X_future)
-
-    # Graphique Historique + Prévisions
-    fig_rf = go.Figure()
-    fig_rf.add_scatter(x=df_pays["Year"], y=df_pays["Literacy_Female_Adult"],
-                       mode="lines+markers", name="Historique", line=dict(color="blue"))
-    fig_rf.add_scatter(x=future_data["Year"], y=y_future_pred,
-                       mode="lines+markers", name="Prévisions RF", line=dict(color="red", dash="dot"))
-    fig_rf.update_layout(title=f"Prévisions alphabétisation femmes ({pays}) jusqu'en 2030",
-                         xaxis_title="Année", yaxis_title="Taux d'alphabétisation (%)")
-    st.plotly_chart(fig_rf, use_container_width=True)
+calculee = None if forecast is not None else previsions_calculees(store_version()).get((modele, pays))
+if calculee is not None and "inference_ms" in calculee.attrs:
+    st.caption(f"Inférence LSTM compilée : {calculee.attrs['inference_ms']:.2f} ms par prévision "
+               f"(compilation du graphe : {calculee.attrs['trace_ms']:.0f} ms, une fois par processus).")
 
 # ===============================================
-# MODELE 3 : LSTM (Deep Learning)
+# SCÉNARIOS « WHAT-IF » (RANDOM FOREST)
 # ===============================================
-elif modele_type == "LSTM (Deep Learning)":
-    st.subheader(" Prévision avec LSTM")
-
-    # Filtrer données pays
-    df_pays = df[df["Country Name"] == pays][["Year", "Literacy_Female_Adult"]].dropna()
-
-    if len(df_pays) < 10:
-        st.warning("Pas assez de données pour entraîner un LSTM.")
-    else:
-        # Normalisation des valeurs
-        data = df_pays["Literacy_Female_Adult"].values.reshape(-1, 1)
-        scaler = MinMaxScaler(feature_range=(0, 1))
-        scaled_data = scaler.fit_transform(data)
-
-        # Création des séquences (fenêtre de 3 ans)
-        X, y_seq = [], []
-        for i in range(3, len(scaled_data)):
-            X.append(scaled_data[i-3:i, 0])
-            y_seq.append(scaled_data[i, 0])
-        X, y_seq = np.array(X), np.array(y_seq)
-        X = np.reshape(X, (X.shape[0], X.shape[1], 1))
-
-        # Modèle LSTM
-        model = Sequential()
-        model.add(LSTM(50, return_sequences=True, input_shape=(X.shape[1], 1)))
-        model.add(LSTM(50))
-        model.add(Dense(1))
-        model.compile(optimizer="adam", loss="mean_squared_error")
-        model.fit(X, y_seq, epochs=50, batch_size=1, verbose=0)
-
-        # Prévisions futures jusqu’en 2030
-        last_sequence = scaled_data[-3:]
-        predictions = []
-        for _ in range(2030 - int(df_pays["Year"].max())):
-            X_pred = np.reshape(last_sequence, (1, last_sequence.shape[0], 1))
-            pred = model.predict(X_pred, verbose=0)
-            predictions.append(pred[0, 0])
-            last_sequence = np.vstack((last_sequence[1:], pred))
-
-        # Inverser la normalisation
-        y_future_pred = scaler.inverse_transform(np.array(predictions).reshape(-1, 1))
-
-        # Années futures
-        future_years = list(range(int(df_pays["Year"].max())+1, 2031))
-
-        # Graphique
-        fig_dl = go.Figure()
-        fig_dl.add_scatter(x=df_pays["Year"], y=df_pays["Literacy_Female_Adult"],
+if modele == "rf" and remote.enabled():
+    st.markdown("---")
+    st.info("Scénarios « what-if » indisponibles en mode distant : ils exigent le Random Forest "
+            "en mémoire (relancer l'application sans EDUVISION_API_URL).")
+elif modele == "rf":
+    from eduvision.models import scenarios   # import à la demande (scikit-learn)
+    random_forest = models.get("rf")
+
+    st.markdown("---")
+    st.subheader(" Explorer des scénarios d'évolution")
+    st.write("Taux de croissance annuels moyens des facteurs ; chaque tirage Monte Carlo "
+             "les perturbe autour de ces valeurs, et toutes les trajectoires sont prédites en un seul appel.")
+
+    colonnes = st.columns(len(random_forest.FEATURES))
+    taux_moyens = {}
+    for colonne, facteur in zip(colonnes, random_forest.FEATURES):
+        with colonne:
+            taux = st.slider(facteur, -10.0, 10.0, round((random_forest.GROWTH[facteur] - 1) * 100, 1),
+                             step=0.5, format="%.1f %%", key=f"taux_{facteur}")
+            taux_moyens[facteur] = 1 + taux / 100
+
+    incertitude = st.slider("Incertitude sur les taux (écart-type, points de %)", 0.0, 5.0, 1.0, step=0.5)
+    tirages = st.select_slider("Nombre de scénarios", options=[100, 500, 1000, 5000], value=1000)
+
+    def graphique_scenarios():
+        grille = scenarios.monte_carlo(tirages, mean=taux_moyens, sd=incertitude / 100)
+        predictions, pays_scenarios, annees = scenarios.project(
+            foret_globale(dataset_version()), df, grille, countries=[pays])
+        eventail = scenarios.fan_chart(predictions, pays_scenarios, annees)
+
+        fig_sc = go.Figure()
+        for bas, haut, opacite, nom in [("q05", "q95", 0.15, "5e–95e centile"),
+                                        ("q25", "q75", 0.3, "25e–75e centile")]:
+            fig_sc.add_scatter(x=eventail["Year"], y=eventail[haut], mode="lines",
+                               line=dict(width=0), showlegend=False, hoverinfo="skip")
+            fig_sc.add_scatter(x=eventail["Year"], y=eventail[bas], mode="lines", line=dict(width=0),
+                               fill="tonexty", fillcolor=f"rgba(255, 0, 0, {opacite})", name=nom)
+        fig_sc.add_scatter(x=df_pays["Year"], y=df_pays[TARGET],
                            mode="lines+markers", name="Historique", line=dict(color="blue"))
-        fig_dl.add_scatter(x=future_years, y=y_future_pred.flatten(),
-                           mode="lines+markers", name="Prévisions LSTM", line=dict(color="red", dash="dot"))
-        fig_dl.update_layout(title=f"Prévisions alphabétisation femmes ({pays}) jusqu'en 2030",
+        fig_sc.add_scatter(x=eventail["Year"], y=eventail["q50"],
+                           mode="lines+markers", name="Médiane des scénarios", line=dict(color="red", dash="dot"))
+        fig_sc.update_layout(title=f"Éventail de {tirages} scénarios ({pays}) jusqu'en {HORIZON}",
                              xaxis_title="Année", yaxis_title="Taux d'alphabétisation (%)")
-        st.plotly_chart(fig_dl, use_container_width=True)
+        return fig_sc
+
+    # Les tirages sont déterministes (graine fixe) : même état des curseurs, même éventail
+    fig_sc = cached_figure("Predictions/scenarios",
+                           {"pays": pays, "taux": taux_moyens, "incertitude": incertitude, "tirages": tirages},
+                           graphique_scenarios)
+    with profiling.span("graphique:envoi"):
+        st.plotly_chart(fig_sc, use_container_width=True)
+
+profiling.end_page()
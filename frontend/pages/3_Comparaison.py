@@ -2,12 +2,15 @@
 # LIBRAIRIES
 # ===============================================
 import streamlit as st
-import pandas as pd
-import os
-import base64
 import plotly.express as px
 import plotly.graph_objects as go
 
+from eduvision import profiling, remote
+from eduvision.animation import animation_figure
+from eduvision.figures import cached_figure
+from eduvision.layout import page_header
+from eduvision.panel import load_panel
+
 # ===============================================
 # CONFIGURATION DE LA PAGE
 # ===============================================
@@ -16,108 +19,22 @@ st.set_page_config(
     page_icon="🌍",
     layout="wide"
 )
+profiling.start_page("Comparaison")
 
 # ===============================================
-# CSS GLOBAL
-# ===============================================
-st.markdown("""
-    <style>
-    /* Masquer la sidebar par défaut */
-    [data-testid="stSidebarNav"] {display: none;}
-    [data-testid="stSidebar"] {display: none;}
-
-    /* Header (logo + titre) */
-    .header {
-        display: flex;
-        align-items: center;
-        background-color: #ECF0F1;
-        padding: 15px 25px;
-        border-radius: 8px;
-        margin-bottom: 10px;
-    }
-    .logo {
-        width: 65px;
-        height: 65px;
-        border-radius: 50%;
-        margin-right: 20px;
-        object-fit: cover;
-    }
-    .main-title {
-        font-size: 28px;
-        font-weight: bold;
-        color: #1ABC9C;
-        margin: 0;
-    }
-    .subtitle {
-        font-size: 14px;
-        color: #2C3E50;
-        margin: 0;
-    }
-    /* Menu */
-    .menu {
-        display: flex;
-        justify-content: center;
-        gap: 15px;
-        margin-top: 15px;
-    }
-    .menu a {
-        background-color: white;
-        color: #1ABC9C !important;
-        padding: 6px 14px;
-        border-radius: 6px;
-        font-weight: bold;
-        text-decoration: none;
-        border: 1px solid #1ABC9C;
-    }
-    .menu a:hover {
-        background-color: #16A085;
-        color: white !important;
-        transform: scale(1.05);
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# ===============================================
-# LOGO EN BASE64
-# ===============================================
-logo_path = os.path.join(os.path.dirname(__file__), "..", "Images", "AfricaEduVision.png")
-
-def img_to_base64(path):
-    """Convertit l’image du logo en base64 pour l’intégrer dans le header."""
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
-
-logo_base64 = img_to_base64(logo_path)
-
-# ===============================================
-# HEADER + MENU
-# ===============================================
-st.markdown(f"""
-<div class="header">
-    <img src="data:image/png;base64,{logo_base64}" class="logo">
-    <div>
-        <p class="main-title">AfricaEduVision</p>
-        <p class="subtitle">Comparaisons multi-pays</p>
-    </div>
-</div>
-""", unsafe_allow_html=True)
-
-st.markdown("""
-<div class="menu">
-    <a href="/"> Accueil</a>
-    <a href="/EDA"> Analyse exploratoire</a>
-    <a href="/Predictions"> Prévisions</a>
-    <a href="/Comparaisons"> Comparaisons</a>
-    <a href="/Methodologie"> Méthodologie</a>
-    <a href="/Conclusion"> Conclusion</a>
-</div>
-""", unsafe_allow_html=True)
+# EN-TÊTE + MENU
+# ===============================================
+page_header("Comparaisons multi-pays", hide_sidebar=True)
 
 # ===============================================
 # CHARGEMENT DU DATASET
 # ===============================================
-data_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "Africa_Education_Development_Top30_ClusterImputed.csv")
-df = pd.read_csv(os.path.abspath(data_path))
+# Seules les colonnes comparées sont lues (cache partagé) puis indexées par pays/année
+colonnes = ["Country Name", "Year",
+            "Literacy_Female_Adult", "Literacy_Male_Adult",
+            "Literacy_Female_Youth", "Literacy_Male_Youth",
+            "Fertility_Rate", "Child_Marriage_Under18", "GDP_per_capita"]
+TOP_PAYS = 30   # Barres au plus dans le classement ; au-delà, une seule boîte pour tous les pays
 
 # ===============================================
 # INDICATEURS DISPONIBLES
@@ -132,6 +49,25 @@ indicateurs = {
     "PIB par habitant": "GDP_per_capita"
 }
 
+@st.cache_data(ttl=300, show_spinner=False)   # Même durée que le Cache-Control de l'API
+def donnees_distantes(url):
+    return remote.dataset()
+
+
+# En mode distant (EDUVISION_API_URL), classements et animation viennent de
+# l'API : le dataset n'est pas lu ici, les figures sont indexées par la
+# version des données de l'API
+version = None
+if remote.enabled():
+    try:
+        annees, version = donnees_distantes(remote.api_url())
+    except remote.RemoteError as exc:
+        st.error(str(exc))
+        profiling.stop_page()
+else:
+    panel = load_panel(colonnes)   # Lignes d'une année = tranche contiguë, sans parcours du tableau
+    annees = panel.years
+
 st.title(" Comparaisons multi-pays")
 
 # ===============================================
@@ -140,42 +76,55 @@ st.title(" Comparaisons multi-pays")
 st.subheader(" Classement des pays par indicateur")
 
 # Sélecteurs pour année + indicateur
-annee_bar = st.selectbox("Choisissez une année :", sorted(df["Year"].unique()))
+annee_bar = st.selectbox("Choisissez une année :", annees)
 indic_bar = st.selectbox("Choisissez un indicateur :", list(indicateurs.keys()))
 
-# Filtrer et trier les données
 colonne_bar = indicateurs[indic_bar]
-df_bar = df[df["Year"] == annee_bar].sort_values(by=colonne_bar, ascending=False)
-
-# Bar chart
-fig_bar = px.bar(
-    df_bar,
-    x="Country Name",
-    y=colonne_bar,
-    title=f"{indic_bar} en {annee_bar} (Top 30 pays)",
-    labels={"Country Name": "Pays", colonne_bar: indic_bar}
-)
-st.plotly_chart(fig_bar, use_container_width=True)
+zone_bar = st.empty()   # Rempli une fois les données des deux graphiques obtenues
 
 # ===============================================
 # 2️ BOXPLOT (DISTRIBUTION)
 # ===============================================
 st.subheader(" Distribution par indicateur")
 
-annee_box = st.selectbox("Année pour le boxplot :", sorted(df["Year"].unique()), key="box")
+annee_box = st.selectbox("Année pour le boxplot :", annees, key="box")
 indic_box = st.selectbox("Indicateur :", list(indicateurs.keys()), key="box2")
 
 col_box = indicateurs[indic_box]
-df_box = df[df["Year"] == annee_box]
 
-fig_box = px.box(
-    df_box,
+# Filtrer et trier les données : en local par tranche d'année, en mode
+# distant (EDUVISION_API_URL) par deux requêtes /compare envoyées en parallèle
+if remote.enabled():
+    try:
+        df_bar, df_box = remote.rankings([(annee_bar, colonne_bar), (annee_box, col_box)])
+    except (ValueError, remote.RemoteError) as exc:
+        st.error(str(exc))
+        profiling.stop_page()
+else:
+    df_bar = panel.year(annee_bar).sort_values(by=colonne_bar, ascending=False)
+    df_box = panel.year(annee_box)
+df_bar = df_bar.head(TOP_PAYS)   # Panel agrandi (continent, synthétique) : les premiers seulement
+
+# Bar chart
+fig_bar = cached_figure("Comparaison/classement", {"annee": annee_bar, "indicateur": colonne_bar}, lambda: px.bar(
+    df_bar,
     x="Country Name",
+    y=colonne_bar,
+    title=f"{indic_bar} en {annee_bar} (Top {len(df_bar)} pays)",
+    labels={"Country Name": "Pays", colonne_bar: indic_bar}
+), version)
+with profiling.span("graphique:envoi"):
+    zone_bar.plotly_chart(fig_bar, use_container_width=True)
+
+fig_box = cached_figure("Comparaison/distribution", {"annee": annee_box, "indicateur": col_box}, lambda: px.box(
+    df_box,
+    x="Country Name" if len(df_box) <= TOP_PAYS else None,
     y=col_box,
     title=f"Distribution de {indic_box} par pays ({annee_box})",
     labels={"Country Name": "Pays", col_box: indic_box}
-)
-st.plotly_chart(fig_box, use_container_width=True)
+), version)
+with profiling.span("graphique:envoi"):
+    st.plotly_chart(fig_box, use_container_width=True)
 
 # ===============================================
 # 3️ ANIMATION TEMPORELLE (STYLE GAPMINDER)
@@ -185,18 +134,19 @@ st.subheader(" Animation temporelle (style Gapminder)")
 x_indic = st.selectbox("Axe X :", list(indicateurs.keys()), key="animx")
 y_indic = st.selectbox("Axe Y :", list(indicateurs.keys()), key="animy")
 
-fig_anim = px.scatter(
-    df,
-    x=indicateurs[x_indic],
-    y=indicateurs[y_indic],
-    animation_frame="Year",            # animation par année
-    animation_group="Country Name",    # chaque pays = une trajectoire
-    size="GDP_per_capita",             # taille des bulles
-    color="Country Name",              # couleur par pays
-    hover_name="Country Name",         # affichage au survol
-    log_x=False,
-    size_max=60,
-    labels={indicateurs[x_indic]: x_indic, indicateurs[y_indic]: y_indic}
+pas = st.select_slider("Une image toutes les ... années :", options=[1, 2, 3], value=1)
+
+# Figure construite une seule fois par paire d'axes et partagée entre sessions
+# (en mode distant, à partir des lignes envoyées par l'API)
+fig_anim = animation_figure(
+    indicateurs[x_indic],
+    indicateurs[y_indic],
+    labels={indicateurs[x_indic]: x_indic, indicateurs[y_indic]: y_indic},
+    pas=pas,
+    title=f"Évolution temporelle : {y_indic} vs {x_indic}",
+    version=version,
 )
-fig_anim.update_layout(title=f"Évolution temporelle : {y_indic} vs {x_indic}")
-st.plotly_chart(fig_anim, use_container_width=True)
+with profiling.span("graphique:envoi"):
+    st.plotly_chart(fig_anim, use_container_width=True)
+
+profiling.end_page()
@@ -1,117 +1,24 @@
 import streamlit as st
 import pandas as pd
-import os
-import base64
 
-st.set_page_config(page_title="Méthodologie - AfricaEduVision", page_icon="🌍", layout="wide")
-
-# =========================
-# CSS GLOBAL
-# =========================
-st.markdown("""
-    <style>
-    [data-testid="stSidebarNav"] {display: none;}
-    [data-testid="stSidebar"] {display: none;}
-
-    .header {
-        display: flex;
-        align-items: center;
-        background-color: #ECF0F1;
-        padding: 15px 25px;
-        border-radius: 8px;
-        margin-bottom: 10px;
-    }
-    .logo {
-        width: 65px;
-        height: 65px;
-        border-radius: 50%;
-        margin-right: 20px;
-        object-fit: cover;
-    }
-    .main-title {
-        font-size: 28px;
-        font-weight: bold;
-        color: #1ABC9C;
-        margin: 0;
-    }
-    .subtitle {
-        font-size: 14px;
-        color: #2C3E50;
-        margin: 0;
-    }
-    .menu {
-        display: flex;
-        justify-content: center;
-        gap: 15px;
-        margin-top: 15px;
-    }
-    .menu a {
-        background-color: white;
-        color: #1ABC9C !important;
-        padding: 6px 14px;
-        border-radius: 6px;
-        font-weight: bold;
-        text-decoration: none;
-        border: 1px solid #1ABC9C;
-    }
-    .menu a:hover {
-        background-color: #16A085;
-        color: white !important;
-        transform: scale(1.05);
-    }
-    .section {
-        margin-top: 30px;
-        margin-bottom: 20px;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# =========================
-# Charger et convertir le logo en base64
-# =========================
-logo_path = os.path.join(os.path.dirname(__file__), "..", "Images", "AfricaEduVision.png")
-
-def img_to_base64(path):
-    with open(path, "rb") as f:
-        data = f.read()
-    return base64.b64encode(data).decode()
+from eduvision.data import load_dataset
+from eduvision import profiling
+from eduvision.layout import page_header
 
-logo_base64 = img_to_base64(logo_path)
-
-# =========================
-# HEADER
-# =========================
-st.markdown(f"""
-<div class="header">
-    <img src="data:image/png;base64,{logo_base64}" class="logo">
-    <div>
-        <p class="main-title">AfricaEduVision</p>
-        <p class="subtitle">Méthodologie du projet</p>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+st.set_page_config(page_title="Méthodologie - AfricaEduVision", page_icon="🌍", layout="wide")
+profiling.start_page("Méthodologie")
 
 # =========================
-# MENU
+# EN-TÊTE + MENU
 # =========================
-st.markdown("""
-<div class="menu">
-    <a href="/"> Accueil</a>
-    <a href="/EDA"> Analyse exploratoire</a>
-    <a href="/Predictions"> Prévisions</a>
-    <a href="/Comparaisons"> Comparaisons</a>
-    <a href="/Methodologie"> Méthodologie</a>
-    <a href="/Conclusion"> Conclusion</a>
-</div>
-""", unsafe_allow_html=True)
+page_header("Méthodologie du projet", hide_sidebar=True)
 
 # =========================
 # DATASET INFO
 # =========================
 st.title(" Méthodologie du projet")
 
-data_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "Africa_Education_Development_Top30_ClusterImputed.csv")
-df = pd.read_csv(os.path.abspath(data_path))
+df = load_dataset()   # Dataset typé, lu une seule fois par processus (cache partagé)
 
 st.subheader(" Informations sur le dataset")
 st.write(f"- Nombre de lignes : **{df.shape[0]}**")
@@ -207,4 +114,9 @@ st.subheader("  Liste des pays inclus dans l’étude")
 pays = sorted(df["Country Name"].unique())
 st.write(f"Nombre de pays : **{len(pays)}**")
 df_pays = pd.DataFrame(pays, columns=["Pays inclus"])
-st.table(df_pays)
+if len(pays) <= 60:
+    st.table(df_pays)
+else:
+    st.dataframe(df_pays, hide_index=True)   # Panel agrandi : tableau défilant
+
+profiling.end_page()
@@ -0,0 +1,6 @@
+"""
+Chaîne de préparation des données d'AfricaEduVision (hors application).
+
+Les étapes, lancées depuis le dossier ``frontend`` avec ``python -m``,
+reprennent sous forme de modules les traitements des notebooks.
+"""
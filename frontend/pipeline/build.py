@@ -0,0 +1,306 @@
+# ===============================================
+# CHAÎNE DE CONSTRUCTION INCRÉMENTALE DES DATASETS
+# ===============================================
+"""
+Reconstruit les datasets dérivés sans rejouer tout le notebook ``EDA.ipynb``.
+
+Trois étapes, chacune lisant la sortie de la précédente :
+
+- ``final`` : ``Africa_Education_Development.csv`` interpolé par pays puis
+  limité aux années ``FIRST_YEAR``–dernière année publiée (dernière année du
+  fichier brut avec au moins une valeur, sauf ``--years``) ;
+- ``top30`` : les 30 pays ayant le moins de valeurs manquantes ;
+- ``cluster_imputed`` : clustering K-Means des pays et imputation par la
+  médiane du cluster (:mod:`pipeline.imputation`).
+
+``--all-countries`` garde tous les pays du fichier brut au lieu des 30 plus
+complets : les sorties ``*_All*.csv`` (manifeste ``manifest_all.json``) ne
+remplacent pas celles du Top 30 ; l'application les utilise avec
+``EDUVISION_DATASET=Africa_Education_Development_All_ClusterImputed.csv``.
+
+Le résumé statistique du dataset final (:mod:`eduvision.summary`, lu par la
+page d'accueil) est écrit pour chaque nouvelle version du fichier imputé.
+Une sortie dont le contenu n'a pas changé n'est pas réécrite : sa date de
+modification, sur laquelle reposent les caches de l'application, est conservée.
+
+Pour chaque étape, ``data/pipeline/manifest.json`` enregistre l'empreinte de
+chaque partition (pays, indicateur) de son entrée. Au passage suivant, seules
+les partitions dont l'empreinte a changé sont recalculées ; le reste est repris
+du fichier déjà produit. Un nouvel indicateur ne recalcule que sa colonne ;
+une nouvelle année touche toutes les séries qui la contiennent, et la
+fenêtre d'années (qui suit les données) ne fait pas partie des paramètres :
+si elle change, seule l'étape ``final`` est recalculée en entier, les étapes
+suivantes ne reprennent que les partitions modifiées. Le K-Means
+(30 pays) est toujours relancé, mais seules les médianes des clusters dont la
+composition ou les données ont changé sont recalculées.
+
+Utilisation (depuis le dossier ``frontend``, après ``python -m pipeline.ingest``) ::
+
+    python -m pipeline.build
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from eduvision.data import DATA_DIR
+from eduvision.summary import file_stamp, summary_path, write_summary
+from pipeline.imputation import cluster_countries, impute, indicator_columns, interpolate_by_country
+
+MANIFEST_PATH = DATA_DIR / "pipeline" / "manifest.json"
+# À incrémenter si le calcul d'une étape change (invalide tout le manifeste)
+PIPELINE_VERSION = 1
+
+RAW_FILE = "Africa_Education_Development.csv"
+FINAL_FILE = "Africa_Education_Development_Final.csv"
+TOP30_FILE = "Africa_Education_Development_Top30.csv"
+MISSING_FILE = "Top30_Countries_MissingValues.csv"
+IMPUTED_FILE = "Africa_Education_Development_Top30_ClusterImputed.csv"
+
+# Mode « tout le continent » : mêmes étapes, tous les pays conservés
+MANIFEST_ALL_PATH = DATA_DIR / "pipeline" / "manifest_all.json"
+ALL_FILE = "Africa_Education_Development_All.csv"
+ALL_MISSING_FILE = "All_Countries_MissingValues.csv"
+ALL_IMPUTED_FILE = "Africa_Education_Development_All_ClusterImputed.csv"
+
+FIRST_YEAR = 2006   # Fin de la fenêtre : dernière année publiée (voir last_year)
+TOP_N = 30
+N_CLUSTERS = 4
+
+
+# ===============================================
+# EMPREINTES PAR PARTITION (PAYS, INDICATEUR)
+# ===============================================
+def partition_hashes(df, indicators):
+    """
+    Empreinte de chaque série (pays, indicateur) : DataFrame pays × indicateurs.
+
+    Chaque ligne (année, valeur) est hachée puis les hachages sont additionnés
+    par pays : le résultat ne dépend pas de l'ordre des lignes.
+    """
+    hashes = {}
+    for col in indicators:
+        rows = pd.util.hash_pandas_object(df[["Year", col]], index=False).to_numpy()
+        hashes[col] = pd.Series(rows).groupby(df["Country Name"].to_numpy()).sum()
+    return pd.DataFrame(hashes).map(lambda h: f"{h:016x}")
+
+
+def changed_partitions(hashes, previous):
+    """Masque (pays × indicateurs) des partitions nouvelles ou modifiées."""
+    if not previous:
+        return pd.DataFrame(True, index=hashes.index, columns=hashes.columns)
+    old = pd.DataFrame(previous).T.reindex(index=hashes.index, columns=hashes.columns)
+    return hashes != old
+
+
+def _rectangle(changed):
+    """Pays et indicateurs touchés par au moins une partition modifiée."""
+    return changed.index[changed.any(axis=1)].tolist(), changed.columns[changed.any(axis=0)].tolist()
+
+
+def _previous(path, stage_state, keys):
+    """
+    (sortie précédente indexée par ``keys``, état du manifeste) de l'étape.
+
+    Sans manifeste ou sans fichier, l'étape repart de zéro : ``(None, {})``.
+    """
+    if not stage_state or not path.exists():
+        return None, {}
+    # round_trip : relecture exacte des flottants écrits au passage précédent
+    return pd.read_csv(path, float_precision="round_trip").set_index(keys), stage_state
+
+
+# ===============================================
+# ÉTAPES
+# ===============================================
+def last_year(raw):
+    """Dernière année du fichier brut avec au moins une valeur d'indicateur."""
+    published = raw[indicator_columns(raw)].notna().any(axis=1)
+    return int(raw.loc[published, "Year"].max())
+
+
+def stage_final(raw, previous, state, years):
+    """Interpolation linéaire par pays, puis filtre sur les années retenues."""
+    indicators = indicator_columns(raw)
+    hashes = partition_hashes(raw, indicators)
+    changed = changed_partitions(hashes, state.get("inputs"))
+    if state.get("years") != list(years):
+        # Fenêtre d'années déplacée : toutes les lignes de la sortie changent
+        changed[:] = True
+    pays, colonnes = _rectangle(changed)
+
+    raw = raw.sort_values(["Country Name", "Year"], kind="stable", ignore_index=True)
+    window = raw["Year"].between(*years)
+    result = raw.loc[window, ["Year", "Country Name", "Country Code"]].reset_index(drop=True)
+    keys = pd.MultiIndex.from_frame(result[["Country Name", "Year"]])
+    if previous is not None:
+        result[indicators] = previous.reindex(index=keys, columns=indicators).to_numpy()
+    else:
+        result[indicators] = np.nan
+
+    if pays and colonnes:
+        # L'interpolation utilise toute la série, y compris hors de la fenêtre d'années
+        sub = raw[raw["Country Name"].isin(pays)]
+        values = interpolate_by_country(sub, colonnes, dtype="float64")[sub["Year"].between(*years).to_numpy()]
+        rows = result["Country Name"].isin(pays).to_numpy()
+        result.loc[rows, colonnes] = values
+
+    result = result[["Year"] + indicators + ["Country Name", "Country Code"]]
+    new_state = {"inputs": hashes.T.to_dict(), "years": list(years)}
+    return result, new_state, int(changed.to_numpy().sum()), changed.size
+
+
+def stage_top30(final, state, top_n=TOP_N):
+    """Sélection des ``top_n`` pays les plus complets (part moyenne de NaN par indicateur)."""
+    indicators = indicator_columns(final)
+    hashes = partition_hashes(final, indicators)
+    changed = changed_partitions(hashes, state.get("inputs"))
+
+    # Part de NaN de chaque partition ; seules les partitions modifiées sont recomptées
+    missing = pd.DataFrame(state.get("missing", {})).T.reindex(index=hashes.index, columns=indicators)
+    pays, colonnes = _rectangle(changed)
+    if pays and colonnes:
+        sub = final[final["Country Name"].isin(pays)]
+        missing.loc[pays, colonnes] = sub[colonnes].isna().groupby(sub["Country Name"]).mean().loc[pays]
+
+    missing_pct = (missing.astype(float).mean(axis=1) * 100).nsmallest(top_n)
+    table = missing_pct.rename_axis("Country Name").reset_index(name="Missing_Percentage")
+    top30 = final[final["Country Name"].isin(missing_pct.index)].reset_index(drop=True)
+    new_state = {"inputs": hashes.T.to_dict(), "missing": missing.T.to_dict()}
+    return top30, table, new_state, int(changed.to_numpy().sum()), changed.size
+
+
+def stage_cluster_imputed(top30, previous, state, n_clusters=N_CLUSTERS):
+    """Clustering K-Means des pays puis imputation par la médiane du cluster."""
+    indicators = indicator_columns(top30)
+    hashes = partition_hashes(top30, indicators)
+    changed = changed_partitions(hashes, state.get("inputs"))
+    pays, colonnes = _rectangle(changed)
+    clusters = cluster_countries(top30, indicators, n_clusters=n_clusters)
+
+    # Clusters à recalculer : composition nouvelle, ou données modifiées pour un membre
+    anciens = {frozenset(members) for members in state.get("clusters", [])}
+    membres = clusters.groupby(clusters).groups
+    affected = {k: list(colonnes) for k, members in membres.items() if set(members) & set(pays)}
+    for k, members in membres.items():
+        if frozenset(members) not in anciens:
+            affected[k] = indicators
+
+    keys = pd.MultiIndex.from_frame(top30[["Country Name", "Year"]])
+    result = top30.copy()
+    if previous is not None:
+        result[indicators] = previous.reindex(index=keys, columns=indicators).to_numpy()
+    result["Cluster"] = top30["Country Name"].map(clusters).to_numpy()
+
+    for k, cols in affected.items():
+        rows = (result["Cluster"] == k).to_numpy()
+        imputed = impute(top30[rows], list(cols), clusters=clusters, dtype="float64")
+        result.loc[rows, list(cols)] = imputed[list(cols)].to_numpy()
+
+    new_state = {
+        "inputs": hashes.T.to_dict(),
+        "clusters": sorted(sorted(map(str, members)) for members in membres.values()),
+    }
+    recomputed = sum(len(cols) for cols in affected.values())
+    return result, new_state, int(changed.to_numpy().sum()), changed.size, recomputed
+
+
+# ===============================================
+# ORCHESTRATION
+# ===============================================
+def _write_csv(df, path):
+    """Écrit ``df`` sauf si ``path`` a déjà exactement ce contenu ; retourne ``True`` si le fichier a changé."""
+    content = df.to_csv(index=False).encode()
+    if path.exists() and path.read_bytes() == content:
+        return False   # Date de modification inchangée : les caches de l'application restent valides
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(content)
+    tmp.replace(path)
+    return True
+
+
+def build(data_dir=DATA_DIR, manifest_path=None, full=False, years=None,
+          top_n=TOP_N, n_clusters=N_CLUSTERS, all_countries=False, log=print):
+    """
+    Exécute les trois étapes ; ne recalcule que ce qui a changé depuis le dernier passage.
+
+    ``years`` (début, fin) vaut par défaut ``FIRST_YEAR`` jusqu'à la dernière
+    année publiée du fichier brut.
+
+    ``all_countries`` garde tous les pays (``top_n`` est ignoré) et écrit les
+    fichiers ``*_All*`` avec leur propre manifeste.
+    """
+    data_dir = Path(data_dir)
+    if all_countries:
+        selection_file, missing_file, imputed_file = ALL_FILE, ALL_MISSING_FILE, ALL_IMPUTED_FILE
+        manifest_path = manifest_path or MANIFEST_ALL_PATH
+        top_n = None
+    else:
+        selection_file, missing_file, imputed_file = TOP30_FILE, MISSING_FILE, IMPUTED_FILE
+        manifest_path = manifest_path or MANIFEST_PATH
+    params = {"version": PIPELINE_VERSION, "top_n": top_n, "n_clusters": n_clusters}
+    manifest = {}
+    if manifest_path.exists() and not full:
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("params") != params:
+            log(" Paramètres modifiés : reconstruction complète")
+            manifest = {}
+    stages = manifest.get("stages", {})
+    keys = ["Country Name", "Year"]
+
+    start = time.perf_counter()
+    raw = pd.read_csv(data_dir / RAW_FILE)
+    years = tuple(years) if years else (FIRST_YEAR, last_year(raw))
+    previous, state = _previous(data_dir / FINAL_FILE, stages.get("final"), keys)
+    final, stages["final"], n_changed, n_total = stage_final(raw, previous, state, years)
+    _write_csv(final, data_dir / FINAL_FILE)
+    log(f" final           : {years[0]}–{years[1]}, {n_changed}/{n_total} partitions recalculées "
+        f"({time.perf_counter() - start:.2f} s)")
+
+    start = time.perf_counter()
+    top_n = top_n or final["Country Name"].nunique()
+    top30, table, stages["top30"], n_changed, n_total = stage_top30(final, stages.get("top30", {}), top_n)
+    _write_csv(top30, data_dir / selection_file)
+    _write_csv(table, data_dir / missing_file)
+    log(f" top30           : {n_changed}/{n_total} partitions recalculées ({time.perf_counter() - start:.2f} s)")
+
+    start = time.perf_counter()
+    previous, state = _previous(data_dir / imputed_file, stages.get("cluster_imputed"), keys)
+    imputed, stages["cluster_imputed"], n_changed, n_total, recomputed = stage_cluster_imputed(
+        top30, previous, state, n_clusters)
+    _write_csv(imputed, data_dir / imputed_file)
+    log(f" cluster_imputed : {n_changed}/{n_total} partitions modifiées, "
+        f"{recomputed} médianes (cluster, indicateur) recalculées ({time.perf_counter() - start:.2f} s)")
+
+    start = time.perf_counter()
+    stamp = file_stamp(data_dir / imputed_file)
+    path = summary_path(stamp, data_dir)
+    if not path.exists():
+        write_summary(imputed, stamp, data_dir)
+    log(f" résumé          : {path.relative_to(data_dir)} ({time.perf_counter() - start:.2f} s)")
+
+    # Le manifeste n'est enregistré qu'une fois toutes les sorties écrites
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps({"params": params, "stages": stages}, ensure_ascii=False))
+    return imputed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reconstruit Final, Top30 et ClusterImputed de façon incrémentale.")
+    parser.add_argument("--full", action="store_true", help="Ignore le manifeste et recalcule tout")
+    parser.add_argument("--years", type=int, nargs=2, metavar=("DEBUT", "FIN"),
+                        help=f"Fenêtre d'années (par défaut : {FIRST_YEAR} à la dernière année publiée)")
+    parser.add_argument("--top", type=int, default=TOP_N)
+    parser.add_argument("--clusters", type=int, default=N_CLUSTERS)
+    parser.add_argument("--all-countries", action="store_true",
+                        help="Garde tous les pays (fichiers *_All*, le Top 30 n'est pas modifié)")
+    args = parser.parse_args(argv)
+    build(full=args.full, years=args.years, top_n=args.top, n_clusters=args.clusters,
+          all_countries=args.all_countries)
+
+
+if __name__ == "__main__":
+    main()
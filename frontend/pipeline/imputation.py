@@ -0,0 +1,161 @@
+# ===============================================
+# IMPUTATION PAR CLUSTER DE PAYS
+# ===============================================
+"""
+Imputation des valeurs manquantes (reprise de la fin de ``EDA.ipynb``).
+
+Les pays sont regroupés par K-Means sur leur profil moyen (indicateurs
+standardisés), puis chaque valeur manquante est remplacée par la médiane de
+l'indicateur dans le cluster du pays.
+
+Au lieu d'une boucle ``for col in indicators`` (un groupby par colonne, après
+un ``merge`` qui recopie le tableau), toutes les médianes sont calculées en
+un seul groupby et appliquées en place sur un bloc NumPy float32.
+
+Deux stratégies :
+
+- ``cluster_median`` : médiane du cluster uniquement (comportement du notebook) ;
+- ``interpolate_cluster_median`` : interpolation linéaire dans la série de
+  chaque pays, puis médiane du cluster pour ce qui reste manquant.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m pipeline.imputation --strategy cluster_median
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+
+from eduvision.data import DATA_DIR, ID_COLUMNS
+
+STRATEGIES = ("cluster_median", "interpolate_cluster_median")
+N_CLUSTERS = 4
+
+INPUT_FILE = "Africa_Education_Development_Top30.csv"
+OUTPUT_FILE = "Africa_Education_Development_Top30_ClusterImputed.csv"
+
+
+def indicator_columns(df):
+    """Colonnes numériques (tous les indicateurs)."""
+    return [col for col in df.columns if col not in ID_COLUMNS + ["Year", "Cluster"]]
+
+
+def cluster_profiles(profiles, n_clusters=N_CLUSTERS, random_state=42):
+    """Cluster K-Means de chaque ligne de ``profiles`` (une entité, ses indicateurs moyens)."""
+    # Un indicateur jamais renseigné pour une entité prend la moyenne des autres
+    profiles = profiles.fillna(profiles.mean())
+
+    X_scaled = StandardScaler().fit_transform(profiles)
+    kmeans = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)
+    return pd.Series(kmeans.fit_predict(X_scaled), index=profiles.index, name="Cluster")
+
+
+def cluster_countries(df, indicators, n_clusters=N_CLUSTERS, random_state=42):
+    """Cluster K-Means de chaque pays, calculé sur ses caractéristiques moyennes normalisées."""
+    country_profiles = df.groupby("Country Name", observed=True)[indicators].mean()
+    return cluster_profiles(country_profiles, n_clusters, random_state)
+
+
+def _interpolate_columns(block):
+    """
+    Interpolation linéaire de chaque colonne de ``block`` (années, séries).
+
+    Même règle que ``DataFrame.interpolate(method="linear")`` : les trous
+    intérieurs sont interpolés, les dernières années reprennent la dernière
+    valeur connue, les premières années restent manquantes.
+    """
+    n = block.shape[0]
+    valid = ~np.isnan(block)
+    rows = np.arange(n)[:, None]
+    # Dernière et prochaine année renseignées de chaque cellule
+    prev = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+    nxt = np.minimum.accumulate(np.where(valid, rows, n)[::-1], axis=0)[::-1]
+
+    cols = np.arange(block.shape[1])[None, :]
+    known = prev >= 0
+    prev_c = np.where(known, prev, 0)
+    nxt_c = np.where(nxt < n, nxt, prev_c)
+    y0, y1 = block[prev_c, cols], block[nxt_c, cols]
+    span = np.where(nxt_c > prev_c, nxt_c - prev_c, 1)
+    # Même ordre d'opérations que np.interp (résultats identiques à pandas)
+    filled = (y1 - y0) / span * (rows - prev_c) + y0
+    return np.where(valid, block, np.where(known, filled, np.nan)).astype(block.dtype)
+
+
+def interpolate_by_country(df, indicators, dtype="float32", key="Country Name"):
+    """
+    Interpolation linéaire de chaque série (pays, indicateur), en une passe.
+
+    Les valeurs sont rangées dans un tableau (année, pays × indicateur) et
+    toutes les séries sont interpolées à la fois, sans qu'un pays déborde sur
+    le suivant. Retourne le bloc (lignes, indicateurs) dans l'ordre de ``df``.
+    ``key`` désigne la colonne des séries (``"Region"`` pour un panel régional).
+    """
+    country_idx, countries = pd.factorize(df[key])
+    year_idx, years = pd.factorize(df["Year"], sort=True)
+
+    cube = np.full((len(years), len(countries), len(indicators)), np.nan, dtype=dtype)
+    cube[year_idx, country_idx] = df[indicators].to_numpy(dtype=dtype)
+    cube = _interpolate_columns(cube.reshape(len(years), -1)).reshape(cube.shape)
+    return cube[year_idx, country_idx]
+
+
+def impute(df, indicators=None, strategy="cluster_median", clusters=None, dtype="float32"):
+    """
+    Retourne une copie de ``df`` imputée, avec une colonne ``Cluster``.
+
+    ``clusters`` (pays -> cluster) peut être fourni pour réutiliser un
+    clustering existant ; sinon il est recalculé par K-Means.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Stratégie inconnue : {strategy} (attendu : {', '.join(STRATEGIES)})")
+    indicators = indicators or indicator_columns(df)
+    if clusters is None:
+        clusters = cluster_countries(df, indicators)
+
+    # Bloc de travail (lignes, indicateurs), modifié en place
+    if strategy == "interpolate_cluster_median":
+        values = interpolate_by_country(df, indicators, dtype)
+    else:
+        values = df[indicators].to_numpy(dtype=dtype, copy=True)
+
+    # Une seule passe : médiane de chaque indicateur dans chaque cluster
+    cluster_of_row = df["Country Name"].map(clusters).to_numpy()
+    medians = pd.DataFrame(values).groupby(cluster_of_row).median()
+    fill = medians.reindex(cluster_of_row).to_numpy(dtype=dtype)
+    missing = np.isnan(values)
+    values[missing] = fill[missing]
+
+    result = df.copy()
+    result[indicators] = values
+    result["Cluster"] = cluster_of_row
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Imputation des valeurs manquantes par cluster de pays.")
+    parser.add_argument("--input", type=Path, default=DATA_DIR / INPUT_FILE)
+    parser.add_argument("--output", type=Path, default=DATA_DIR / OUTPUT_FILE)
+    parser.add_argument("--strategy", choices=STRATEGIES, default="cluster_median")
+    parser.add_argument("--clusters", type=int, default=N_CLUSTERS)
+    # float64 par défaut : la sortie par défaut est le fichier livré, reproduit à l'octet près
+    parser.add_argument("--dtype", choices=["float32", "float64"], default="float64",
+                        help="Précision du bloc imputé (float32 : bloc deux fois plus petit, valeurs arrondies)")
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.input)
+    indicators = indicator_columns(df)
+    clusters = cluster_countries(df, indicators, n_clusters=args.clusters)
+    result = impute(df, indicators, args.strategy, clusters, args.dtype)
+
+    print("Valeurs manquantes restantes :", int(result[indicators].isna().sum().sum()))
+    result.to_csv(args.output, index=False)
+    print(f"Dataset imputé par cluster sauvegardé : {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+# ===============================================
+# INGESTION DES INDICATEURS DE LA BANQUE MONDIALE
+# ===============================================
+"""
+Téléchargement incrémental des indicateurs (reprise de ``RecuperationDonnee.ipynb``).
+
+- Les indicateurs sont téléchargés en parallèle (pool de threads).
+- Chaque zip brut est écrit directement sur disque dans ``data/raw`` ; son
+  ETag et son empreinte sha256 sont conservés dans ``data/raw/cache.json``.
+  Un indicateur inchangé (réponse 304 ou même empreinte) n'est ni relu ni
+  retraité.
+- Le fichier ``API_*.csv`` est lu en flux depuis le zip sur disque : l'archive
+  n'est jamais chargée en mémoire.
+- Seules les cellules (pays, année) encore vides de chaque indicateur dans
+  ``Africa_Education_Development.csv`` sont remplies (sauf ``--full-refresh``) :
+  nouvelles années et valeurs publiées en retard ; un nouvel indicateur est
+  ajouté en entier.
+- L'empreinte d'un zip n'est enregistrée qu'une fois relu sans erreur : un
+  zip illisible est retenté au passage suivant.
+
+Hors ligne, ``--source-dir`` lit des zips locaux ``<code>.zip`` (mêmes
+fichiers que ceux de la Banque mondiale) au lieu de l'API.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m pipeline.ingest --workers 8
+"""
+import argparse
+import hashlib
+import json
+import shutil
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import requests
+
+from eduvision.data import DATA_DIR
+
+RAW_DIR = DATA_DIR / "raw"
+CACHE_FILE = "cache.json"
+OUTPUT_FILE = "Africa_Education_Development.csv"
+URL = "http://api.worldbank.org/v2/en/indicator/{code}?downloadformat=csv"
+
+FIRST_YEAR = 2000   # Pas de borne haute : les années nouvellement publiées sont ajoutées
+CHUNK_SIZE = 1 << 16
+
+INDICATORS = {
+    "Literacy_Female_Adult": "SE.ADT.LITR.FE.ZS",
+    "Literacy_Male_Adult": "SE.ADT.LITR.MA.ZS",
+    "Literacy_Female_Youth": "SE.ADT.1524.LT.FE.ZS",
+    "Literacy_Male_Youth": "SE.ADT.1524.LT.MA.ZS",
+    "GDP_per_capita": "NY.GDP.PCAP.KD",
+    "Education_Expenditure": "SE.XPD.TOTL.GD.ZS",
+    "Urban_Population": "SP.URB.TOTL.IN.ZS",
+    "Poverty": "SI.POV.DDAY",
+    "Child_Marriage_Under18": "SP.M18.2024.FE.ZS",
+    "Child_Marriage_Under15": "SP.M15.2024.FE.ZS",
+    "Net_Migration": "SM.POP.NETM",
+    "Net_Migration_Percent": "SM.POP.NETM.ZS",
+    "Fertility_Rate": "SP.DYN.TFRT.IN",
+}
+
+# Liste simplifiée de pays africains
+AFRICAN_COUNTRIES = [
+    "DZA", "AGO", "BEN", "BWA", "BFA", "BDI", "CMR", "CPV", "CAF", "TCD", "COM", "COG", "CIV",
+    "COD", "DJI", "EGY", "GNQ", "ERI", "SWZ", "ETH", "GAB", "GMB", "GHA", "GIN", "GNB", "KEN",
+    "LSO", "LBR", "LBY", "MDG", "MWI", "MLI", "MRT", "MUS", "MAR", "MOZ", "NAM", "NER", "NGA",
+    "RWA", "STP", "SEN", "SYC", "SLE", "ZAF", "SSD", "SDN", "TZA", "TGO", "TUN", "UGA", "ZMB", "ZWE",
+]
+
+
+# ===============================================
+# TÉLÉCHARGEMENT AVEC CACHE
+# ===============================================
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def fetch(code, previous, raw_dir=RAW_DIR, source_dir=None, timeout=60):
+    """
+    Met à jour le zip brut de l'indicateur ``code``.
+
+    ``previous`` est l'entrée du cache (etag, sha256) du dernier passage.
+    Retourne ``(entrée du cache, changé ?)`` ; le zip est écrit en flux dans
+    un fichier temporaire puis renommé.
+    """
+    target = raw_dir / f"{code}.zip"
+    tmp = target.with_suffix(".part")
+    etag = None
+
+    if source_dir is not None:
+        shutil.copyfile(Path(source_dir) / f"{code}.zip", tmp)
+    else:
+        headers = {}
+        if previous.get("etag") and target.exists():
+            headers["If-None-Match"] = previous["etag"]
+        with requests.get(URL.format(code=code), headers=headers, stream=True, timeout=timeout) as r:
+            if r.status_code == 304:
+                return previous, False
+            r.raise_for_status()
+            etag = r.headers.get("ETag")
+            with open(tmp, "wb") as f:
+                for chunk in r.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+
+    checksum = _sha256(tmp)
+    entry = {"etag": etag, "sha256": checksum}
+    if checksum == previous.get("sha256") and target.exists():
+        tmp.unlink()
+        return entry, False
+    tmp.replace(target)
+    return entry, True
+
+
+# ===============================================
+# LECTURE EN FLUX DU CSV CONTENU DANS LE ZIP
+# ===============================================
+def read_indicator(zip_path, colname, countries=AFRICAN_COUNTRIES):
+    """Lit ``API_*.csv`` en flux depuis le zip et renvoie le format long filtré sur l'Afrique."""
+    with zipfile.ZipFile(zip_path) as z:
+        # Le fichier principal commence par "API_"
+        data_file = next(name for name in z.namelist() if name.startswith("API_"))
+        with z.open(data_file) as member:
+            df = pd.read_csv(member, header=2)
+
+    df = df[df["Country Code"].isin(countries)]
+    df = df.drop(columns=["Indicator Name", "Indicator Code"], errors="ignore")
+    df = df.loc[:, ~df.columns.str.startswith("Unnamed")]
+
+    # Transformer les colonnes années en lignes (melt)
+    df = df.melt(id_vars=["Country Name", "Country Code"], var_name="Year", value_name=colname)
+    df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
+    df = df[df["Year"] >= FIRST_YEAR]
+    return df.astype({"Year": "int64"})
+
+
+# ===============================================
+# MISE À JOUR INCRÉMENTALE
+# ===============================================
+KEYS = ["Country Name", "Country Code", "Year"]
+
+
+def merge_incremental(existing, updates, full_refresh=False):
+    """
+    Intègre les indicateurs relus (``{colonne: format long}``) au dataset existant.
+
+    Pour un indicateur déjà présent, seules les cellules (pays, année) encore
+    vides sont remplies : années nouvelles, mais aussi valeurs publiées en
+    retard pour une année que d'autres indicateurs couvrent déjà. Les valeurs
+    existantes ne sont pas modifiées (toutes sont reprises si
+    ``full_refresh``). Un nouvel indicateur est ajouté sur toutes les années.
+    """
+    if existing is None or existing.empty:
+        full_refresh = True
+        existing = pd.DataFrame(columns=KEYS)
+    existing = existing.astype({"Year": "int64"})
+
+    result = existing.set_index(KEYS)
+    for colname, long in updates.items():
+        values = long.set_index(KEYS)[colname]
+        # Ajoute les lignes (pays, année) nouvelles puis remplit la colonne
+        result = result.reindex(result.index.union(values.index))
+        if colname not in result.columns:
+            result[colname] = float("nan")
+        elif not full_refresh:
+            values = values[result.loc[values.index, colname].isna().to_numpy()]
+        result.loc[values.index, colname] = values
+
+    return result.reset_index().sort_values(["Country Name", "Year"], ignore_index=True)
+
+
+def ingest(indicators=INDICATORS, data_dir=DATA_DIR, source_dir=None, workers=8, full_refresh=False,
+           log=print):
+    """Télécharge les indicateurs modifiés et met à jour le CSV brut ; retourne la liste des colonnes mises à jour."""
+    raw_dir = Path(data_dir) / RAW_DIR.name
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = raw_dir / CACHE_FILE
+    cache = json.loads(cache_path.read_text()) if cache_path.exists() else {}
+
+    def task(item):
+        colname, code = item
+        try:
+            entry, changed = fetch(code, cache.get(code, {}), raw_dir, source_dir)
+        except (requests.RequestException, OSError) as exc:
+            log(f" Indicateur {code} ({colname}) introuvable ou indisponible : {exc}")
+            return colname, code, None, False
+        return colname, code, entry, changed
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(task, indicators.items()))
+
+    updates = {}
+    for colname, code, entry, changed in results:
+        if entry is None:
+            continue
+        if not changed and not full_refresh:
+            cache[code] = entry
+            log(f" {colname} inchangé, ignoré")
+            continue
+        try:
+            updates[colname] = read_indicator(raw_dir / f"{code}.zip", colname)
+        except (zipfile.BadZipFile, zlib.error, EOFError, StopIteration, KeyError, ValueError) as exc:
+            # Empreinte non enregistrée : le zip sera relu au prochain passage
+            log(f" Indicateur {code} ({colname}) illisible : {exc}")
+            continue
+        cache[code] = entry
+
+    output = Path(data_dir) / OUTPUT_FILE
+    if updates:
+        existing = pd.read_csv(output) if output.exists() else None
+        merged = merge_incremental(existing, updates, full_refresh)
+        tmp = output.with_suffix(".tmp")
+        merged.to_csv(tmp, index=False)
+        tmp.replace(output)
+        log(f" Dataset mis à jour : {output} {merged.shape}")
+
+    # Le cache n'est enregistré qu'une fois le CSV écrit
+    cache_path.write_text(json.dumps(cache, indent=2))
+    return sorted(updates)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Télécharge les indicateurs de la Banque mondiale.")
+    parser.add_argument("--source-dir", type=Path, help="Zips locaux <code>.zip à utiliser au lieu de l'API")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--full-refresh", action="store_true",
+                        help="Réintègre toutes les années de tous les indicateurs")
+    parser.add_argument("--indicators", nargs="+", choices=list(INDICATORS),
+                        help="Colonnes à mettre à jour (par défaut : toutes)")
+    args = parser.parse_args(argv)
+
+    indicators = {k: INDICATORS[k] for k in args.indicators} if args.indicators else INDICATORS
+    ingest(indicators, source_dir=args.source_dir, workers=args.workers, full_refresh=args.full_refresh)
+
+
+if __name__ == "__main__":
+    main()
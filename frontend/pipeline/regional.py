@@ -0,0 +1,232 @@
+# ===============================================
+# IMPUTATION PAR CLUSTER D'UN PANEL RÉGIONAL (HORS MÉMOIRE)
+# ===============================================
+"""
+Imputation par cluster (:mod:`pipeline.imputation`) d'un panel régional trop grand pour la mémoire.
+
+Même méthode qu'au niveau pays, les régions remplaçant les pays : K-Means
+sur le profil moyen de chaque région, puis médiane de l'indicateur dans le
+cluster pour chaque valeur manquante (``interpolate_cluster_median`` :
+interpolation de la série de chaque région d'abord). Le panel
+(:mod:`eduvision.regions`) est lu pays par pays, en plusieurs passes :
+
+1. profils moyens des régions (une ligne par région) et bornes de chaque
+   indicateur, puis K-Means des régions ;
+2. histogramme de chaque (cluster, indicateur) sur ``BINS`` classes ;
+3. la classe qui contient la médiane est à nouveau répartie sur ``BINS``
+   classes, jusqu'à ce qu'elle compte au plus ``BINS`` valeurs, recueillies
+   et triées : médiane exacte, identique à celle de pandas sur le tableau
+   complet (en général une seule passe) ;
+4. imputation et écriture du résultat, pays par pays.
+
+La mémoire reste bornée par un pays, les profils des régions et ``BINS``
+classes (ou valeurs) par rang médian, quelle que soit la taille du panel.
+
+Utilisation (depuis le dossier ``frontend`` ; le panel synthétique est d'abord
+généré dans ``../data/synthetic/``, qui n'est pas versionné) ::
+
+    python -m pipeline.synthetic --regions 1000 --missing 0.1
+    python -m pipeline.regional ../data/synthetic/regions_x1000.parquet --output regions_imputees.parquet
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from eduvision.data import REGION
+from eduvision.regions import indicator_columns, iter_countries, write_regions
+from pipeline.imputation import N_CLUSTERS, STRATEGIES, cluster_profiles, interpolate_by_country
+
+BINS = 4096   # Classes par (cluster, indicateur) pour localiser la médiane
+
+# État d'un rang médian pendant la recherche (voir RegionalImputer._medians)
+DONE, HISTOGRAM, COLLECT = 0, 1, 2
+
+
+def _values(chunk, indicators, strategy, dtype):
+    """Bloc (lignes, indicateurs) d'un pays, séries des régions interpolées si demandé."""
+    if strategy == "interpolate_cluster_median":
+        return interpolate_by_country(chunk, indicators, dtype, key=REGION)
+    return chunk[indicators].to_numpy(dtype=dtype, copy=True)
+
+
+class RegionalImputer:
+    """Imputation d'un fichier régional par passes successives (voir le module)."""
+
+    def __init__(self, path, strategy="cluster_median", n_clusters=N_CLUSTERS, dtype="float32", bins=BINS):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Stratégie inconnue : {strategy} (attendu : {', '.join(STRATEGIES)})")
+        self.path = path
+        self.strategy = strategy
+        self.n_clusters = n_clusters
+        self.dtype = dtype
+        self.bins = bins
+        self.indicators = None
+        self.clusters = None   # (pays, région) -> cluster
+        self.medians = None    # (cluster, indicateur)
+
+    def _chunks(self):
+        """``(pays, morceau, bloc de valeurs, cluster de chaque ligne)`` pour chaque pays."""
+        for pays, chunk in iter_countries(self.path):
+            values = _values(chunk, self.indicators, self.strategy, self.dtype)
+            clusters = chunk[REGION].map(self.clusters.loc[pays]).to_numpy(dtype="int64")
+            yield pays, chunk, values, clusters
+
+    def fit(self):
+        """Clusters des régions (passe 1) et médiane exacte de chaque (cluster, indicateur)."""
+        # Passe 1 : profils moyens des régions et bornes des indicateurs
+        profils, lows, highs = [], [], []
+        for pays, chunk in iter_countries(self.path):
+            self.indicators = self.indicators or indicator_columns(chunk.columns)
+            values = pd.DataFrame(_values(chunk, self.indicators, self.strategy, self.dtype),
+                                  columns=self.indicators)
+            profil = values.groupby(chunk[REGION].to_numpy()).mean()
+            profil.index = pd.MultiIndex.from_product([[pays], profil.index], names=["Country Name", REGION])
+            profils.append(profil)
+            lows.append(values.min())
+            highs.append(values.max())
+        self.clusters = cluster_profiles(pd.concat(profils), self.n_clusters)
+        low = pd.concat(lows, axis=1).min(axis=1).to_numpy(dtype="float64")
+        high = pd.concat(highs, axis=1).max(axis=1).to_numpy(dtype="float64")
+        high = np.where(high > low, high, low + 1)   # Indicateur constant : une seule classe utile
+
+        self.medians = self._medians(low, high).reshape(self.n_clusters, len(self.indicators))
+        return self
+
+    def _cell_values(self):
+        """
+        ``(cellule (cluster, indicateur), valeur en float64)`` des valeurs renseignées,
+        pays par pays et indicateur par indicateur (tableaux temporaires d'une colonne).
+        """
+        n_features = len(self.indicators)
+        for _, _, values, clusters in self._chunks():
+            for f in range(n_features):
+                column = values[:, f]
+                present = ~np.isnan(column)
+                yield clusters[present] * n_features + f, column[present].astype("float64")
+
+    def _medians(self, low, high):
+        """
+        Passes 2 et suivantes : médiane exacte de chaque cellule (cluster, indicateur).
+
+        Chaque rang médian (deux par cellule : ``(n - 1) // 2`` et ``n // 2``)
+        est suivi dans un intervalle de valeurs ``[a, b]``. Une passe répartit
+        les valeurs de l'intervalle sur ``bins`` classes (effectif, minimum et
+        maximum de chaque classe) ; l'intervalle devient les bornes observées
+        de la classe qui contient le rang. Dès qu'il reste au plus ``bins``
+        valeurs, la passe suivante les recueille et les trie. La mémoire est
+        bornée par le nombre de classes, pas par la taille du panel.
+        """
+        n_features = len(self.indicators)
+        n_targets = 2 * self.n_clusters * n_features   # Cible 2c + s : rang s de la cellule c
+        a = np.repeat(np.tile(low, self.n_clusters), 2)
+        b = np.repeat(np.tile(high, self.n_clusters), 2)
+        rang = np.zeros(n_targets, dtype="int64")
+        mode = np.full(n_targets, HISTOGRAM, dtype="int8")
+        found = np.full(n_targets, np.nan)
+        first = True
+
+        while (mode != DONE).any():
+            # Deux rangs d'une cellule au même intervalle : une seule répartition
+            follower = np.zeros(n_targets, dtype=bool)
+            follower[1::2] = (a[1::2] == a[::2]) & (b[1::2] == b[::2]) & (mode[1::2] == mode[::2])
+            scan = (mode != DONE) & ~follower
+            slot = np.full(n_targets, -1, dtype="int64")
+            slot[scan] = np.arange(scan.sum())
+            slot[1::2] = np.where(follower[1::2], slot[::2], slot[1::2])
+
+            n_slots = int(scan.sum())
+            counts = np.zeros(n_slots * self.bins, dtype="int64")
+            mins = np.full(n_slots * self.bins, np.inf)
+            maxs = np.full(n_slots * self.bins, -np.inf)
+            kept_slots, kept_values = [], []
+            for cells, values in self._cell_values():
+                for rank in (0, 1):
+                    if not scan[rank::2].any():
+                        continue   # Rangs tous répartis avec l'autre rang de leur cellule
+                    t = 2 * cells + rank
+                    inside = scan[t] & (values >= a[t]) & (values <= b[t])
+                    t, v = t[inside], values[inside]
+                    histogram = mode[t] == HISTOGRAM
+                    th, vh = t[histogram], v[histogram]
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        position = (vh - a[th]) / (b[th] - a[th]) * self.bins
+                    classe = np.clip(np.nan_to_num(position, nan=0.0), 0, self.bins - 1).astype("int64")
+                    keys = slot[th] * self.bins + classe
+                    counts += np.bincount(keys, minlength=len(counts))
+                    np.minimum.at(mins, keys, vh)
+                    np.maximum.at(maxs, keys, vh)
+                    kept_slots.append(slot[t[~histogram]])
+                    kept_values.append(v[~histogram])
+
+            # Rangs médians, connus après la première répartition de toutes les valeurs
+            counts, mins, maxs = (x.reshape(n_slots, self.bins) for x in (counts, mins, maxs))
+            if first:
+                n = counts[slot[::2]].sum(axis=1)
+                rang[::2], rang[1::2] = (n - 1) // 2, n // 2
+                mode[np.repeat(n == 0, 2)] = DONE
+                first = False
+
+            # Valeurs recueillies : triées par cible, la valeur cherchée est au rang restant
+            collect = np.flatnonzero(mode == COLLECT)
+            if len(collect):
+                kept_slots, kept_values = np.concatenate(kept_slots), np.concatenate(kept_values)
+                order = np.lexsort((kept_values, kept_slots))
+                kept_slots, kept_values = kept_slots[order], kept_values[order]
+                found[collect] = kept_values[np.searchsorted(kept_slots, slot[collect]) + rang[collect]]
+                mode[collect] = DONE
+
+            # Répartitions : classe du rang, puis intervalle resserré sur ses valeurs observées
+            refine = np.flatnonzero(mode == HISTOGRAM)
+            if len(refine):
+                cumul = counts[slot[refine]].cumsum(axis=1)
+                classe = (cumul <= rang[refine, None]).sum(axis=1)
+                rang[refine] -= np.where(classe > 0, cumul[np.arange(len(refine)), np.maximum(classe - 1, 0)], 0)
+                remaining = counts[slot[refine], classe]
+                a[refine], b[refine] = mins[slot[refine], classe], maxs[slot[refine], classe]
+                single = a[refine] == b[refine]
+                found[refine[single]] = a[refine[single]]
+                mode[refine] = np.where(single, DONE, np.where(remaining <= self.bins, COLLECT, HISTOGRAM))
+
+        # Moyenne des deux rangs dans le type du bloc, comme la médiane de pandas sur le tableau complet
+        return found.astype(self.dtype).reshape(-1, 2).mean(axis=1).astype("float64")
+
+    def transform(self):
+        """Dernière passe : morceaux imputés (un par pays), avec une colonne ``Cluster``."""
+        fill_all = self.medians.astype(self.dtype)
+        for _, chunk, values, clusters in self._chunks():
+            missing = np.isnan(values)
+            fill = fill_all[clusters]
+            values[missing] = fill[missing]
+            result = chunk.copy()
+            result[self.indicators] = values
+            result["Cluster"] = clusters
+            yield result
+
+
+def impute_regions(path, output, strategy="cluster_median", n_clusters=N_CLUSTERS, dtype="float32", log=print):
+    """Impute le panel régional ``path`` et écrit le résultat dans ``output`` ; retourne l'imputeur."""
+    start = time.perf_counter()
+    imputer = RegionalImputer(path, strategy, n_clusters, dtype).fit()
+    log(f" clusters et médianes : {len(imputer.clusters)} régions ({time.perf_counter() - start:.2f} s)")
+    start = time.perf_counter()
+    rows = write_regions(imputer.transform(), output)
+    log(f" imputation           : {rows} lignes écrites ({time.perf_counter() - start:.2f} s)")
+    return imputer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Imputation par cluster d'un panel régional, pays par pays.")
+    parser.add_argument("path", type=Path, help="Panel régional (Parquet écrit par eduvision.regions)")
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--strategy", choices=STRATEGIES, default="cluster_median")
+    parser.add_argument("--clusters", type=int, default=N_CLUSTERS)
+    parser.add_argument("--dtype", choices=["float32", "float64"], default="float32")
+    args = parser.parse_args(argv)
+    impute_regions(args.path, args.output, args.strategy, args.clusters, args.dtype)
+
+
+if __name__ == "__main__":
+    main()
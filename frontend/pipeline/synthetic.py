@@ -0,0 +1,165 @@
+# ===============================================
+# PANEL SYNTHÉTIQUE AGRANDI (TESTS DE MONTÉE EN CHARGE)
+# ===============================================
+"""
+Génère un panel au schéma du dataset de l'application, ``scale`` fois plus grand.
+
+Chaque pays du dataset de base est dupliqué en ``scale`` entités
+(« Kenya 0007 », code ``KEN0007``) ; l'entité 0 garde le nom et les valeurs
+du pays d'origine. Pour les autres, chaque série est :
+
+- décalée d'un facteur de niveau propre à l'entité et à l'indicateur
+  (log-normal, écart-type ``--level-sd``) ;
+- bruitée année par année (``--noise-sd``) ;
+- bornée à [0, 100] pour les indicateurs en pourcentage.
+
+Les années, les clusters et les corrélations entre indicateurs restent ceux
+des données réelles : les pages, les statistiques et les modèles se
+comportent comme sur un vrai panel plus grand. ``--extra-indicators``
+ajoute des colonnes ``Indicator_001``... (combinaisons bruitées des
+indicateurs réels) ; ``--missing`` efface une part des valeurs pour
+exercer l'imputation.
+
+Le panel est écrit en Parquet (types compacts de :func:`eduvision.data.apply_schema`).
+
+``--regions N`` produit plutôt un panel régional (:mod:`eduvision.regions`) :
+``N`` régions par pays, générées et écrites pays par pays, sans jamais tenir
+tout le panel en mémoire.
+
+Utilisation (depuis le dossier ``frontend``) ::
+
+    python -m pipeline.synthetic --scale 100
+    EDUVISION_DATASET=synthetic/panel_x100.parquet streamlit run Home.py
+    python -m pipeline.synthetic --regions 1000 --missing 0.1   # ../data/synthetic/regions_x1000.parquet
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from eduvision.data import DATA_DIR, REGION, apply_schema, load_dataset
+from eduvision.regions import write_regions
+from pipeline.imputation import indicator_columns
+
+SYNTHETIC_DIR = DATA_DIR / "synthetic"
+
+# Indicateurs exprimés en pourcentage (bornés à [0, 100])
+PERCENT = ["Literacy_Female_Adult", "Literacy_Male_Adult", "Literacy_Female_Youth", "Literacy_Male_Youth",
+           "Education_Expenditure", "Urban_Population", "Poverty",
+           "Child_Marriage_Under18", "Child_Marriage_Under15"]
+
+
+def generate(base, scale, level_sd=0.1, noise_sd=0.02, extra_indicators=0, missing=0.0, seed=0):
+    """Panel synthétique : ``scale`` entités par pays de ``base`` (même années, mêmes colonnes)."""
+    rng = np.random.default_rng(seed)
+    base = base.sort_values(["Country Name", "Year"], kind="stable", ignore_index=True)
+    indicators = indicator_columns(base)
+    country_codes, countries = pd.factorize(base["Country Name"].astype(str), sort=True)
+    iso = base.groupby(country_codes)["Country Code"].first().astype(str).to_numpy()
+    n, n_countries = len(base), len(countries)
+
+    # Entité e = copie k du pays c, avec e = k * n_countries + c ; lignes dans le même ordre
+    copies = np.repeat(np.arange(scale), n)
+    entities = copies * n_countries + np.tile(country_codes, scale)
+    values = np.tile(base[indicators].to_numpy(dtype="float64"), (scale, 1))
+    level = rng.lognormal(0.0, level_sd, (scale * n_countries, len(indicators)))
+    noise = rng.normal(1.0, noise_sd, values.shape)
+    original = copies == 0
+    values = np.where(original[:, None], values, values * level[entities] * noise)
+    bornes = [indicators.index(col) for col in PERCENT if col in indicators]
+    values[:, bornes] = np.clip(values[:, bornes], 0, 100)
+
+    names = [f"{pays} {k:04d}" if k else pays for k in range(scale) for pays in countries]
+    codes = [f"{code}{k:04d}" if k else code for k in range(scale) for code in iso]
+    df = pd.DataFrame(values, columns=indicators)
+    df.insert(0, "Year", np.tile(base["Year"].to_numpy(), scale))
+    df["Country Name"] = pd.Categorical.from_codes(entities, categories=names)
+    df["Country Code"] = pd.Categorical.from_codes(entities, categories=codes)
+    if "Cluster" in base:
+        df["Cluster"] = np.tile(base["Cluster"].to_numpy(), scale)
+
+    if extra_indicators:
+        # Combinaisons aléatoires des indicateurs réels standardisés, plus un bruit propre
+        z = (values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0)
+        weights = rng.normal(0.0, 1.0, (len(indicators), extra_indicators))
+        extra = np.nan_to_num(z) @ weights / np.sqrt(len(indicators)) + rng.normal(0.0, 0.5, (len(df), extra_indicators))
+        for j in range(extra_indicators):
+            df.insert(len(indicators) + 1 + j, f"Indicator_{j + 1:03d}", 50 + 10 * extra[:, j])
+
+    if missing:
+        colonnes = indicator_columns(df)
+        block = df[colonnes].to_numpy()
+        block[rng.random(block.shape) < missing] = np.nan
+        df[colonnes] = block
+    return df
+
+
+def generate_regions(base, n_regions, level_sd=0.2, noise_sd=0.03, missing=0.0, seed=0):
+    """Panel régional, pays par pays : un DataFrame de ``n_regions`` régions par pays de ``base``."""
+    rng = np.random.default_rng(seed)
+    indicators = indicator_columns(base)
+    bornes = [indicators.index(col) for col in PERCENT if col in indicators]
+    for pays, serie in base.groupby("Country Name", observed=True, sort=True):
+        serie = serie.sort_values("Year")
+        code = str(serie["Country Code"].iloc[0])
+        n_years = len(serie)
+        values = np.tile(serie[indicators].to_numpy(dtype="float64"), (n_regions, 1))
+        level = rng.lognormal(0.0, level_sd, (n_regions, len(indicators)))
+        values *= np.repeat(level, n_years, axis=0) * rng.normal(1.0, noise_sd, values.shape)
+        values[:, bornes] = np.clip(values[:, bornes], 0, 100)
+        if missing:
+            values[rng.random(values.shape) < missing] = np.nan
+
+        chunk = pd.DataFrame(values, columns=indicators)
+        chunk.insert(0, "Year", np.tile(serie["Year"].to_numpy(), n_regions))
+        chunk["Country Name"] = pays
+        chunk["Country Code"] = code
+        chunk[REGION] = np.repeat([f"{code}-{r:05d}" for r in range(n_regions)], n_years)
+        yield chunk
+
+
+def synthetic_path(scale, data_dir=DATA_DIR):
+    return data_dir / SYNTHETIC_DIR.name / f"panel_x{scale}.parquet"
+
+
+def regions_path(n_regions, data_dir=DATA_DIR):
+    return data_dir / SYNTHETIC_DIR.name / f"regions_x{n_regions}.parquet"
+
+
+def write_synthetic(df, path):
+    """Écrit le panel en Parquet, types compacts (écriture atomique)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    apply_schema(df).to_parquet(tmp, index=False)
+    tmp.replace(path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=10, help="Nombre d'entités par pays du dataset de base")
+    parser.add_argument("--regions", type=int, help="Panel régional : nombre de régions par pays")
+    parser.add_argument("--base", type=Path, help="Dataset de base (par défaut : dataset courant)")
+    parser.add_argument("--level-sd", type=float, default=0.1)
+    parser.add_argument("--noise-sd", type=float, default=0.02)
+    parser.add_argument("--extra-indicators", type=int, default=0)
+    parser.add_argument("--missing", type=float, default=0.0, help="Part des valeurs effacées (0 à 1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Fichier Parquet (par défaut : data/synthetic/panel_x<scale>.parquet)")
+    args = parser.parse_args(argv)
+
+    base = load_dataset(path=args.base)
+    if args.regions:
+        chunks = generate_regions(base, args.regions, missing=args.missing, seed=args.seed)
+        path = args.output or regions_path(args.regions)
+        rows = write_regions(chunks, path)
+        print(f"{rows} lignes, {args.regions} régions par pays : {path}")
+        return
+    df = generate(base, args.scale, args.level_sd, args.noise_sd, args.extra_indicators, args.missing, args.seed)
+    path = write_synthetic(df, args.output or synthetic_path(args.scale))
+    print(f"{len(df)} lignes, {df['Country Name'].nunique()} entités, {len(indicator_columns(df))} indicateurs : {path}")
+
+
+if __name__ == "__main__":
+    main()